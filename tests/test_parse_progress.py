@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Regression tests for tools/parse-progress.py incremental scans
+Run with: python -m pytest tests/ (or python -m unittest discover tests)
+"""
+
+import sys
+import tempfile
+import unittest
+import importlib.util
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / 'tools'
+sys.path.insert(0, str(TOOLS_DIR))
+
+# parse-progress.py is a script (hyphenated name), so load it by path
+_spec = importlib.util.spec_from_file_location('parse_progress', TOOLS_DIR / 'parse-progress.py')
+parse_progress = importlib.util.module_from_spec(_spec)
+sys.modules['parse_progress'] = parse_progress
+_spec.loader.exec_module(parse_progress)
+
+COMPLETE = '✅ Complete'.encode('utf-8')
+
+
+class AppendScanSplitCharacterTest(unittest.TestCase):
+    """A write that stops partway through a multibyte character is picked up once completed"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.progress_file = Path(self.tmp.name) / 'SHARED_PROGRESS.md'
+        self.progress_file.write_bytes(
+            b"# Project: Demo\n\n"
+            b"## 2025-01-01 10:00 - @backend-architect: First\n"
+            b"**Status**: " + COMPLETE[:2]
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def complete_write(self):
+        with open(self.progress_file, 'ab') as f:
+            f.write(COMPLETE[2:] + b"\n\n"
+                    b"## 2025-01-02 10:00 - @backend-architect: Second\n"
+                    b"**Status**: " + COMPLETE + b"\n")
+
+    def test_follower(self):
+        cursor = Path(self.tmp.name) / 'cursor.json'
+        parser = parse_progress.AgentProgressParser(str(self.progress_file))
+
+        metrics, _ = parse_progress.ProgressFollower(parser, str(cursor)).poll()
+        self.assertEqual(metrics.summary()['total_entries'], 1)
+
+        self.complete_write()
+        metrics, _ = parse_progress.ProgressFollower(parser, str(cursor)).poll()
+        self.assertEqual(metrics.summary()['by_status'], {'complete': 2})
+
+    def test_ingest(self):
+        parser = parse_progress.AgentProgressParser(str(self.progress_file))
+        with parse_progress.ProgressStore(str(Path(self.tmp.name) / 'progress.db')) as store:
+            parser.ingest(store)
+            self.complete_write()
+            parser.ingest(store)
+            statuses = [row[0] for row in store.conn.execute("SELECT status FROM entries ORDER BY byte_offset")]
+        self.assertEqual(statuses, ['complete', 'complete'])
+
+
+if __name__ == '__main__':
+    unittest.main()
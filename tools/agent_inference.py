@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Capability inference shared by capability discovery and summary generation
+Classifies specializations and technologies in a single pass over agent content
+"""
+
+import re
+from typing import Dict, List, Set, Tuple
+
+
+# Specialization -> terms that imply it (matched as whole words, case-insensitive)
+SPECIALIZATION_TERMS = {
+    'api_design': ['REST', 'GraphQL', 'gRPC', 'API design', 'API development'],
+    'database': ['database', 'SQL', 'NoSQL', 'PostgreSQL', 'MongoDB', 'Redis'],
+    'frontend': ['React', 'Vue', 'Angular', 'frontend', 'UI', 'user interface'],
+    'backend': ['backend', 'server', 'Node.js', 'Python', 'microservices'],
+    'security': ['security', 'authentication', 'authorization', 'encryption', 'OWASP'],
+    'performance': ['performance', 'optimization', 'caching', 'scalability'],
+    'testing': ['testing', 'QA', 'quality assurance', 'test automation'],
+    'devops': ['DevOps', 'CI/CD', 'deployment', 'infrastructure', 'Docker', 'Kubernetes'],
+    'ml_ai': ['machine learning', 'ML', 'AI', 'neural networks', 'NLP', 'computer vision'],
+    'data_engineering': ['data pipeline', 'ETL', 'data processing', 'Apache Spark'],
+}
+
+TECHNOLOGY_TERMS = [
+    'JavaScript', 'TypeScript', 'Python', 'Java', 'Go', 'Rust', 'Ruby',
+    'Node.js', 'React', 'Vue', 'Angular', 'Django', 'Flask', 'Express',
+    'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch',
+    'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
+    'REST', 'GraphQL', 'gRPC', 'WebSocket',
+    'Git', 'GitHub', 'GitLab', 'Jenkins', 'CircleCI'
+]
+
+# Summaries have always used a smaller vocabulary; kept so generated summaries don't change
+SUMMARY_SPECIALIZATION_TERMS = dict(
+    SPECIALIZATION_TERMS,
+    ml_ai=['machine learning', 'ML', 'AI', 'neural networks', 'NLP'],
+    data_engineering=['data pipeline', 'ETL', 'data processing'],
+)
+
+SUMMARY_TECHNOLOGY_TERMS = [
+    'JavaScript', 'TypeScript', 'Python', 'Java', 'Go', 'Rust',
+    'Node.js', 'React', 'Vue', 'Angular', 'Django', 'Flask',
+    'PostgreSQL', 'MySQL', 'MongoDB', 'Redis',
+    'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
+    'REST', 'GraphQL', 'gRPC',
+    'Git', 'GitHub'
+]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _trie_pattern(terms: List[str]) -> str:
+    """Build a regex alternation factored by common prefixes"""
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class CapabilityInferrer:
+    """
+    Single-pass classifier for specializations and technologies
+
+    All terms are compiled into one prefix-factored regex inside a
+    lookahead, so every word-boundary position is examined once and
+    overlapping terms are still seen. The result matches running one
+    `\\b(term|...)\\b` search per specialization and one `\\bterm\\b` search
+    per technology with re.IGNORECASE, but scans the content only once and
+    stops as soon as every requested label has been found.
+    """
+
+    def __init__(self, specialization_terms: Dict[str, List[str]], technology_terms: List[str]):
+        self.specializations = list(specialization_terms)
+        self.technologies = list(technology_terms)
+
+        # Casefolded term -> labels it implies ('spec:x' / 'tech:y')
+        self.term_labels: Dict[str, Set[str]] = {}
+        for spec, terms in specialization_terms.items():
+            for term in terms:
+                self.term_labels.setdefault(term.casefold(), set()).add(f'spec:{spec}')
+        for tech in technology_terms:
+            self.term_labels.setdefault(tech.casefold(), set()).add(f'tech:{tech}')
+
+        # The regex reports the longest term at a position; also credit shorter
+        # terms that are prefixes of it ending on a word boundary
+        for term in sorted(self.term_labels, key=len):
+            for other in self.term_labels:
+                if (len(other) < len(term) and term.startswith(other)
+                        and _is_word_char(other[-1]) != _is_word_char(term[len(other)])):
+                    self.term_labels[term] = self.term_labels[term] | self.term_labels[other]
+
+        self.pattern = re.compile(
+            r'\b(?=(' + _trie_pattern(sorted(self.term_labels)) + r')\b)',
+            re.IGNORECASE
+        )
+
+    def _labels_for(self, matched: str) -> Set[str]:
+        labels = self.term_labels.get(matched.casefold())
+        if labels is not None:
+            return labels
+
+        # Case-insensitive regex matching can differ from casefold() for rare characters
+        for term, term_labels in self.term_labels.items():
+            if re.fullmatch(re.escape(term), matched, re.IGNORECASE):
+                return term_labels
+        return set()
+
+    def infer(self, content: str, specializations: bool = True,
+              technologies: bool = True) -> Tuple[List[str], List[str]]:
+        """
+        Infer specializations and technologies from content
+
+        Returns:
+            (specializations, technologies) in their configured order
+        """
+        wanted = set()
+        if specializations:
+            wanted.update(f'spec:{spec}' for spec in self.specializations)
+        if technologies:
+            wanted.update(f'tech:{tech}' for tech in self.technologies)
+
+        found: Set[str] = set()
+        if wanted:
+            for match in self.pattern.finditer(content):
+                found |= self._labels_for(match.group(1))
+                if wanted <= found:
+                    break
+
+        return (
+            [spec for spec in self.specializations if f'spec:{spec}' in found] if specializations else [],
+            [tech for tech in self.technologies if f'tech:{tech}' in found] if technologies else []
+        )
+
+    def infer_specializations(self, content: str) -> List[str]:
+        """Infer specializations from content"""
+        return self.infer(content, technologies=False)[0]
+
+    def infer_technologies(self, content: str) -> List[str]:
+        """Infer technologies from content"""
+        return self.infer(content, specializations=False)[1]
+
+
+_inferrers: Dict[str, CapabilityInferrer] = {}
+
+
+def get_inferrer(vocabulary: str = 'discovery') -> CapabilityInferrer:
+    """
+    Return the shared inferrer for a vocabulary, compiling it on first use
+
+    Args:
+        vocabulary: 'discovery' (capability_discovery.py) or 'summary' (generate_summaries.py)
+    """
+    if vocabulary not in _inferrers:
+        if vocabulary == 'discovery':
+            _inferrers[vocabulary] = CapabilityInferrer(SPECIALIZATION_TERMS, TECHNOLOGY_TERMS)
+        elif vocabulary == 'summary':
+            _inferrers[vocabulary] = CapabilityInferrer(SUMMARY_SPECIALIZATION_TERMS, SUMMARY_TECHNOLOGY_TERMS)
+        else:
+            raise ValueError(f"Unknown inference vocabulary: {vocabulary}")
+    return _inferrers[vocabulary]
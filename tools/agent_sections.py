@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Markdown section index for agent definitions
+Locates the frontmatter, preamble and every heading's section by byte offset
+so individual sections can be loaded without the rest of the definition
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+from definition_bundle import FRONTMATTER_PATTERN
+
+
+FRONTMATTER_SECTION = 'frontmatter'
+PREAMBLE_SECTION = 'preamble'
+
+# Fence lines toggle code blocks (headings inside them are ignored); other matches are ATX headings
+LINE_PATTERN = re.compile(
+    rb'^(?:(?P<fence>```|~~~)[^\n]*|(?P<hashes>#{1,6})[ \t]+(?P<title>[^\n]*?)[ \t#]*)\r?$',
+    re.MULTILINE
+)
+
+
+@dataclass
+class AgentSection:
+    """A section of an agent definition"""
+    name: str
+    level: int   # Heading level; 0 for frontmatter and preamble
+    start: int   # Byte offsets into the UTF-8 definition; a heading's
+    end: int     # section runs until the next heading of the same or higher level
+    tokens: int
+
+    def to_dict(self) -> dict:
+        return {'name': self.name, 'level': self.level, 'tokens': self.tokens}
+
+
+def index_sections(data: bytes) -> List[AgentSection]:
+    """
+    Index the sections of a definition
+
+    Args:
+        data: UTF-8 definition (bytes, mmap or memoryview)
+
+    Returns:
+        Sections in document order; nested headings appear after their parent
+    """
+    data = bytes(data)
+    sections: List[AgentSection] = []
+
+    def add(name: str, level: int, start: int, end: int = len(data)) -> AgentSection:
+        section = AgentSection(name, level, start, end, 0)
+        sections.append(section)
+        return section
+
+    body_start = 0
+    match = FRONTMATTER_PATTERN.search(data)
+    if match:
+        add(FRONTMATTER_SECTION, 0, 0, match.end())
+        body_start = match.end()
+
+    headings = []
+    fence = None
+    for line in LINE_PATTERN.finditer(data, body_start):
+        if line.group('fence'):
+            marker = line.group('fence')
+            fence = None if fence == marker else (fence or marker)
+        elif fence is None:
+            headings.append((len(line.group('hashes')), line.group('title').decode('utf-8', 'replace'), line.start()))
+
+    first_heading = headings[0][2] if headings else len(data)
+    if data[body_start:first_heading].strip():
+        add(PREAMBLE_SECTION, 0, body_start, first_heading)
+
+    open_sections: List[AgentSection] = []
+    for level, title, start in headings:
+        while open_sections and open_sections[-1].level >= level:
+            open_sections.pop().end = start
+        open_sections.append(add(title, level, start))
+
+    for section in sections:
+        section.tokens = len(data[section.start:section.end].decode('utf-8', 'replace')) // 4
+
+    return sections
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark analyze-progress.sh: multi-grep pipeline vs single-pass --analyze
+Runs both engines on a synthetic SHARED_PROGRESS.md and checks the single-pass
+counts agree with the parse-progress.py summary report
+"""
+
+import os
+import re
+import sys
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+from synthetic import write_synthetic_progress  # noqa: E402
+
+SCRIPT = TOOLS_DIR / 'analyze-progress.sh'
+
+
+def run(progress_file: Path, legacy: bool) -> tuple:
+    """(seconds, stdout) of one analyze-progress.sh run"""
+    env = dict(os.environ, ANALYZE_PROGRESS_ENGINE='grep' if legacy else 'python')
+    start = time.perf_counter()
+    result = subprocess.run(['bash', str(SCRIPT), str(progress_file)], env=env,
+                            capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, result.stdout
+
+
+def total_entries(report: str) -> int:
+    """Entry count from an analysis or summary report"""
+    match = re.search(r'Total Entries:\s*(\d+)', report)
+    return int(match.group(1)) if match else -1
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark analyze-progress.sh')
+    parser.add_argument('--entries', type=int, default=100000, help='Synthetic entries to generate')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    parser.add_argument('--agents-dir', default='agents', help='Agents directory (for agent names)')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        progress_file = Path(tmp) / 'SHARED_PROGRESS.md'
+        size = write_synthetic_progress(progress_file, args.entries, agents_dir=Path(args.agents_dir))
+        print(f"Synthetic progress file: {args.entries} entries, {size / 1e6:.1f} MB\n")
+
+        best = {'grep pipeline (fallback)': float('inf'), 'single pass (--analyze)': float('inf')}
+        reports = {}
+        for _ in range(args.repeat):
+            for label in best:
+                seconds, reports[label] = run(progress_file, legacy=label.startswith('grep'))
+                best[label] = min(best[label], seconds)
+
+        summary = subprocess.run([sys.executable, str(TOOLS_DIR / 'parse-progress.py'), str(progress_file)],
+                                 capture_output=True, text=True, check=True).stdout
+
+        print(f"  {'mode':<26}{'time':>10}{'entries':>10}")
+        for label, seconds in best.items():
+            print(f"  {label:<26}{seconds:>9.2f}s{total_entries(reports[label]):>10}")
+        print(f"  {'parse-progress.py summary':<26}{'':>10}{total_entries(summary):>10}")
+
+        agrees = total_entries(reports['single pass (--analyze)']) == total_entries(summary)
+        print(f"\nSingle-pass counts agree with parse-progress.py: {'yes' if agrees else 'NO'}")
+
+    return 0 if agrees else 1
+
+
+if __name__ == '__main__':
+    exit(main())
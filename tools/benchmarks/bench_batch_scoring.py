@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch agent scoring (find_agents_batch) against one-at-a-time find_agent
+Uses a synthetic catalog and synthetic sub-task requirements
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import capability_discovery  # noqa: E402
+from capability_discovery import CapabilityDiscovery  # noqa: E402
+from synthetic import synthetic_discovery  # noqa: E402
+
+
+def synthetic_requirements(discovery: CapabilityDiscovery, count: int, seed: int = 5) -> list:
+    """Build sub-task style requirements from the catalog vocabulary"""
+    rng = random.Random(seed)
+    vocabulary = sorted({
+        word
+        for capabilities in discovery.agents.values()
+        for word in capabilities.description.split() + capabilities.technologies
+    })
+    verbs = ['implement', 'design', 'review', 'optimize', 'document', 'test', 'deploy']
+    return [
+        f"{rng.choice(verbs)} {' '.join(rng.sample(vocabulary, rng.randint(3, 8)))}"
+        for _ in range(count)
+    ]
+
+
+def results_match(batch: list, single: list, tolerance: float = 1e-9) -> bool:
+    """Compare rankings allowing float summation-order differences"""
+    if len(batch) != len(single):
+        return False
+    for (batch_name, batch_score), (single_name, single_score) in zip(batch, single):
+        if abs(batch_score - single_score) > tolerance:
+            return False
+        if batch_name != single_name and batch_score != single_score:
+            return False
+    return True
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark batch agent scoring')
+    parser.add_argument('--agents-dir', default='agents', help='Agents directory')
+    parser.add_argument('--agents', type=int, default=5000, help='Synthetic catalog size')
+    parser.add_argument('--requirements', type=int, default=10000, help='Number of requirements')
+    parser.add_argument('--top-n', type=int, default=5, help='Matches per requirement')
+    parser.add_argument('--sample', type=int, default=200, help='Requirements timed one at a time')
+
+    args = parser.parse_args()
+
+    real = CapabilityDiscovery(args.agents_dir)
+    real.scan_all_agents()
+
+    discovery = synthetic_discovery(real, args.agents)
+    requirements = synthetic_requirements(discovery, args.requirements)
+
+    start = time.perf_counter()
+    discovery.find_agent("warm up", ranker='bm25')
+    print(f"\nBuilt BM25 index over {len(discovery.agents)} agents in {time.perf_counter() - start:.2f}s")
+    print(f"NumPy available: {capability_discovery.np is not None}")
+
+    start = time.perf_counter()
+    batch = discovery.find_agents_batch(requirements, top_n=args.top_n, ranker='bm25')
+    batch_seconds = time.perf_counter() - start
+
+    sample = requirements[:args.sample]
+    start = time.perf_counter()
+    single = [discovery.find_agent(requirement, top_n=args.top_n, ranker='bm25') for requirement in sample]
+    single_seconds = (time.perf_counter() - start) / len(sample) * len(requirements)
+
+    mismatches = sum(1 for b, s in zip(batch, single) if not results_match(b, s))
+
+    print(f"\n{len(requirements)} requirements x {len(discovery.agents)} agents (top {args.top_n}):")
+    print(f"  batch:      {batch_seconds:8.2f}s ({len(requirements) / batch_seconds:,.0f} requirements/s)")
+    print(f"  one-by-one: {single_seconds:8.2f}s (extrapolated from {len(sample)})")
+    print(f"  speedup:    {single_seconds / batch_seconds:8.1f}x")
+    print(f"  mismatches: {mismatches} of {len(sample)} sampled requirements")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark error-handling event logging: per-event open/append vs the buffered LogSink
+Drives retry_with_backoff in a tight retry loop with each writer, then has several
+processes log concurrently to one file and checks no line was lost or interleaved
+(counting across rotated archives as well as the current log)
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import tempfile
+import multiprocessing
+from pathlib import Path
+from typing import Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import error_handling  # noqa: E402
+
+
+def legacy_write_log(log_entry: Dict) -> None:
+    """Reference: the writer used before LogSink (mkdir + open + write + close per event)"""
+    log_file = Path(error_handling.LOG_FILE)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(log_file, 'a') as f:
+        f.write(json.dumps(log_entry) + '\n')
+
+
+def remove_log():
+    """Delete the log and its rotated archives"""
+    for segment in error_handling.log_segments(error_handling.LOG_FILE):
+        segment.unlink()
+
+
+def count_lines() -> tuple:
+    """(lines, unparseable lines) across the rotated archives and the current log"""
+    lines = bad = 0
+    for segment in error_handling.log_segments(error_handling.LOG_FILE):
+        opener = gzip.open if segment.suffix == '.gz' else open
+        with opener(segment, 'rt', encoding='utf-8') as f:
+            for line in f:
+                lines += 1
+                try:
+                    json.loads(line)
+                except ValueError:
+                    bad += 1
+    return lines, bad
+
+
+def retry_loop(calls: int, attempts: int) -> int:
+    """Run calls always-failing operations through retry_with_backoff; returns events logged"""
+    @error_handling.retry_with_backoff(max_attempts=attempts, base_delay=0)
+    def flaky_operation():
+        raise ConnectionError("dependency unavailable")
+
+    for _ in range(calls):
+        try:
+            flaky_operation()
+        except error_handling.RecoverableError:
+            pass
+    return calls * attempts
+
+
+def time_writer(label: str, calls: int, attempts: int) -> tuple:
+    """(events/second, lines in the log, events logged) for one writer, in a fresh log file"""
+    remove_log()
+
+    original = error_handling._write_log
+    if label == 'none':
+        error_handling._write_log = lambda log_entry: None
+    elif label == 'legacy':
+        error_handling._write_log = legacy_write_log
+    else:
+        error_handling.set_log_sink(error_handling.LogSink())
+    try:
+        start = time.perf_counter()
+        events = retry_loop(calls, attempts)
+        error_handling.flush_logs()
+        seconds = time.perf_counter() - start
+    finally:
+        error_handling._write_log = original
+        previous = error_handling.set_log_sink(None)
+        if previous is not None:
+            previous.close()
+
+    lines = count_lines()[0] if label != 'none' else events
+    return events / seconds, lines, events
+
+
+def log_worker(worker: int, events: int):
+    for i in range(events):
+        error_handling._log_checkpoint('saved', f"W{worker}-{i}", 'x' * 200)
+
+
+def check_concurrent(processes: int, events: int) -> tuple:
+    """(lines, unparseable lines) after processes log events each to one file"""
+    remove_log()
+
+    context = multiprocessing.get_context('spawn')
+    workers = [context.Process(target=log_worker, args=(worker, events)) for worker in range(processes)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+    return count_lines()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark error-handling event logging')
+    parser.add_argument('--calls', type=int, default=20000, help='Operations run through retry_with_backoff')
+    parser.add_argument('--attempts', type=int, default=5, help='Attempts per operation (one event each)')
+    parser.add_argument('--processes', type=int, default=4, help='Concurrent writer processes')
+    parser.add_argument('--process-events', type=int, default=20000, help='Events per writer process')
+
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            print(f"Tight retry loop: {args.calls} operations x {args.attempts} attempts\n")
+            print(f"  {'writer':<28}{'events/s':>12}{'lines':>10}{'log cost/event':>17}")
+            writers = {'none': 'no logging (loop only)', 'legacy': 'per-event open/append', 'buffered': 'LogSink'}
+            results = {label: time_writer(label, args.calls, args.attempts) for label in writers}
+            complete = all(lines == events for _, lines, events in results.values())
+            loop_rate = results['none'][0]
+            for label, name in writers.items():
+                rate, lines, _ = results[label]
+                print(f"  {name:<28}{rate:>12,.0f}{lines:>10}{(1 / rate - 1 / loop_rate) * 1e6:>14.1f} us")
+
+            lines, bad = check_concurrent(args.processes, args.process_events)
+            expected = args.processes * args.process_events
+            print(f"\n{args.processes} processes sharing one log: {lines}/{expected} lines, {bad} interleaved")
+        finally:
+            os.chdir(cwd)
+
+    return 0 if complete and lines == expected and not bad else 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark and verify the inverted-index find_agent() against the linear scorer
+Checks identical rankings on the real agent catalog, then times both on a
+synthetic catalog of generated agents
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from capability_discovery import CapabilityDiscovery  # noqa: E402
+from synthetic import synthetic_discovery  # noqa: E402
+
+
+SAMPLE_QUERIES = [
+    "REST API design with PostgreSQL",
+    "frontend accessibility audit for a React app",
+    "Kubernetes deployment and CI/CD pipeline",
+    "machine learning model monitoring",
+    "security review of authentication flow",
+    "SEO and content marketing strategy",
+    "",
+    "a",
+    "GraphQL",
+]
+
+
+def build_queries(discovery: CapabilityDiscovery, count: int, seed: int = 7) -> list:
+    """Mix hand-written queries with ones sampled from the catalog vocabulary"""
+    rng = random.Random(seed)
+    vocabulary = []
+    for capabilities in discovery.agents.values():
+        vocabulary.extend(capabilities.specializations)
+        vocabulary.extend(capabilities.technologies)
+        vocabulary.extend(capabilities.description.split())
+
+    queries = list(SAMPLE_QUERIES)
+    while len(queries) < count:
+        words = rng.sample(vocabulary, rng.randint(1, 6))
+        queries.append(" ".join(word.replace('_', rng.choice([' ', '_'])) for word in words))
+    return queries
+
+
+def time_queries(find, queries: list) -> float:
+    """Return seconds per query"""
+    start = time.perf_counter()
+    for query in queries:
+        find(query, top_n=5)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark inverted-index agent discovery')
+    parser.add_argument('--agents-dir', default='agents', help='Agents directory')
+    parser.add_argument('--queries', type=int, default=500, help='Number of queries to verify/time')
+    parser.add_argument('--synthetic-agents', type=int, default=5000, help='Size of synthetic catalog')
+
+    args = parser.parse_args()
+
+    discovery = CapabilityDiscovery(args.agents_dir)
+    discovery.scan_all_agents()
+    queries = build_queries(discovery, args.queries)
+
+    # Full rankings must be identical, including zero-score padding order
+    mismatches = 0
+    for query in queries:
+        top_n = len(discovery.agents)
+        if discovery.find_agent(query, top_n=top_n) != discovery.find_agent_linear(query, top_n=top_n):
+            mismatches += 1
+            print(f"  Mismatch for query: {query!r}")
+    print(f"\nVerified {len(queries)} queries on {len(discovery.agents)} agents: {mismatches} mismatches")
+
+    print(f"\nTiming on {len(discovery.agents)} real agents:")
+    print(f"  linear:   {time_queries(discovery.find_agent_linear, queries) * 1000:.3f} ms/query")
+    print(f"  inverted: {time_queries(discovery.find_agent, queries) * 1000:.3f} ms/query")
+
+    synthetic = synthetic_discovery(discovery, args.synthetic_agents)
+    start = time.perf_counter()
+    synthetic.find_agent("warm up index")
+    build_seconds = time.perf_counter() - start
+    print(f"\nTiming on {len(synthetic.agents)} synthetic agents (index build {build_seconds:.2f}s):")
+    sample = queries[:100]
+    print(f"  linear:   {time_queries(synthetic.find_agent_linear, sample) * 1000:.3f} ms/query")
+    print(f"  inverted: {time_queries(synthetic.find_agent, sample) * 1000:.3f} ms/query")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    exit(main())
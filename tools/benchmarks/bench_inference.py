@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark single-pass capability inference against per-pattern regex searches
+Verifies identical output on the real agents and on large synthetic bodies
+"""
+
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_inference import (  # noqa: E402
+    SPECIALIZATION_TERMS, TECHNOLOGY_TERMS,
+    SUMMARY_SPECIALIZATION_TERMS, SUMMARY_TECHNOLOGY_TERMS,
+    get_inferrer
+)
+
+
+def legacy_infer(content: str, specialization_terms: dict, technology_terms: list) -> tuple:
+    """Reference: one search per specialization pattern and per technology, as before"""
+    specializations = [
+        spec for spec, terms in specialization_terms.items()
+        if re.search(r'\b(' + '|'.join(re.escape(term) for term in terms) + r')\b', content, re.IGNORECASE)
+    ]
+    technologies = [
+        tech for tech in technology_terms
+        if re.search(rf'\b{re.escape(tech)}\b', content, re.IGNORECASE)
+    ]
+    return specializations, technologies
+
+
+def synthetic_bodies(contents: list, count: int, lines: int, seed: int = 9) -> list:
+    """Large bodies built from shuffled lines of real agents, with case noise"""
+    rng = random.Random(seed)
+    pool = [line for content in contents for line in content.split('\n')]
+    bodies = []
+    for _ in range(count):
+        picked = rng.sample(pool, min(lines, len(pool)))
+        picked = [line.upper() if rng.random() < 0.05 else line for line in picked]
+        bodies.append('\n'.join(picked))
+    return bodies
+
+
+def time_calls(func, documents: list, repeat: int) -> float:
+    """Seconds per document"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for document in documents:
+            func(document)
+    return (time.perf_counter() - start) / (repeat * len(documents))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark capability inference')
+    parser.add_argument('--agents-dir', default='agents', help='Agents directory')
+    parser.add_argument('--bodies', type=int, default=200, help='Synthetic bodies to verify')
+    parser.add_argument('--lines', type=int, default=2000, help='Lines per synthetic body')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions')
+
+    args = parser.parse_args()
+
+    contents = [path.read_text() for path in sorted(Path(args.agents_dir).rglob("*.mdc"))]
+    documents = {
+        'agent files': contents,
+        f'{args.lines}-line bodies': synthetic_bodies(contents, args.bodies, args.lines),
+        'no-match text': ['lorem ipsum dolor sit amet ' * 2000] * 20,
+    }
+    vocabularies = {
+        'discovery': (SPECIALIZATION_TERMS, TECHNOLOGY_TERMS),
+        'summary': (SUMMARY_SPECIALIZATION_TERMS, SUMMARY_TECHNOLOGY_TERMS),
+    }
+
+    mismatches = 0
+    for vocabulary, (specialization_terms, technology_terms) in vocabularies.items():
+        inferrer = get_inferrer(vocabulary)
+        for label, docs in documents.items():
+            for document in docs:
+                if inferrer.infer(document) != legacy_infer(document, specialization_terms, technology_terms):
+                    mismatches += 1
+    print(f"Verified {sum(len(d) for d in documents.values())} documents x {len(vocabularies)} vocabularies: "
+          f"{mismatches} mismatches\n")
+
+    inferrer = get_inferrer('discovery')
+    print(f"  {'documents':<20}{'per-pattern':>14}{'single-pass':>14}{'speedup':>10}")
+    for label, docs in documents.items():
+        legacy = time_calls(lambda d: legacy_infer(d, SPECIALIZATION_TERMS, TECHNOLOGY_TERMS), docs, args.repeat)
+        single = time_calls(inferrer.infer, docs, args.repeat)
+        print(f"  {label:<20}{legacy * 1000:>11.3f} ms{single * 1000:>11.3f} ms{legacy / single:>9.1f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel agent parsing (--jobs) for capability discovery and summaries
+Writes a synthetic catalog and reports throughput from 1 to N worker processes
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from capability_discovery import CapabilityDiscovery  # noqa: E402
+from generate_summaries import generate_summaries  # noqa: E402
+from synthetic import write_synthetic_catalog  # noqa: E402
+
+
+def time_scan(agents_dir: Path, jobs: int) -> float:
+    """Seconds for a full (uncached) capability scan"""
+    discovery = CapabilityDiscovery(str(agents_dir), jobs=jobs)
+    start = time.perf_counter()
+    discovery.scan_all_agents()
+    return time.perf_counter() - start
+
+
+def time_summaries(agent_files: list, jobs: int) -> float:
+    """Seconds to generate summaries for every agent file"""
+    start = time.perf_counter()
+    generate_summaries(agent_files, jobs=jobs)
+    return time.perf_counter() - start
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark parallel agent parsing')
+    parser.add_argument('--agents-dir', default='agents', help='Real agents directory to sample from')
+    parser.add_argument('--files', type=int, default=5000, help='Synthetic catalog size')
+    parser.add_argument('--max-jobs', type=int, default=os.cpu_count() or 1, help='Largest worker count')
+
+    args = parser.parse_args()
+
+    job_counts = sorted({1, *(2 ** i for i in range(1, args.max_jobs.bit_length())), args.max_jobs})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = Path(tmp) / "agents"
+        write_synthetic_catalog(Path(args.agents_dir), catalog, args.files)
+        agent_files = list(catalog.rglob("*.mdc"))
+
+        results = []
+        for jobs in job_counts:
+            # Silence per-run progress output from the tools
+            stdout = sys.stdout
+            sys.stdout = open(os.devnull, 'w')
+            try:
+                scan_seconds = time_scan(catalog, jobs)
+                summary_seconds = time_summaries(agent_files, jobs)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+            results.append((jobs, scan_seconds, summary_seconds))
+
+    print(f"Parsed {args.files} synthetic agent files ({os.cpu_count()} CPUs available)\n")
+    print(f"  {'jobs':>4}  {'scan files/s':>13}  {'speedup':>7}  {'summary files/s':>16}  {'speedup':>7}")
+    base_scan, base_summary = results[0][1], results[0][2]
+    for jobs, scan_seconds, summary_seconds in results:
+        print(f"  {jobs:>4}  {args.files / scan_seconds:>13,.0f}  {base_scan / scan_seconds:>6.2f}x"
+              f"  {args.files / summary_seconds:>16,.0f}  {base_summary / summary_seconds:>6.2f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark progress entry parsing against the previous per-field regex searches
+Parses a synthetic SHARED_PROGRESS.md with both parsers and verifies the JSON exports are byte-identical
+"""
+
+import re
+import sys
+import time
+import tempfile
+import importlib.util
+from pathlib import Path
+from typing import Dict, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+from synthetic import write_synthetic_progress  # noqa: E402
+
+# parse-progress.py is not importable by name
+_spec = importlib.util.spec_from_file_location('parse_progress', TOOLS_DIR / 'parse-progress.py')
+parse_progress = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parse_progress)
+
+
+class LegacyProgressParser(parse_progress.AgentProgressParser):
+    """Reference: the entry parsing used before the precompiled dispatch table"""
+
+    def _parse_entry(self, content: str) -> Optional[Dict]:
+        content = content.strip()
+        if not content:
+            return None
+
+        if content.startswith('---'):
+            if re.search(r'---\n\n## \d{4}-\d{2}-\d{2}', content):
+                return self._parse_hybrid_entry(content)
+            else:
+                return self._parse_yaml_entry(content)
+        elif re.match(r'^## \d{4}-\d{2}-\d{2}', content):
+            return self._parse_markdown_entry(content)
+
+        return None
+
+    def _parse_markdown_entry(self, content: str) -> Dict:
+        entry = {}
+
+        header_match = re.match(
+            r'^## (\d{4}-\d{2}-\d{2})(?: (\d{2}:\d{2}))? - @([\w-]+): (.+)$',
+            content.split('\n')[0],
+            re.MULTILINE
+        )
+
+        if header_match:
+            date = header_match.group(1)
+            time = header_match.group(2) or "00:00"
+            entry['timestamp'] = f"{date} {time}"
+            entry['agent'] = header_match.group(3)
+            entry['task_title'] = header_match.group(4)
+
+        status_match = re.search(r'\*\*Status\*\*:\s*([^\n|]+)', content)
+        if status_match:
+            status_text = status_match.group(1).strip()
+            if '✅' in status_text or 'Complete' in status_text:
+                entry['status'] = 'complete'
+            elif '🔄' in status_text or 'Progress' in status_text:
+                entry['status'] = 'in_progress'
+            elif '⚠️' in status_text or 'Blocked' in status_text:
+                entry['status'] = 'blocked'
+            elif '❌' in status_text or 'Failed' in status_text:
+                entry['status'] = 'failed'
+            elif '🚧' in status_text or 'Paused' in status_text:
+                entry['status'] = 'paused'
+            elif '📋' in status_text or 'Planned' in status_text:
+                entry['status'] = 'planned'
+
+        task_id_match = re.search(r'\*\*Task ID\*\*:\s*(\S+)', content)
+        if task_id_match:
+            entry['task_id'] = task_id_match.group(1)
+
+        duration_match = re.search(r'\*\*Duration\*\*:\s*(?:(\d+)h\s*)?(?:(\d+)m)?', content)
+        if duration_match:
+            hours = int(duration_match.group(1) or 0)
+            minutes = int(duration_match.group(2) or 0)
+            entry['duration_minutes'] = hours * 60 + minutes
+
+        progress_match = re.search(r'\*\*Progress\*\*:\s*(\d+)%', content)
+        if progress_match:
+            entry['progress_percent'] = int(progress_match.group(1))
+
+        deliverables = []
+        deliverables_section = re.search(
+            r'\*\*Deliverables\*\*:\n((?:^[ \t]*-.*\n?)+)',
+            content,
+            re.MULTILINE
+        )
+        if deliverables_section:
+            for line in deliverables_section.group(1).split('\n'):
+                if line.strip().startswith('-'):
+                    deliv_match = re.search(r'`([^`]+)`(?:\s*\(type:\s*(\w+)\))?\s*-?\s*(.*)', line)
+                    if deliv_match:
+                        deliverables.append({
+                            'path': deliv_match.group(1),
+                            'type': deliv_match.group(2) or 'unknown',
+                            'description': deliv_match.group(3).strip()
+                        })
+        if deliverables:
+            entry['deliverables'] = deliverables
+
+        metrics = {}
+        metrics_section = re.search(
+            r'\*\*Metrics\*\*[^:]*?:\n((?:^[ \t]*-.*\n?)+)',
+            content,
+            re.MULTILINE
+        )
+        if metrics_section:
+            for line in metrics_section.group(1).split('\n'):
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    key = key.strip('- ').strip()
+                    value = value.strip().rstrip('%')
+                    try:
+                        value = int(value)
+                    except ValueError:
+                        try:
+                            value = float(value)
+                        except ValueError:
+                            pass
+                    metrics[key] = value
+        if metrics:
+            entry['metrics'] = metrics
+
+        return entry
+
+
+def time_parse(parsers: dict, raw_entries: list, repeat: int) -> dict:
+    """Best-of-repeat seconds for each parser to parse every raw entry (runs interleaved to even out noise)"""
+    best = {name: float('inf') for name in parsers}
+    for _ in range(repeat):
+        for name, progress_parser in parsers.items():
+            start = time.perf_counter()
+            for content in raw_entries:
+                progress_parser._parse_entry(content)
+            best[name] = min(best[name], time.perf_counter() - start)
+    return best
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark progress entry parsing')
+    parser.add_argument('--entries', type=int, default=100000, help='Synthetic entries to generate')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    parser.add_argument('--agents-dir', default='agents', help='Agents directory (for agent names)')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        progress_file = Path(tmp) / 'SHARED_PROGRESS.md'
+        size = write_synthetic_progress(progress_file, args.entries, agents_dir=Path(args.agents_dir))
+        print(f"Synthetic progress file: {args.entries} entries, {size / 1e6:.1f} MB\n")
+
+        legacy = LegacyProgressParser(str(progress_file))
+        current = parse_progress.AgentProgressParser(str(progress_file))
+
+        # Byte-identical JSON exports
+        legacy.export_to_json(legacy.parse_all(), Path(tmp) / 'legacy.json')
+        current.export_to_json(current.parse_all(), Path(tmp) / 'current.json')
+        identical = (Path(tmp) / 'legacy.json').read_bytes() == (Path(tmp) / 'current.json').read_bytes()
+        print(f"JSON export byte-identical: {'yes' if identical else 'NO'}\n")
+
+        # Entry parsing alone (file splitting excluded), by entry format
+        raw_entries = [content for _, content in current._iter_raw_entries()]
+        groups = {
+            'markdown entries': [content for content in raw_entries if content.lstrip().startswith('## ')],
+            'YAML/hybrid entries': [content for content in raw_entries if content.lstrip().startswith('---')],
+        }
+        parsers = {'legacy': legacy, 'current': current}
+        timings = {label: time_parse(parsers, contents, args.repeat) for label, contents in groups.items()}
+        timings['all entries'] = {name: sum(t[name] for t in timings.values()) for name in parsers}
+        groups['all entries'] = raw_entries
+
+        print(f"  {'entries':<22}{'count':>8}{'per-field re.search':>22}{'precompiled table':>20}{'speedup':>9}")
+        for label, seconds in timings.items():
+            count = len(groups[label])
+            print(f"  {label:<22}{count:>8}{count / seconds['legacy']:>15,.0f} ent/s"
+                  f"{count / seconds['current']:>13,.0f} ent/s{seconds['legacy'] / seconds['current']:>8.2f}x")
+
+    return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    exit(main())
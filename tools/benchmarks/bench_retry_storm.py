@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Simulate a retry storm against a flaky local stub service
+Many clients start together and make a few calls each to an async stub that
+is down for a while and then sheds load above a fixed capacity per tick; each
+retry_with_backoff configuration (fixed backoff, jitter, retry budget, token
+bucket) is run against a fresh stub and the load it generated is reported
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import error_handling  # noqa: E402
+
+
+class FlakyStub:
+    """Local stand-in for a shared dependency: down during the outage, then rejects load above capacity per tick"""
+
+    def __init__(self, outage: float, capacity: int, tick: float, failure_rate: float, latency: float, seed: int):
+        self.outage = outage
+        self.capacity = capacity
+        self.tick = tick
+        self.failure_rate = failure_rate
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.started = time.monotonic()
+        self.load = Counter()      # Requests per tick
+        self.rejected = 0
+
+    async def call(self):
+        now = time.monotonic() - self.started
+        tick = int(now / self.tick)
+        self.load[tick] += 1
+        await asyncio.sleep(self.latency)
+
+        if now < self.outage:
+            raise ConnectionError("service unavailable")
+        if self.load[tick] > self.capacity:
+            self.rejected += 1
+            raise ConnectionError("overloaded")
+        if self.rng.random() < self.failure_rate:
+            raise ConnectionError("transient failure")
+        return True
+
+
+async def run_scenario(options: dict, args) -> dict:
+    stub = FlakyStub(args.outage, args.capacity, args.tick, args.failure_rate, args.latency, args.seed)
+
+    @error_handling.retry_with_backoff(max_attempts=args.attempts, base_delay=args.base_delay, **options)
+    async def call_dependency():
+        return await stub.call()
+
+    async def client(rng: random.Random) -> list:
+        """(succeeded, seconds) of each call"""
+        results = []
+        for _ in range(args.calls):
+            started = time.monotonic()
+            try:
+                await call_dependency()
+                results.append((True, time.monotonic() - started))
+            except error_handling.RecoverableError:
+                results.append((False, time.monotonic() - started))
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * args.think_time)
+        return results
+
+    clients = [client(random.Random(args.seed * 100003 + i)) for i in range(args.clients)]
+    results = [call for calls in await asyncio.gather(*clients) for call in calls]
+    latencies = sorted(latency for ok, latency in results if ok)
+    return {
+        'requests': sum(stub.load.values()),
+        'outage_requests': sum(count for tick, count in stub.load.items() if tick * args.tick < args.outage),
+        'peak': max(stub.load.values()),
+        'rejected': stub.rejected,
+        'succeeded': sum(ok for ok, _ in results),
+        'p99': latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] if latencies else float('nan'),
+        'elapsed': time.monotonic() - stub.started,
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Simulate retry storms against a flaky stub service')
+    parser.add_argument('--clients', type=int, default=500, help='Concurrent clients, all starting at once')
+    parser.add_argument('--calls', type=int, default=4, help='Sequential calls per client')
+    parser.add_argument('--think-time', type=float, default=0.5, help='Mean seconds a client waits between calls')
+    parser.add_argument('--attempts', type=int, default=8, help='max_attempts per call')
+    parser.add_argument('--base-delay', type=float, default=0.05, help='base_delay in seconds')
+    parser.add_argument('--max-delay', type=float, default=1.0, help='max_delay cap for the jittered runs')
+    parser.add_argument('--outage', type=float, default=0.3, help='Seconds the stub is down at the start')
+    parser.add_argument('--capacity', type=int, default=20, help='Requests per tick the stub serves')
+    parser.add_argument('--tick', type=float, default=0.01, help='Stub capacity tick in seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.05, help='Random failure rate once recovered')
+    parser.add_argument('--latency', type=float, default=0.002, help='Stub response time in seconds')
+    parser.add_argument('--budget-ratio', type=float, default=0.2, help='RetryBudget ratio for the budget runs')
+    parser.add_argument('--seed', type=int, default=5, help='Random seed (jitter and stub failures)')
+
+    args = parser.parse_args()
+
+    rate = args.capacity / args.tick
+    jittered = {'jitter': 'full', 'max_delay': args.max_delay}
+    limited = {'rate_limit': rate * 0.8, 'rate_burst': args.capacity}
+    scenarios = {
+        'fixed backoff (no jitter)': lambda: {},
+        'full jitter + cap': lambda: jittered,
+        'decorrelated jitter + cap': lambda: {'jitter': 'decorrelated', 'max_delay': args.max_delay},
+        'full jitter + retry budget': lambda: {**jittered, 'retry_budget': error_handling.RetryBudget(
+            ratio=args.budget_ratio, window=10, min_retries_per_second=10)},
+        'full jitter + token bucket': lambda: {**jittered, **limited},
+        'jitter + budget + bucket': lambda: {**jittered, **limited, 'retry_budget': error_handling.RetryBudget(
+            ratio=args.budget_ratio, window=10, min_retries_per_second=10)},
+    }
+
+    total = args.clients * args.calls
+    print(f"{args.clients} clients x {args.calls} calls, stub down for {args.outage}s then serving "
+          f"{args.capacity} requests per {args.tick * 1000:.0f} ms tick ({rate:.0f}/s), "
+          f"{args.failure_rate:.0%} transient failures\n")
+    print(f"  {'retry configuration':<30}{'requests':>9}{'in outage':>10}{'peak/tick':>10}{'overloaded':>11}"
+          f"{'calls ok':>12}{'p99 ok':>8}{'elapsed':>9}")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)   # Keep the retry event log out of the workspace
+        try:
+            for label, options in scenarios.items():
+                random.seed(args.seed)
+                error_handling._token_buckets.clear()
+                result = asyncio.run(run_scenario(options(), args))
+                print(f"  {label:<30}{result['requests']:>9}{result['outage_requests']:>10}{result['peak']:>10}"
+                      f"{result['rejected']:>11}{result['succeeded']:>7}/{total:<4}{result['p99']:>7.2f}s"
+                      f"{result['elapsed']:>8.2f}s")
+        finally:
+            error_handling.flush_logs()
+            os.chdir(cwd)
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark YAML loading with the pure-Python and libyaml safe loaders
+Times agent frontmatter and YAML progress entries per document, plus
+load_cached() hits, and verifies every loader returns the same documents
+"""
+
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yaml  # noqa: E402
+
+import yaml_utils  # noqa: E402
+from synthetic import synthetic_progress_entry  # noqa: E402
+
+FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---', re.DOTALL | re.MULTILINE)
+
+
+def progress_documents(count: int, agents: list, seed: int = 5) -> list:
+    """YAML blocks of synthetic YAML and hybrid progress entries"""
+    rng = random.Random(seed)
+    documents = []
+    i = 0
+    while len(documents) < count:
+        entry = synthetic_progress_entry(i, rng, agents)
+        match = FRONTMATTER_PATTERN.search(entry)
+        if entry.startswith('---') and match:
+            documents.append(match.group(1))
+        i += 1
+    return documents
+
+
+def time_loads(load, documents: list, repeat: int) -> float:
+    """Best-of-repeat seconds per document"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            load(document)
+        best = min(best, time.perf_counter() - start)
+    return best / len(documents)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark YAML loaders')
+    parser.add_argument('--agents-dir', default='agents', help='Agents directory')
+    parser.add_argument('--entries', type=int, default=2000, help='Synthetic YAML progress entries')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+
+    args = parser.parse_args()
+
+    agent_files = sorted(Path(args.agents_dir).rglob("*.mdc"))
+    frontmatter = []
+    for path in agent_files:
+        match = FRONTMATTER_PATTERN.search(path.read_text())
+        if match:
+            frontmatter.append(match.group(1))
+    agents = [path.stem for path in agent_files] or ['backend-architect']
+
+    documents = {
+        'agent frontmatter': frontmatter,
+        'YAML progress entries': progress_documents(args.entries, agents),
+    }
+
+    loaders = {'SafeLoader': lambda text: yaml.load(text, Loader=yaml.SafeLoader)}
+    if yaml_utils.LIBYAML:
+        loaders['CSafeLoader'] = lambda text: yaml.load(text, Loader=yaml.CSafeLoader)
+    else:
+        print("libyaml is not available: yaml_utils falls back to the pure-Python loader\n")
+    loaders['load_cached (hits)'] = yaml_utils.load_cached
+
+    mismatches = 0
+    for docs in documents.values():
+        for document in docs:
+            expected = yaml.load(document, Loader=yaml.SafeLoader)
+            mismatches += sum(load(document) != expected for load in loaders.values())
+    print(f"Verified {sum(len(d) for d in documents.values())} documents x {len(loaders)} loaders: "
+          f"{mismatches} mismatches\n")
+
+    print(f"  {'documents':<24}{'count':>7}" + ''.join(f"{name:>21}" for name in loaders) + f"{'C speedup':>11}")
+    for label, docs in documents.items():
+        per_doc = {name: time_loads(load, docs, args.repeat) for name, load in loaders.items()}
+        c_loader = per_doc.get('CSafeLoader', per_doc['SafeLoader'])
+        print(f"  {label:<24}{len(docs):>7}"
+              + ''.join(f"{seconds * 1e6:>18.1f} us" for seconds in per_doc.values())
+              + f"{per_doc['SafeLoader'] / c_loader:>10.1f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Evaluate agent discovery rankers against a labeled query set
+Reports precision@k and mean query latency for each ranker
+"""
+
+import sys
+import json
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from capability_discovery import CapabilityDiscovery, RANKERS  # noqa: E402
+
+
+DEFAULT_QUERIES = Path(__file__).resolve().parent / "discovery_queries.json"
+
+
+def precision_at_k(ranked: list, relevant: set, k: int) -> float:
+    """Fraction of the top k results that are labeled relevant"""
+    return sum(1 for name, score in ranked[:k] if score > 0 and name in relevant) / k
+
+
+def evaluate(discovery: CapabilityDiscovery, queries: list, ranker: str, ks: list) -> dict:
+    """Run every labeled query through a ranker"""
+    totals = {k: 0.0 for k in ks}
+    elapsed = 0.0
+
+    # Build the ranker's index outside the timed region
+    discovery.find_agent("warm up", top_n=1, ranker=ranker)
+
+    for item in queries:
+        start = time.perf_counter()
+        ranked = discovery.find_agent(item['query'], top_n=max(ks), ranker=ranker)
+        elapsed += time.perf_counter() - start
+
+        relevant = set(item['relevant'])
+        for k in ks:
+            totals[k] += precision_at_k(ranked, relevant, k)
+
+    return {
+        'precision': {k: totals[k] / len(queries) for k in ks},
+        'ms_per_query': elapsed / len(queries) * 1000
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Evaluate agent discovery rankers')
+    parser.add_argument('--agents-dir', default='agents', help='Agents directory')
+    parser.add_argument('--queries', default=str(DEFAULT_QUERIES), help='Labeled query set (JSON)')
+    parser.add_argument('--k', type=int, nargs='+', default=[1, 3, 5], help='Cutoffs for precision@k')
+    parser.add_argument('--verbose', action='store_true', help='Show top results per query')
+
+    args = parser.parse_args()
+
+    with open(args.queries, 'r') as f:
+        queries = json.load(f)['queries']
+
+    discovery = CapabilityDiscovery(args.agents_dir)
+    discovery.scan_all_agents()
+
+    missing = {name for item in queries for name in item['relevant']} - set(discovery.agents)
+    if missing:
+        print(f"Warning: labels reference unknown agents: {', '.join(sorted(missing))}")
+
+    print(f"\nEvaluated {len(queries)} labeled queries\n")
+    print(f"  {'ranker':<10}" + "".join(f"{'P@' + str(k):>8}" for k in args.k) + f"{'ms/query':>11}")
+    for ranker in RANKERS:
+        result = evaluate(discovery, queries, ranker, args.k)
+        row = "".join(f"{result['precision'][k]:>8.3f}" for k in args.k)
+        print(f"  {ranker:<10}{row}{result['ms_per_query']:>11.3f}")
+
+    if args.verbose:
+        for item in queries:
+            print(f"\n{item['query']}")
+            for ranker in RANKERS:
+                top = discovery.find_agent(item['query'], top_n=3, ranker=ranker)
+                print(f"  {ranker:<8} " + ", ".join(f"{name} ({score:.2f})" for name, score in top))
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
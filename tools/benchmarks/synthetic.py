@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generators shared by the benchmarks
+Builds large agent catalogs by recombining the real agents, and large
+SHARED_PROGRESS.md files in all three entry formats
+"""
+
+import re
+import sys
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from capability_discovery import AgentCapabilities, CapabilityDiscovery  # noqa: E402
+
+
+def synthetic_discovery(real: CapabilityDiscovery, agent_count: int, seed: int = 11) -> CapabilityDiscovery:
+    """Generate an in-memory catalog by recombining the real agents' capabilities"""
+    rng = random.Random(seed)
+    templates = list(real.agents.values())
+    discovery = CapabilityDiscovery(real.agents_dir)
+
+    for i in range(agent_count):
+        base = rng.choice(templates)
+        other = rng.choice(templates)
+        name = f"generated-agent-{i}"
+        description = f"{base.description} {' '.join(rng.sample(other.description.split(), 3))}"
+        specializations = base.specializations + other.specializations
+        technologies = base.technologies + other.technologies
+
+        discovery.agents[name] = AgentCapabilities(
+            name=name,
+            description=description,
+            category=base.category,
+            specializations=rng.sample(specializations, min(8, len(specializations))),
+            technologies=rng.sample(technologies, min(8, len(technologies))),
+            keywords=discovery._extract_keywords(description),
+        )
+
+        # Body text: the base agent's terms plus a slice of another agent's
+        body = dict(real.body_terms.get(base.name, {}))
+        other_terms = sorted(real.body_terms.get(other.name, {}).items())
+        for term, count in rng.sample(other_terms, min(50, len(other_terms))):
+            body[term] = body.get(term, 0) + count
+        discovery.body_terms[name] = body
+
+    return discovery
+
+
+def write_synthetic_catalog(agents_dir: Path, target_dir: Path, file_count: int, seed: int = 3) -> int:
+    """
+    Write file_count agent .mdc files derived from the real catalog
+
+    Every other file has its capabilities block renamed so discovery falls
+    back to inferring specializations and technologies from the content.
+
+    Returns:
+        Number of files written
+    """
+    rng = random.Random(seed)
+    sources = sorted(Path(agents_dir).rglob("*.mdc"))
+    contents = [source.read_text() for source in sources]
+
+    for i in range(file_count):
+        index = rng.randrange(len(sources))
+        content = re.sub(r'^name: (.+)$', rf'name: \1-gen-{i}', contents[index], count=1, flags=re.MULTILINE)
+        if i % 2:
+            content = content.replace('\ncapabilities:', '\nexplicit_capabilities:', 1)
+
+        category_dir = target_dir / sources[index].parent.name
+        category_dir.mkdir(parents=True, exist_ok=True)
+        (category_dir / f"{sources[index].stem}-gen-{i}.mdc").write_text(content)
+
+    return file_count
+
+
+PROGRESS_STATUSES = ['✅ Complete', '🔄 In Progress', '⚠️ Blocked', '❌ Failed', '🚧 Paused', '📋 Planned', 'Unknown']
+
+
+def synthetic_progress_entry(i: int, rng: random.Random, agents: list) -> str:
+    """
+    One progress entry: mostly markdown, with YAML and hybrid entries and
+    the awkward shapes real files contain (missing fields, duplicated or
+    run-together markers, values on the next line, odd spacing)
+    """
+    date = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    agent = rng.choice(agents)
+    kind = i % 20
+
+    if kind == 0:
+        return (f"---\nagent: {agent}\ntimestamp: \"{date} 10:00\"\nstatus: complete\ntask_id: T{i}\n"
+                f"duration_minutes: {rng.randint(1, 300)}\ndeliverables:\n  - path: src/y{i}.py\n    type: code\n"
+                f"metrics:\n  test_coverage: {rng.randint(50, 100)}\n---\n\n")
+    if kind == 1:
+        return (f"---\nagent: {agent}\nstatus: in_progress\n---\n\n"
+                f"## {date} 11:00 - @{agent}: Hybrid task {i}\n\n### Context\nContext for {i}\n\n"
+                f"**Deliverables**:\n- `docs/h{i}.md` - notes\n\n")
+
+    time = f" {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}" if rng.random() < 0.8 else ""
+    lines = [f"## {date}{time} - @{agent}: Task number {i}", ""]
+
+    status = rng.choice(PROGRESS_STATUSES)
+    if kind == 2:
+        lines.append(f"**Status**:\n{status}")
+    elif kind == 3:
+        lines.append(f"**Status**Task ID**: T-{i}")
+    elif kind != 4:
+        lines.append(f"**Status**: {status} | **Task ID**: T-{i}")
+    if rng.random() < 0.7:
+        lines.append(f"**Duration**: {rng.randint(0, 5)}h {rng.randint(0, 59)}m")
+    elif rng.random() < 0.5:
+        lines.append("**Duration**: unknown")
+    if rng.random() < 0.6:
+        lines.append(f"**Progress**: {rng.randint(0, 100)}%")
+    lines.append("")
+
+    if rng.random() < 0.8:
+        lines.append("**Deliverables**:")
+        for d in range(rng.randint(1, 4)):
+            lines.append(f"- `src/file{i}_{d}.py` (type: code) - implementation {d}")
+        lines.append("- plain item without a path")
+        lines.append("")
+    if rng.random() < 0.7:
+        lines.append("**Metrics** (final):" if rng.random() < 0.5 else "**Metrics**:")
+        lines.append(f"- Test Coverage: {rng.randint(40, 100)}%")
+        lines.append(f"- Lines Changed: {rng.randint(10, 999)}")
+        lines.append(f"- ratio: 0.{rng.randint(1, 9)}")
+        lines.append("- note: ok")
+        lines.append("")
+    if kind == 5:
+        lines.append("Follow-up: see **Status**: ✅ Complete in the next entry and **Progress**: 100%")
+        lines.append("")
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_synthetic_progress(path: Path, entry_count: int, seed: int = 5, agents_dir: Path = Path('agents')) -> int:
+    """
+    Write a SHARED_PROGRESS.md with entry_count entries
+
+    Returns:
+        Bytes written
+    """
+    rng = random.Random(seed)
+    agents = sorted(source.stem for source in Path(agents_dir).rglob("*.mdc")) or ['backend-architect']
+
+    with open(path, 'w') as f:
+        f.write("# Shared Progress\n\nProject log.\n\n")
+        for i in range(entry_count):
+            f.write(synthetic_progress_entry(i, rng, agents))
+    return Path(path).stat().st_size
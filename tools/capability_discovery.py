@@ -4,13 +4,68 @@ Agent Capability Discovery System
 Scans agent definitions and provides intelligent agent selection based on capabilities
 """
 
+import os
 import re
-import yaml
+import math
 import json
+import heapq
+import hashlib
+import itertools
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
-from dataclasses import dataclass, field, asdict
-from collections import defaultdict
+from dataclasses import dataclass, field, fields, asdict
+from collections import defaultdict, Counter
+
+from agent_inference import get_inferrer
+from yaml_utils import YAMLError, load_cached
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch scoring falls back to pure Python
+    np = None
+
+
+# Bump whenever the parsed representation changes so stale index files are ignored
+INDEX_VERSION = 2
+DEFAULT_INDEX_FILE = ".capability_index.json"
+
+RANKERS = ('legacy', 'bm25')
+
+FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---', re.DOTALL | re.MULTILINE)
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'the', 'this', 'but', 'they', 'have'
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms, dropping stop words and single characters"""
+    return [
+        term for term in TOKEN_PATTERN.findall(text.lower())
+        if len(term) > 1 and term not in STOP_WORDS
+    ]
+
+
+def rank_scores(scores: Dict[str, float], agent_order: Dict[str, int],
+                top_n: int) -> List[Tuple[str, float]]:
+    """
+    Rank scored agents, padding with zero-score agents up to top_n
+
+    Ties keep agent_order, matching a stable sort over all agents.
+    """
+    key = lambda item: (-item[1], agent_order[item[0]])
+
+    if 0 < top_n <= len(scores):
+        return heapq.nsmallest(top_n, scores.items(), key=key)
+
+    ranked = sorted(scores.items(), key=key)
+    ranked.extend((name, 0.0) for name in agent_order if name not in scores)
+    return ranked[:top_n]
 
 
 @dataclass
@@ -49,9 +104,17 @@ class AgentCapabilities:
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
         data = asdict(self)
-        data['keywords'] = list(self.keywords)  # Convert set to list
+        data['keywords'] = sorted(self.keywords)  # Convert set to list (sorted for stable output)
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AgentCapabilities':
+        """Rebuild capabilities from a dictionary produced by to_dict()"""
+        known = {f.name for f in fields(cls)}
+        values = {key: value for key, value in data.items() if key in known}
+        values['keywords'] = set(values.get('keywords', []))
+        return cls(**values)
+
     def matches_requirement(self, requirement: str) -> float:
         """
         Calculate match score (0-1) for a given requirement
@@ -94,20 +157,458 @@ class AgentCapabilities:
         return score / max_score if max_score > 0 else 0.0
 
 
+class InvertedIndex:
+    """
+    Term-level index reproducing AgentCapabilities.matches_requirement()
+
+    Specializations, technologies and keywords score when they occur inside
+    the requirement, so they are stored as term -> posting lists and found by
+    looking up the requirement's substrings of each indexed term length.
+    Descriptions score when a requirement word occurs inside them, so they are
+    indexed by character n-grams and candidates are verified before scoring.
+    A query therefore only touches postings for terms it actually contains.
+    """
+
+    NGRAM_SIZE = 3
+
+    # Field weights mirror matches_requirement(): 3/2/2/1 out of 8
+    SPECIALIZATION_WEIGHT = 3.0
+    TECHNOLOGY_WEIGHT = 2.0
+    KEYWORD_WEIGHT = 0.5
+    MAX_KEYWORD_SCORE = 2.0
+    DESCRIPTION_WEIGHT = 1.0
+    MAX_SCORE = SPECIALIZATION_WEIGHT + TECHNOLOGY_WEIGHT + MAX_KEYWORD_SCORE + DESCRIPTION_WEIGHT
+
+    def __init__(self):
+        self.agent_order: Dict[str, int] = {}
+        self.postings: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        self.term_lengths: Set[int] = set()
+        self.ngram_postings: Dict[str, Set[str]] = defaultdict(set)
+        self.descriptions: Dict[str, str] = {}
+
+    @classmethod
+    def build(cls, agents: List[AgentCapabilities]) -> 'InvertedIndex':
+        """Build an index over agents (order defines tie-breaking)"""
+        index = cls()
+        for capabilities in agents:
+            index.add(capabilities)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.agent_order)
+
+    def add(self, capabilities: AgentCapabilities) -> None:
+        """Add one agent's specializations, technologies, keywords and description"""
+        name = capabilities.name
+        self.agent_order.setdefault(name, len(self.agent_order))
+
+        for field_name, terms in (('specialization', capabilities.specializations),
+                                  ('technology', capabilities.technologies),
+                                  ('keyword', capabilities.keywords)):
+            for term in terms:
+                term = term.lower()
+                self.postings[term].append((name, field_name))
+                self.term_lengths.add(len(term))
+
+        description = capabilities.description.lower()
+        self.descriptions[name] = description
+        for size in range(1, self.NGRAM_SIZE + 1):
+            for start in range(len(description) - size + 1):
+                self.ngram_postings[description[start:start + size]].add(name)
+
+    def _description_matches(self, word: str) -> Set[str]:
+        """Agents whose description contains word as a substring"""
+        if len(word) <= self.NGRAM_SIZE:
+            return self.ngram_postings.get(word, set())
+
+        candidates = None
+        for start in range(len(word) - self.NGRAM_SIZE + 1):
+            agents = self.ngram_postings.get(word[start:start + self.NGRAM_SIZE])
+            if not agents:
+                return set()
+            candidates = set(agents) if candidates is None else candidates & agents
+
+        return {name for name in candidates if word in self.descriptions[name]}
+
+    def score(self, requirement: str) -> Dict[str, float]:
+        """
+        Score every agent that matches the requirement
+
+        Returns:
+            {agent_name: score} for agents with a non-zero score, identical to
+            matches_requirement() for the same agents
+        """
+        requirement_lower = requirement.lower()
+        length = len(requirement_lower)
+
+        substrings = {
+            requirement_lower[start:start + size]
+            for size in self.term_lengths
+            for start in range(length - size + 1)
+        }
+
+        specialization_hits: Set[str] = set()
+        technology_hits: Set[str] = set()
+        keyword_counts: Dict[str, int] = defaultdict(int)
+
+        for term in substrings:
+            for name, field_name in self.postings.get(term, ()):
+                if field_name == 'specialization':
+                    specialization_hits.add(name)
+                elif field_name == 'technology':
+                    technology_hits.add(name)
+                else:
+                    keyword_counts[name] += 1
+
+        description_hits: Set[str] = set()
+        for word in set(requirement_lower.split()):
+            description_hits |= self._description_matches(word)
+
+        scores = {}
+        for name in specialization_hits | technology_hits | set(keyword_counts) | description_hits:
+            # Accumulate in the same order as matches_requirement() so floats are identical
+            score = 0.0
+            if name in specialization_hits:
+                score += self.SPECIALIZATION_WEIGHT
+            if name in technology_hits:
+                score += self.TECHNOLOGY_WEIGHT
+            if keyword_counts.get(name):
+                score += min(self.MAX_KEYWORD_SCORE, keyword_counts[name] * self.KEYWORD_WEIGHT)
+            if name in description_hits:
+                score += self.DESCRIPTION_WEIGHT
+            scores[name] = score / self.MAX_SCORE
+
+        return scores
+
+    def rank(self, requirement: str, top_n: int) -> List[Tuple[str, float]]:
+        """Rank agents for a requirement, padding with zero-score agents"""
+        return rank_scores(self.score(requirement), self.agent_order, top_n)
+
+    def rank_batch(self, requirements: List[str], top_n: int) -> List[List[Tuple[str, float]]]:
+        """Rank agents for many requirements (substring scoring is not a term product)"""
+        return [self.rank(requirement, top_n) for requirement in requirements]
+
+
+class Bm25Index:
+    """
+    BM25 relevance ranking over agent descriptions, capabilities and body text
+
+    Field terms are combined into one weighted term frequency per agent
+    (specializations and technologies count more than body text). Corpus
+    statistics are computed once and every posting stores its final BM25
+    impact in compact arrays, so scoring a query is a sum over the postings
+    of its terms. Scores are normalized by the best achievable score for the
+    query so they stay in the 0-1 range used by the legacy scorer.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    FIELD_WEIGHTS = {
+        'specializations': 3.0,
+        'technologies': 2.0,
+        'description': 2.0,
+        'body': 1.0
+    }
+
+    def __init__(self):
+        self.agent_names: List[str] = []
+        self.agent_order: Dict[str, int] = {}
+        self.term_ids: Dict[str, int] = {}
+        self.idf = array('d')
+        self.posting_agents: List[array] = []
+        self.posting_impacts: List[array] = []
+        self.doc_lengths = array('d')
+
+    def __len__(self) -> int:
+        return len(self.agent_names)
+
+    @classmethod
+    def build(cls, agents: List[AgentCapabilities],
+              body_terms: Optional[Dict[str, Dict[str, int]]] = None) -> 'Bm25Index':
+        """
+        Build the index from agents and their body term counts
+
+        Args:
+            agents: Agents to index (order defines tie-breaking)
+            body_terms: Optional {agent_name: {term: count}} for the markdown body
+        """
+        index = cls()
+        body_terms = body_terms or {}
+        weighted_tfs = []
+
+        for capabilities in agents:
+            index.agent_order[capabilities.name] = len(index.agent_names)
+            index.agent_names.append(capabilities.name)
+
+            tf: Dict[str, float] = defaultdict(float)
+            for field_name, text in (('specializations', ' '.join(capabilities.specializations)),
+                                     ('technologies', ' '.join(capabilities.technologies)),
+                                     ('description', capabilities.description)):
+                for term in tokenize(text):
+                    tf[term] += cls.FIELD_WEIGHTS[field_name]
+            for term, count in body_terms.get(capabilities.name, {}).items():
+                tf[term] += count * cls.FIELD_WEIGHTS['body']
+
+            weighted_tfs.append(tf)
+            index.doc_lengths.append(sum(tf.values()))
+
+        agent_count = len(index.agent_names)
+        avg_length = (sum(index.doc_lengths) / agent_count) if agent_count else 0.0
+
+        # Invert agent -> term frequencies into term -> postings
+        postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for agent_id, tf in enumerate(weighted_tfs):
+            for term, frequency in tf.items():
+                postings[term].append((agent_id, frequency))
+
+        for term, entries in postings.items():
+            idf = math.log(1 + (agent_count - len(entries) + 0.5) / (len(entries) + 0.5))
+            agent_ids = array('I')
+            impacts = array('d')
+            for agent_id, frequency in entries:
+                length_norm = 1 - cls.B + cls.B * (index.doc_lengths[agent_id] / avg_length if avg_length else 1)
+                agent_ids.append(agent_id)
+                impacts.append(idf * frequency * (cls.K1 + 1) / (frequency + cls.K1 * length_norm))
+
+            index.term_ids[term] = len(index.idf)
+            index.idf.append(idf)
+            index.posting_agents.append(agent_ids)
+            index.posting_impacts.append(impacts)
+
+        return index
+
+    def max_score(self, terms: Set[str]) -> float:
+        """Upper bound of the raw score for a set of query terms"""
+        unseen_idf = math.log(1 + (len(self.agent_names) + 0.5) / 0.5)
+        return sum(
+            self.idf[self.term_ids[term]] if term in self.term_ids else unseen_idf
+            for term in terms
+        ) * (self.K1 + 1)
+
+    def score(self, requirement: str) -> Dict[str, float]:
+        """Score agents sharing at least one term with the requirement"""
+        terms = set(tokenize(requirement))
+        totals: Dict[int, float] = defaultdict(float)
+
+        for term in terms:
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                continue
+            for agent_id, impact in zip(self.posting_agents[term_id], self.posting_impacts[term_id]):
+                totals[agent_id] += impact
+
+        if not totals:
+            return {}
+
+        upper = self.max_score(terms)
+        return {self.agent_names[agent_id]: total / upper for agent_id, total in totals.items()}
+
+    def rank(self, requirement: str, top_n: int) -> List[Tuple[str, float]]:
+        """Rank agents for a requirement, padding with zero-score agents"""
+        return rank_scores(self.score(requirement), self.agent_order, top_n)
+
+    # Bounds on each NumPy chunk: expanded (requirement, posting) pairs and dense score rows
+    BATCH_CHUNK_PAIRS = 4_000_000
+    BATCH_CHUNK_ROWS = 1024
+
+    def rank_batch(self, requirements: List[str], top_n: int) -> List[List[Tuple[str, float]]]:
+        """
+        Rank agents for many requirements at once
+
+        With NumPy the postings form a sparse term-by-agent matrix (CSR) and
+        each chunk of requirements is scored as one sparse product: every
+        (requirement, term) pair is expanded to that term's postings and
+        summed into a dense requirements-by-agents block with a single
+        bincount, followed by a per-row partial sort for the top results.
+        Without NumPy each requirement is ranked in turn.
+        """
+        if np is None or not self.agent_names or not 0 < top_n < len(self.agent_names):
+            return [self.rank(requirement, top_n) for requirement in requirements]
+
+        indptr, indices, impacts = self._csr_arrays()
+        results: List[List[Tuple[str, float]]] = []
+
+        # Term ids per requirement; unknown terms only affect normalization
+        query_terms = [set(tokenize(requirement)) for requirement in requirements]
+        query_ids = [
+            np.fromiter((self.term_ids[t] for t in terms if t in self.term_ids), dtype=np.int64)
+            for terms in query_terms
+        ]
+        upper_bounds = np.array([self.max_score(terms) or 1.0 for terms in query_terms])
+        row_pairs = np.array([int((indptr[ids + 1] - indptr[ids]).sum()) for ids in query_ids],
+                             dtype=np.int64)
+
+        start = 0
+        while start < len(requirements):
+            # Grow the chunk until it would expand past the pair budget
+            end = start + 1
+            pairs = row_pairs[start]
+            while (end < len(requirements) and end - start < self.BATCH_CHUNK_ROWS
+                   and pairs + row_pairs[end] <= self.BATCH_CHUNK_PAIRS):
+                pairs += row_pairs[end]
+                end += 1
+
+            scores = self._score_chunk(query_ids[start:end], indptr, indices, impacts)
+            scores /= upper_bounds[start:end, None]
+            results.extend(self._top_rows(scores, top_n))
+            start = end
+
+        return results
+
+    def _csr_arrays(self):
+        """Concatenate postings into CSR arrays (term rows, agent columns)"""
+        lengths = np.fromiter((len(agents) for agents in self.posting_agents), dtype=np.int64,
+                              count=len(self.posting_agents))
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+
+        indices = np.empty(indptr[-1], dtype=np.int64)
+        impacts = np.empty(indptr[-1], dtype=np.float64)
+        for term_id, (agents, weights) in enumerate(zip(self.posting_agents, self.posting_impacts)):
+            indices[indptr[term_id]:indptr[term_id + 1]] = np.frombuffer(agents, dtype=np.uint32)
+            impacts[indptr[term_id]:indptr[term_id + 1]] = np.frombuffer(weights, dtype=np.float64)
+
+        return indptr, indices, impacts
+
+    def _score_chunk(self, query_ids: list, indptr, indices, impacts):
+        """Sparse (requirements x terms) @ (terms x agents) product for one chunk"""
+        agent_count = len(self.agent_names)
+        rows = np.repeat(np.arange(len(query_ids)), [len(ids) for ids in query_ids])
+        terms = np.concatenate(query_ids) if query_ids else np.empty(0, dtype=np.int64)
+
+        starts = indptr[terms]
+        lengths = indptr[terms + 1] - starts
+        total = int(lengths.sum())
+
+        # Gather positions of every posting of every (row, term) pair
+        offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        positions = offsets + np.arange(total)
+
+        flat = np.repeat(rows, lengths) * agent_count + indices[positions]
+        scores = np.bincount(flat, weights=impacts[positions], minlength=len(query_ids) * agent_count)
+        return scores.reshape(len(query_ids), agent_count)
+
+    def _top_rows(self, scores, top_n: int) -> List[List[Tuple[str, float]]]:
+        """Top results per row; ties break by agent order like rank_scores()"""
+        names = self.agent_names
+        kth = -np.partition(-scores, top_n - 1, axis=1)[:, top_n - 1]
+        results = []
+
+        for row, threshold in zip(scores, kth):
+            if threshold > 0:
+                candidates = np.flatnonzero(row >= threshold)
+            else:
+                # Pad with zero-score agents in index order
+                candidates = np.concatenate((np.flatnonzero(row > 0), np.flatnonzero(row <= 0)[:top_n]))
+            order = candidates[np.lexsort((candidates, -row[candidates]))][:top_n]
+            results.append([(names[agent_id], float(row[agent_id])) for agent_id in order])
+
+        return results
+
+
+# Generation numbers are unique across registries, so a replaced registry never matches an old index
+_generations = itertools.count(1)
+
+
+class _AgentRegistry(dict):
+    """
+    Agents by name, stamped with a new generation on every change
+
+    Ranking indexes remember the generation they were built from, so an
+    agent added, replaced or removed (even with the count unchanged) makes
+    them stale. An AgentCapabilities edited in place must be re-assigned
+    for the change to count.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.generation = next(_generations)
+
+    def _changed(self):
+        self.generation = next(_generations)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._changed()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
 class CapabilityDiscovery:
     """Discover and index agent capabilities"""
 
-    def __init__(self, agents_dir: str = "agents"):
+    def __init__(self, agents_dir: str = "agents", index_file: Optional[str] = None,
+                 ranker: str = "legacy", jobs: int = 1):
+        if ranker not in RANKERS:
+            raise ValueError(f"Unknown ranker '{ranker}' (choose from: {', '.join(RANKERS)})")
+
         self.agents_dir = Path(agents_dir)
-        self.agents: Dict[str, AgentCapabilities] = {}
+        self.index_file = Path(index_file) if index_file else None
+        self.ranker = ranker
+        self.jobs = jobs
+        self.agents = {}
         self.categories: Dict[str, List[str]] = defaultdict(list)
         self.specialization_index: Dict[str, List[str]] = defaultdict(list)
         self.technology_index: Dict[str, List[str]] = defaultdict(list)
 
+        # File fingerprints (path -> mtime/size/hash/agent) used to invalidate the index
+        self.file_fingerprints: Dict[str, Dict] = {}
+
+        # Term counts of each agent's markdown body, used by the BM25 ranker
+        self.body_terms: Dict[str, Dict[str, int]] = {}
+
+        # Ranking indexes used by find_agent(), rebuilt whenever the agents change
+        self.term_index: Optional[InvertedIndex] = None
+        self.bm25_index: Optional[Bm25Index] = None
+        self._index_generations: Dict[str, int] = {}   # ranker -> agents generation its index was built from
+
+    @property
+    def agents(self) -> Dict[str, AgentCapabilities]:
+        """Agents by name (changes to it invalidate the ranking indexes)"""
+        return self._agents
+
+    @agents.setter
+    def agents(self, agents: Dict[str, AgentCapabilities]):
+        self._agents = _AgentRegistry(agents)
+
     def scan_all_agents(self) -> int:
         """
         Scan all .mdc files and extract capabilities
 
+        When an index file is configured, agents whose files are unchanged
+        (same mtime and size, or same content hash) are restored from the
+        index instead of being re-parsed, and the index is rewritten if
+        anything changed. With jobs > 1 the remaining files are parsed in a
+        process pool; results are merged in file order so the indexes are
+        identical to a serial scan.
+
         Returns:
             Number of agents discovered
         """
@@ -116,41 +617,233 @@ class CapabilityDiscovery:
         mdc_files = list(self.agents_dir.rglob("*.mdc"))
         print(f"Found {len(mdc_files)} agent files")
 
+        snapshot = self._read_index_file(self.index_file) if self.index_file else None
+        results: Dict[str, Dict] = {}
+        to_parse: List[Tuple[str, Optional[str]]] = []
+
+        # Unchanged files (same mtime and size) come straight from the index
         for mdc_file in mdc_files:
+            path_key = str(mdc_file)
+            cached = self._restorable_fingerprint(path_key, snapshot)
             try:
-                capabilities = self._parse_agent_file(mdc_file)
-                if capabilities:
-                    self.agents[capabilities.name] = capabilities
+                stat = mdc_file.stat()
+            except OSError as e:
+                results[path_key] = {'path': path_key, 'error': str(e)}
+                continue
+
+            if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                results[path_key] = self._restored_result(path_key, cached, snapshot)
+            else:
+                to_parse.append((path_key, cached['sha256'] if cached else None))
+
+        for result in self._parse_files(to_parse):
+            if result.get('unchanged'):
+                # Touched but identical content (e.g. git checkout): reuse with refreshed mtime
+                fingerprint = dict(result['fingerprint'], agent=snapshot['files'][result['path']]['agent'])
+                result = self._restored_result(result['path'], fingerprint, snapshot)
+            results[result['path']] = result
+
+        reused = 0
+        for mdc_file in mdc_files:
+            result = results[str(mdc_file)]
+            if 'error' in result:
+                print(f"Warning: Failed to parse {mdc_file}: {result['error']}")
+                continue
+
+            self.file_fingerprints[result['path']] = result['fingerprint']
+            reused += result['from_index']
+
+            capabilities = result['capabilities']
+            if capabilities:
+                if result['body_terms'] is not None:
+                    self.body_terms[capabilities.name] = result['body_terms']
+                self._index_agent(capabilities)
+
+        if reused:
+            print(f"Reused {reused} unchanged agents from {self.index_file}")
+        print(f"Successfully indexed {len(self.agents)} agents")
 
-                    # Index by category
-                    self.categories[capabilities.category].append(capabilities.name)
+        self._build_term_index()
 
-                    # Index by specializations
-                    for spec in capabilities.specializations:
-                        self.specialization_index[spec.lower()].append(capabilities.name)
+        if self.index_file and self._index_is_stale(snapshot, reused, len(mdc_files)):
+            try:
+                self._write_index(self.index_file)
+            except OSError as e:
+                print(f"Warning: Could not update index {self.index_file}: {e}")
 
-                    # Index by technologies
-                    for tech in capabilities.technologies:
-                        self.technology_index[tech.lower()].append(capabilities.name)
+        return len(self.agents)
 
-            except Exception as e:
-                print(f"Warning: Failed to parse {mdc_file}: {e}")
+    def _parse_files(self, to_parse: List[Tuple[str, Optional[str]]]) -> List[Dict]:
+        """Parse files serially or, with jobs > 1, in chunks across a process pool"""
+        if self.jobs <= 1 or len(to_parse) < 2:
+            return _parse_agent_files(to_parse)
+
+        # A few chunks per worker balances load while amortizing pickling
+        chunk_size = max(1, -(-len(to_parse) // (self.jobs * 4)))
+        chunks = [to_parse[i:i + chunk_size] for i in range(0, len(to_parse), chunk_size)]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            for chunk_results in executor.map(_parse_agent_files, chunks):
+                results.extend(chunk_results)
+        return results
+
+    def _index_agent(self, capabilities: AgentCapabilities) -> None:
+        """Add an agent to the name, category, specialization and technology indexes"""
+        self.agents[capabilities.name] = capabilities
+
+        # Index by category
+        self.categories[capabilities.category].append(capabilities.name)
+
+        # Index by specializations
+        for spec in capabilities.specializations:
+            self.specialization_index[spec.lower()].append(capabilities.name)
+
+        # Index by technologies
+        for tech in capabilities.technologies:
+            self.technology_index[tech.lower()].append(capabilities.name)
+
+    def _read_agent_file(self, file_path: Path, cached_digest: Optional[str] = None) -> Dict:
+        """
+        Read, fingerprint and parse one agent file
+
+        Returns:
+            Result dict with the file fingerprint, capabilities and body term
+            counts, {'unchanged': True} when the content hash equals
+            cached_digest, or {'error': ...} if the file could not be parsed
+        """
+        path_key = str(file_path)
+        try:
+            stat = file_path.stat()
+            raw = file_path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            fingerprint = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': digest,
+                'agent': None
+            }
+
+            if cached_digest == digest:
+                return {'path': path_key, 'fingerprint': fingerprint, 'unchanged': True}
+
+            content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            capabilities = self._parse_agent_file(file_path, content)
+            body_terms = None
+            if capabilities:
+                fingerprint['agent'] = capabilities.name
+                body_terms = self._count_body_terms(content)
+
+        except Exception as e:
+            return {'path': path_key, 'error': str(e)}
+
+        return {
+            'path': path_key,
+            'fingerprint': fingerprint,
+            'capabilities': capabilities,
+            'body_terms': body_terms,
+            'from_index': False
+        }
+
+    def _restorable_fingerprint(self, path_key: str, snapshot: Optional[Dict]) -> Optional[Dict]:
+        """Cached fingerprint for a file whose agent can be restored from the snapshot"""
+        cached = (snapshot or {}).get('files', {}).get(path_key)
+        if not cached:
+            return None
+        if cached['agent'] is not None and self._cached_capabilities(cached, snapshot, path_key) is None:
+            return None
+        return cached
+
+    def _restored_result(self, path_key: str, fingerprint: Dict, snapshot: Dict) -> Dict:
+        """Build a scan result for an agent restored from the index snapshot"""
+        capabilities = self._cached_capabilities(fingerprint, snapshot, path_key)
+        body_terms = None
+        if capabilities:
+            body_terms = snapshot.get('body_terms', {}).get(capabilities.name)
+        return {
+            'path': path_key,
+            'fingerprint': fingerprint,
+            'capabilities': capabilities,
+            'body_terms': body_terms,
+            'from_index': True
+        }
+
+    @staticmethod
+    def _count_body_terms(content: str) -> Dict[str, int]:
+        """Count terms in the markdown body following the frontmatter"""
+        frontmatter_match = FRONTMATTER_PATTERN.search(content)
+        body = content[frontmatter_match.end():] if frontmatter_match else content
+        return dict(Counter(tokenize(body)))
+
+    @staticmethod
+    def _cached_capabilities(cached: Dict, snapshot: Dict,
+                             path_key: str) -> Optional[AgentCapabilities]:
+        """Restore an agent from the snapshot if it still belongs to this file"""
+        agent_data = snapshot.get('agents', {}).get(cached.get('agent'))
+        if not agent_data or agent_data.get('file_path') != path_key:
+            return None
+        return AgentCapabilities.from_dict(agent_data)
+
+    def _index_is_stale(self, snapshot: Optional[Dict], reused: int, file_count: int) -> bool:
+        """Check whether the on-disk index differs from what was just scanned"""
+        if snapshot is None or reused != file_count:
+            return True
+        return snapshot.get('files') != self.file_fingerprints
+
+    @staticmethod
+    def _read_index_file(index_file: Path) -> Optional[Dict]:
+        """Read an index file, ignoring missing, corrupt or outdated ones"""
+        try:
+            with open(index_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION:
+            return None
+
+        return data
+
+    def load_index(self, index_file: str) -> int:
+        """
+        Load agents and lookup indexes from a file written by export_index()
+
+        Args:
+            index_file: Path to the exported JSON index
+
+        Returns:
+            Number of agents loaded
+        """
+        data = self._read_index_file(Path(index_file))
+        if data is None:
+            raise ValueError(f"Not a valid version {INDEX_VERSION} capability index: {index_file}")
+
+        self.agents = {
+            name: AgentCapabilities.from_dict(agent_data)
+            for name, agent_data in data['agents'].items()
+        }
+        self.categories = defaultdict(list, data.get('categories', {}))
+        self.specialization_index = defaultdict(list, data.get('specialization_index', {}))
+        self.technology_index = defaultdict(list, data.get('technology_index', {}))
+        self.file_fingerprints = data.get('files', {})
+        self.body_terms = data.get('body_terms', {})
+        self._build_term_index()
 
-        print(f"Successfully indexed {len(self.agents)} agents")
         return len(self.agents)
 
-    def _parse_agent_file(self, file_path: Path) -> Optional[AgentCapabilities]:
+    def _parse_agent_file(self, file_path: Path, content: Optional[str] = None) -> Optional[AgentCapabilities]:
         """Parse a single agent .mdc file"""
-        content = file_path.read_text()
+        if content is None:
+            content = file_path.read_text()
 
         # Extract YAML frontmatter
-        frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL | re.MULTILINE)
+        frontmatter_match = FRONTMATTER_PATTERN.search(content)
         if not frontmatter_match:
             return None
 
         try:
-            frontmatter = yaml.safe_load(frontmatter_match.group(1))
-        except yaml.YAMLError:
+            frontmatter = load_cached(frontmatter_match.group(1))
+        except YAMLError:
             return None
 
         name = frontmatter.get('name')
@@ -184,11 +877,14 @@ class CapabilityDiscovery:
             capabilities.version = cap_data.get('version', '1.0.0')
 
         # Infer capabilities from description and content if not explicitly defined
-        if not capabilities.specializations:
-            capabilities.specializations = self._infer_specializations(content)
-
-        if not capabilities.technologies:
-            capabilities.technologies = self._infer_technologies(content)
+        if not capabilities.specializations or not capabilities.technologies:
+            specializations, technologies = get_inferrer('discovery').infer(
+                content,
+                specializations=not capabilities.specializations,
+                technologies=not capabilities.technologies
+            )
+            capabilities.specializations = capabilities.specializations or specializations
+            capabilities.technologies = capabilities.technologies or technologies
 
         # Extract keywords from description
         capabilities.keywords = self._extract_keywords(capabilities.description)
@@ -197,69 +893,30 @@ class CapabilityDiscovery:
 
     def _infer_specializations(self, content: str) -> List[str]:
         """Infer specializations from content"""
-        specializations = []
-
-        # Common specialization patterns
-        patterns = {
-            'api_design': r'\b(REST|GraphQL|gRPC|API design|API development)\b',
-            'database': r'\b(database|SQL|NoSQL|PostgreSQL|MongoDB|Redis)\b',
-            'frontend': r'\b(React|Vue|Angular|frontend|UI|user interface)\b',
-            'backend': r'\b(backend|server|Node\.js|Python|microservices)\b',
-            'security': r'\b(security|authentication|authorization|encryption|OWASP)\b',
-            'performance': r'\b(performance|optimization|caching|scalability)\b',
-            'testing': r'\b(testing|QA|quality assurance|test automation)\b',
-            'devops': r'\b(DevOps|CI/CD|deployment|infrastructure|Docker|Kubernetes)\b',
-            'ml_ai': r'\b(machine learning|ML|AI|neural networks|NLP|computer vision)\b',
-            'data_engineering': r'\b(data pipeline|ETL|data processing|Apache Spark)\b',
-        }
-
-        for spec, pattern in patterns.items():
-            if re.search(pattern, content, re.IGNORECASE):
-                specializations.append(spec)
-
-        return specializations
+        return get_inferrer('discovery').infer_specializations(content)
 
     def _infer_technologies(self, content: str) -> List[str]:
         """Infer technologies from content"""
-        technologies = []
-
-        # Common technology keywords
-        tech_keywords = [
-            'JavaScript', 'TypeScript', 'Python', 'Java', 'Go', 'Rust', 'Ruby',
-            'Node.js', 'React', 'Vue', 'Angular', 'Django', 'Flask', 'Express',
-            'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch',
-            'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
-            'REST', 'GraphQL', 'gRPC', 'WebSocket',
-            'Git', 'GitHub', 'GitLab', 'Jenkins', 'CircleCI'
-        ]
-
-        for tech in tech_keywords:
-            if re.search(rf'\b{re.escape(tech)}\b', content, re.IGNORECASE):
-                technologies.append(tech)
-
-        return technologies
+        return get_inferrer('discovery').infer_technologies(content)
 
     def _extract_keywords(self, description: str) -> Set[str]:
         """Extract important keywords from description"""
         # Remove common words
-        stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'the', 'this', 'but', 'they', 'have'
-        }
-
         words = re.findall(r'\b\w+\b', description.lower())
-        keywords = {w for w in words if len(w) > 3 and w not in stop_words}
+        keywords = {w for w in words if len(w) > 3 and w not in STOP_WORDS}
 
         return keywords
 
-    def find_agent(self, requirement: str, top_n: int = 5) -> List[Tuple[str, float]]:
+    def find_agent(self, requirement: str, top_n: int = 5,
+                   ranker: Optional[str] = None) -> List[Tuple[str, float]]:
         """
         Find best matching agents for a requirement
 
         Args:
             requirement: Description of what's needed
             top_n: Number of top matches to return
+            ranker: 'legacy' (weighted substring matches) or 'bm25'
+                    (defaults to the ranker chosen at construction)
 
         Returns:
             List of (agent_name, match_score) tuples, sorted by score
@@ -267,6 +924,62 @@ class CapabilityDiscovery:
         if not self.agents:
             self.scan_all_agents()
 
+        return self._get_ranker(ranker or self.ranker).rank(requirement, top_n)
+
+    def find_agents_batch(self, requirements: List[str], top_n: int = 5,
+                          ranker: Optional[str] = None) -> List[List[Tuple[str, float]]]:
+        """
+        Find best matching agents for many requirements at once
+
+        The bm25 ranker scores the whole batch as a sparse matrix product
+        (vectorized when NumPy is installed); the legacy ranker scores
+        each requirement through its term index.
+
+        Args:
+            requirements: Descriptions of what's needed
+            top_n: Number of top matches per requirement
+            ranker: 'legacy' or 'bm25' (defaults to the ranker chosen at construction)
+
+        Returns:
+            One list of (agent_name, match_score) tuples per requirement
+        """
+        if not self.agents:
+            self.scan_all_agents()
+
+        return self._get_ranker(ranker or self.ranker).rank_batch(list(requirements), top_n)
+
+    def _get_ranker(self, ranker: str):
+        """Return the ranking index for a ranker, building it on first use"""
+        # Agents may have been added, replaced or removed directly; keep the indexes in sync
+        generation = self.agents.generation
+        if ranker == 'legacy':
+            if self.term_index is None or self._index_generations.get('legacy') != generation:
+                self._build_term_index()
+            return self.term_index
+
+        if ranker == 'bm25':
+            if self.bm25_index is None or self._index_generations.get('bm25') != generation:
+                self.bm25_index = Bm25Index.build(list(self.agents.values()), self.body_terms)
+                self._index_generations['bm25'] = generation
+            return self.bm25_index
+
+        raise ValueError(f"Unknown ranker '{ranker}' (choose from: {', '.join(RANKERS)})")
+
+    def _build_term_index(self) -> None:
+        """Build the legacy ranker's index from the current agents (the BM25 one is built on first use)"""
+        self.term_index = InvertedIndex.build(list(self.agents.values()))
+        self.bm25_index = None
+        self._index_generations = {'legacy': self.agents.generation}
+
+    def find_agent_linear(self, requirement: str, top_n: int = 5) -> List[Tuple[str, float]]:
+        """
+        Reference implementation of find_agent() scoring every agent in turn
+
+        Kept to verify the inverted index against matches_requirement().
+        """
+        if not self.agents:
+            self.scan_all_agents()
+
         scores = []
         for name, capabilities in self.agents.items():
             score = capabilities.matches_requirement(requirement)
@@ -357,8 +1070,15 @@ class CapabilityDiscovery:
         return team
 
     def export_index(self, output_file: str = "agent_capabilities_index.json") -> None:
-        """Export capability index to JSON"""
+        """Export capability index to JSON (reloadable with load_index())"""
+        self._write_index(Path(output_file))
+
+        print(f"Exported capability index to {output_file}")
+
+    def _write_index(self, output_file: Path) -> None:
+        """Atomically write the capability index and file fingerprints"""
         data = {
+            'version': INDEX_VERSION,
             'agents': {name: cap.to_dict() for name, cap in self.agents.items()},
             'categories': dict(self.categories),
             'specialization_index': dict(self.specialization_index),
@@ -368,13 +1088,16 @@ class CapabilityDiscovery:
                 'total_categories': len(self.categories),
                 'total_specializations': len(self.specialization_index),
                 'total_technologies': len(self.technology_index)
-            }
+            },
+            'files': self.file_fingerprints,
+            'body_terms': self.body_terms
         }
 
-        with open(output_file, 'w') as f:
+        # Write to a temp file and rename so concurrent readers never see a partial index
+        tmp_file = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
             json.dump(data, f, indent=2)
-
-        print(f"Exported capability index to {output_file}")
+        os.replace(tmp_file, output_file)
 
     def generate_capability_report(self) -> str:
         """Generate a human-readable capability report"""
@@ -433,6 +1156,12 @@ class CapabilityDiscovery:
         return "\n".join(report)
 
 
+def _parse_agent_files(chunk: List[Tuple[str, Optional[str]]]) -> List[Dict]:
+    """Read and parse a chunk of (path, cached_digest) agent files (process pool worker)"""
+    discovery = CapabilityDiscovery()
+    return [discovery._read_agent_file(Path(path), cached_digest) for path, cached_digest in chunk]
+
+
 def main():
     """CLI interface for capability discovery"""
     import argparse
@@ -440,6 +1169,8 @@ def main():
     parser = argparse.ArgumentParser(description='Agent Capability Discovery System')
     parser.add_argument('--scan', action='store_true', help='Scan and index all agents')
     parser.add_argument('--find', type=str, help='Find agents matching requirement')
+    parser.add_argument('--batch', type=str, help='Find agents for each requirement in a file (one per line)')
+    parser.add_argument('--batch-output', type=str, help='Write --batch results to a JSON file')
     parser.add_argument('--specialization', type=str, help='Find agents by specialization')
     parser.add_argument('--technology', type=str, help='Find agents by technology')
     parser.add_argument('--category', type=str, help='Find agents by category')
@@ -449,13 +1180,24 @@ def main():
     parser.add_argument('--export', type=str, help='Export index to JSON file')
     parser.add_argument('--agents-dir', type=str, default='agents', help='Agents directory')
     parser.add_argument('--top-n', type=int, default=5, help='Number of results to show')
+    parser.add_argument('--index', type=str,
+                        help=f'Persistent index file (default: <agents-dir>/{DEFAULT_INDEX_FILE})')
+    parser.add_argument('--no-index', action='store_true', help='Always re-parse every agent file')
+    parser.add_argument('--ranker', choices=RANKERS, default='legacy',
+                        help='Ranking used by --find/--recommend (default: legacy)')
+    parser.add_argument('--jobs', type=int, default=1, help='Parse agent files with N worker processes')
 
     args = parser.parse_args()
 
-    discovery = CapabilityDiscovery(args.agents_dir)
+    index_file = None
+    if not args.no_index:
+        index_file = args.index or os.path.join(args.agents_dir, DEFAULT_INDEX_FILE)
+
+    discovery = CapabilityDiscovery(args.agents_dir, index_file=index_file, ranker=args.ranker,
+                                    jobs=args.jobs)
 
     # Scan agents
-    if args.scan or args.report or args.find or args.recommend:
+    if args.scan or args.report or args.find or args.recommend or args.batch:
         discovery.scan_all_agents()
         print()
 
@@ -476,6 +1218,30 @@ def main():
                 print(f"       Specializations: {', '.join(capabilities.specializations[:3])}")
             print()
 
+    # Batch find
+    if args.batch:
+        with open(args.batch, 'r') as f:
+            requirements = [line.strip() for line in f if line.strip()]
+
+        results = discovery.find_agents_batch(requirements, top_n=args.top_n)
+
+        if args.batch_output:
+            with open(args.batch_output, 'w') as f:
+                json.dump([
+                    {
+                        'requirement': requirement,
+                        'matches': [{'agent': name, 'score': round(score, 4)} for name, score in matches]
+                    }
+                    for requirement, matches in zip(requirements, results)
+                ], f, indent=2)
+            print(f"Wrote matches for {len(requirements)} requirements to {args.batch_output}")
+        else:
+            for requirement, matches in zip(requirements, results):
+                print(f"🔍 {requirement}")
+                for agent_name, score in matches:
+                    print(f"  {score:.2f} - {agent_name}")
+                print()
+
     # Find by specialization
     if args.specialization:
         agents = discovery.find_by_specialization(args.specialization)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped bundle of full agent definitions
+Concatenates every agent definition into one file with an offset index and
+serves definitions (or just their frontmatter/body) as zero-copy memoryview
+slices, so concurrent tool processes share one page-cache copy
+"""
+
+import os
+import re
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+BUNDLE_FILENAME = "definitions.bundle"
+BUNDLE_MAGIC = b'AGDEFB01'
+HEADER = struct.Struct('<8sQQ')  # magic, index offset, index length
+SECTIONS = ('all', 'frontmatter', 'body')
+
+FRONTMATTER_PATTERN = re.compile(rb'^---\n(.*?)\n---', re.DOTALL | re.MULTILINE)
+
+
+def write_bundle(definitions: Iterable[Tuple[str, str]], bundle_file: Path) -> Path:
+    """
+    Write a bundle from (agent_name, definition_path) pairs
+
+    Layout: header, definitions back to back, then a JSON index mapping each
+    agent to its source fingerprint, offset, length and frontmatter length.
+
+    Returns:
+        Path of the written bundle
+    """
+    bundle_file = Path(bundle_file)
+    tmp_file = bundle_file.with_name(f"{bundle_file.name}.{os.getpid()}.tmp")
+    index: Dict[str, Dict] = {}
+
+    with open(tmp_file, 'wb') as out:
+        out.write(HEADER.pack(BUNDLE_MAGIC, 0, 0))
+
+        for name, path in definitions:
+            with open(path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+
+            match = FRONTMATTER_PATTERN.search(data)
+            index[name] = {
+                'path': str(path),
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'offset': out.tell(),
+                'length': len(data),
+                'frontmatter_length': match.end() if match else 0
+            }
+            out.write(data)
+
+        index_offset = out.tell()
+        index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        out.write(index_bytes)
+        out.seek(0)
+        out.write(HEADER.pack(BUNDLE_MAGIC, index_offset, len(index_bytes)))
+
+    os.replace(tmp_file, bundle_file)
+    return bundle_file
+
+
+class DefinitionBundle:
+    """
+    Read-only view over a definitions bundle
+
+    Slices returned by view() borrow the mapping; release them (or drop all
+    references) before calling close().
+    """
+
+    def __init__(self, bundle_file: Path):
+        self.bundle_file = Path(bundle_file)
+        self._file = open(self.bundle_file, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty definition bundle: {self.bundle_file}")
+
+        self._view = memoryview(self._mmap)
+        try:
+            magic, index_offset, index_length = HEADER.unpack_from(self._view)
+            if magic != BUNDLE_MAGIC:
+                raise ValueError(f"Not a definition bundle: {self.bundle_file}")
+            self.index: Dict[str, Dict] = json.loads(
+                str(self._view[index_offset:index_offset + index_length], 'utf-8')
+            )
+        except (struct.error, ValueError):
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, agent_name: str) -> bool:
+        return agent_name in self.index
+
+    def names(self) -> List[str]:
+        """Agent names in the bundle"""
+        return list(self.index)
+
+    def is_fresh(self, agent_name: str, path: Optional[str] = None) -> bool:
+        """
+        Check the bundled copy still matches its source file
+
+        Args:
+            agent_name: Agent to check
+            path: Expected source path (defaults to the path recorded at build time)
+        """
+        entry = self.index.get(agent_name)
+        if entry is None or (path is not None and os.path.normpath(path) != os.path.normpath(entry['path'])):
+            return False
+        try:
+            stat = os.stat(entry['path'])
+        except OSError:
+            return False
+        return stat.st_mtime_ns == entry['mtime_ns'] and stat.st_size == entry['size']
+
+    def view(self, agent_name: str, section: str = 'all') -> Optional[memoryview]:
+        """
+        Zero-copy slice of a bundled definition
+
+        Args:
+            agent_name: Agent to look up
+            section: 'all', 'frontmatter' (the leading --- block) or 'body' (everything after it)
+
+        Returns:
+            memoryview over UTF-8 bytes, or None if the agent is not bundled
+        """
+        if section not in SECTIONS:
+            raise ValueError(f"Unknown section '{section}' (choose from: {', '.join(SECTIONS)})")
+
+        entry = self.index.get(agent_name)
+        if entry is None:
+            return None
+
+        start = entry['offset']
+        end = start + entry['length']
+        if section == 'frontmatter':
+            end = start + entry['frontmatter_length']
+        elif section == 'body':
+            start += entry['frontmatter_length']
+        return self._view[start:end]
+
+    def read(self, agent_name: str, section: str = 'all') -> Optional[str]:
+        """Decoded copy of a bundled definition (or section)"""
+        view = self.view(agent_name, section)
+        if view is None:
+            return None
+        with view:
+            return str(view, 'utf-8')
+
+    def close(self):
+        """Unmap the bundle"""
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # Slices are still alive; the mapping is freed with them
+        self._file.close()
+
+
+def open_bundle(bundle_file: Path) -> Optional[DefinitionBundle]:
+    """Open a bundle, returning None if it is missing or invalid"""
+    try:
+        return DefinitionBundle(bundle_file)
+    except (OSError, ValueError) as e:
+        if Path(bundle_file).exists():
+            print(f"Warning: Could not open definition bundle {bundle_file}: {e}")
+        return None
@@ -4,16 +4,52 @@ Error Handling Utilities for AI Agent Ecosystem
 Provides reusable error handling patterns for all agents
 """
 
+import re
+import sys
 import time
+import heapq
+import random
 import json
 import os
+import gzip
+import shutil
+import atexit
+import asyncio
+import inspect
+import weakref
 import functools
+import threading
 import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Tuple, Dict, Any, Optional
+from typing import Callable, Iterable, Iterator, List, Tuple, Dict, Any, Optional, Union
 from enum import Enum
 
+try:
+    import fcntl
+except ImportError:  # Windows: batches rely on O_APPEND alone
+    fcntl = None
+
+# Error-handling event log (JSON lines)
+LOG_FILE = "workspaces/.logs/error_handling.log"
+LOG_FLUSH_EVENTS = 512       # Pending events that wake the flusher thread
+LOG_FLUSH_INTERVAL = 0.5     # Seconds between flushes of a partial batch
+LOG_MAX_PENDING = 65536      # Pending events at which emit() writes the batch itself
+LOG_MAX_BYTES = 10 * 1024 * 1024   # Rotate the log before it grows past this size
+LOG_MAX_AGE = 7 * 24 * 3600        # ...or once its first event is this many seconds old
+LOG_BACKUPS = 10                   # Rotated segments kept (oldest deleted first)
+LOG_ARCHIVE_STAMP = '%Y%m%dT%H%M%S.%f'
+
+# Hedged try_alternatives()
+HEDGE_LATENCY_WINDOW = 128   # Recent successful latencies kept per approach name
+HEDGE_MIN_SAMPLES = 10       # Latencies needed before hedge_percentile is used
+HEDGE_MAX_WORKERS = 32       # Threads shared by the hedges of all calls
+
+# retry_with_backoff() jitter
+JITTER_MODES = ('full', 'decorrelated')
+
 
 class ErrorType(Enum):
     """Error classification types"""
@@ -62,73 +98,297 @@ class CriticalError(AgentError):
         super().__init__(message, ErrorType.CRITICAL, severity, context)
 
 
+class RetryBudget:
+    """
+    Limit retries to a fraction of calls over a sliding window
+
+    Share one instance between retry_with_backoff decorators (e.g. every
+    operation hitting the same dependency) so that, when the dependency
+    fails, retries stop amplifying the load: once retries reach `ratio` of
+    the calls seen in the last `window` seconds (plus a floor of
+    min_retries_per_second, so rarely called operations can still retry),
+    further retries are refused and the call fails immediately.
+    Budgets are per process.
+    """
+
+    def __init__(self, ratio: float = 0.2, window: float = 10.0, min_retries_per_second: float = 1.0):
+        self.ratio = ratio
+        self.window = window
+        self.min_retries_per_second = min_retries_per_second
+        self._buckets: deque = deque()   # [second, calls, retries], oldest first
+        self._calls = 0
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def record_call(self) -> None:
+        """Count a new (first-attempt) call"""
+        with self._lock:
+            self._advance()[1] += 1
+            self._calls += 1
+
+    def try_retry(self) -> bool:
+        """Spend budget on one retry; False when the budget is exhausted"""
+        with self._lock:
+            bucket = self._advance()
+            if self._retries >= self.ratio * self._calls + self.min_retries_per_second * self.window:
+                return False
+            bucket[2] += 1
+            self._retries += 1
+            return True
+
+    def _advance(self) -> list:
+        """Drop buckets that left the window; returns the current one"""
+        second = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= second - self.window:
+            _, calls, retries = self._buckets.popleft()
+            self._calls -= calls
+            self._retries -= retries
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` tokens per second, bursts up to `capacity`
+
+    reserve() always grants a token but may put the bucket into debt and
+    returns how long the caller must wait before using it, so waiting
+    callers are served in arrival order and the wait works with either
+    time.sleep() or asyncio.sleep().
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens; returns seconds to wait before they may be used (0 when available)"""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens only if available right now"""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+_token_buckets: Dict[str, TokenBucket] = {}
+_token_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(operation: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """
+    The token bucket shared by every retry_with_backoff(rate_limit=...) of an operation name
+
+    The first caller's rate and capacity configure the bucket.
+    """
+    with _token_buckets_lock:
+        bucket = _token_buckets.get(operation)
+        if bucket is None:
+            bucket = _token_buckets[operation] = TokenBucket(rate, capacity)
+        return bucket
+
+
+def backoff_delay(attempt: int, base_delay: float, backoff_factor: float = 2,
+                  max_delay: Optional[float] = None, jitter: Optional[str] = None,
+                  previous_delay: Optional[float] = None) -> float:
+    """
+    Delay before retry number `attempt` (1 = after the first failure)
+
+    Args:
+        attempt: Failed attempt number
+        base_delay: Initial delay in seconds
+        backoff_factor: Multiplier for delay
+        max_delay: Upper bound on the delay
+        jitter: None (deterministic exponential), 'full' (uniform between 0
+            and the exponential delay) or 'decorrelated' (uniform between
+            base_delay and 3x the previous delay)
+        previous_delay: Delay returned for the previous attempt ('decorrelated' only)
+
+    Returns:
+        Delay in seconds
+    """
+    if jitter == 'decorrelated':
+        delay = random.uniform(base_delay, 3 * (previous_delay or base_delay))
+    else:
+        delay = base_delay * (backoff_factor ** (attempt - 1))
+    if max_delay is not None:
+        delay = min(delay, max_delay)
+    if jitter == 'full':
+        delay = random.uniform(0, delay)
+    return delay
+
+
 def retry_with_backoff(max_attempts: int = 3, base_delay: float = 1.0,
-                       backoff_factor: int = 2, exceptions: Tuple = (Exception,)):
+                       backoff_factor: int = 2, exceptions: Tuple = (Exception,),
+                       jitter: Optional[str] = None, max_delay: Optional[float] = None,
+                       retry_budget: Optional[RetryBudget] = None, rate_limit: Optional[float] = None,
+                       rate_burst: Optional[float] = None):
     """
     Decorator for retrying operations with exponential backoff
 
+    Coroutine functions are retried with asyncio.sleep() between attempts,
+    so waiting for a retry never blocks the event loop.
+
+    When many agents hit the same failing dependency, deterministic delays
+    make them retry in lockstep: use jitter to spread retries out, max_delay
+    to cap them, a shared retry_budget to stop retrying once retries make
+    up too much of the traffic, and rate_limit to pace every attempt of this
+    operation (one token bucket per function name, shared by all decorators
+    and threads in the process).
+
     Args:
         max_attempts: Maximum number of retry attempts
         base_delay: Initial delay in seconds
         backoff_factor: Multiplier for delay (default: 2 for exponential)
         exceptions: Tuple of exceptions to catch and retry
+        jitter: None, 'full' or 'decorrelated' (see backoff_delay())
+        max_delay: Upper bound on any single delay in seconds
+        retry_budget: RetryBudget shared with other operations
+        rate_limit: Attempts per second allowed for this operation name
+        rate_burst: Token bucket capacity (default: max(rate_limit, 1))
 
     Example:
         @retry_with_backoff(max_attempts=3, base_delay=1)
         def fetch_api_data():
             return api.get('/data')
+
+        @retry_with_backoff(max_attempts=3, base_delay=1)
+        async def fetch_api_data_async():
+            return await client.get('/data')
+
+        api_budget = RetryBudget(ratio=0.1)
+
+        @retry_with_backoff(max_attempts=5, base_delay=0.5, jitter='full', max_delay=30,
+                            retry_budget=api_budget, rate_limit=20)
+        def fetch_shared_resource():
+            return api.get('/shared')
     """
+    if jitter is not None and jitter not in JITTER_MODES:
+        raise ValueError(f"Unknown jitter '{jitter}' (choose from: {', '.join(JITTER_MODES)})")
+
     def decorator(func: Callable) -> Callable:
+        bucket = get_token_bucket(func.__name__, rate_limit, rate_burst) if rate_limit else None
+
+        def next_delay(attempt: int, e: Exception, previous_delay: Optional[float]) -> float:
+            """Log a failed attempt; raise after the last one, else return the delay before the next"""
+            if attempt < max_attempts and retry_budget is not None and not retry_budget.try_retry():
+                # Retrying now would only add load to a failing dependency
+                _log_recovery(
+                    operation=func.__name__,
+                    attempt=attempt,
+                    status="budget_exhausted",
+                    error=str(e)
+                )
+                raise RecoverableError(
+                    f"Retry budget exhausted after {attempt} attempts: {str(e)}",
+                    context={
+                        'function': func.__name__,
+                        'attempts': attempt,
+                        'error': str(e)
+                    }
+                ) from e
+
+            if attempt == max_attempts:
+                # Log failure after all retries
+                _log_recovery(
+                    operation=func.__name__,
+                    attempt=attempt,
+                    status="failed",
+                    error=str(e)
+                )
+                raise RecoverableError(
+                    f"Failed after {max_attempts} attempts: {str(e)}",
+                    context={
+                        'function': func.__name__,
+                        'attempts': max_attempts,
+                        'error': str(e)
+                    }
+                ) from e
+
+            # Calculate delay with exponential backoff
+            delay = backoff_delay(attempt, base_delay, backoff_factor, max_delay, jitter, previous_delay)
+
+            # Log retry attempt
+            _log_recovery(
+                operation=func.__name__,
+                attempt=attempt,
+                status="retrying",
+                delay=delay,
+                error=str(e)
+            )
+            return delay
+
+        def succeeded(attempt: int):
+            # Log successful recovery if not first attempt
+            if attempt > 1:
+                _log_recovery(
+                    operation=func.__name__,
+                    attempt=attempt,
+                    status="recovered"
+                )
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                delay = None
+                if retry_budget is not None:
+                    retry_budget.record_call()
+
+                for attempt in range(1, max_attempts + 1):
+                    if bucket is not None:
+                        await asyncio.sleep(bucket.reserve())
+                    try:
+                        result = await func(*args, **kwargs)
+                        succeeded(attempt)
+                        return result
+
+                    except exceptions as e:
+                        last_exception = e
+                        delay = next_delay(attempt, e, delay)
+                        await asyncio.sleep(delay)
+
+                # Should never reach here, but just in case
+                raise last_exception
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
+            delay = None
+            if retry_budget is not None:
+                retry_budget.record_call()
 
             for attempt in range(1, max_attempts + 1):
+                if bucket is not None:
+                    time.sleep(bucket.reserve())
                 try:
                     result = func(*args, **kwargs)
-
-                    # Log successful recovery if not first attempt
-                    if attempt > 1:
-                        _log_recovery(
-                            operation=func.__name__,
-                            attempt=attempt,
-                            status="recovered"
-                        )
-
+                    succeeded(attempt)
                     return result
 
                 except exceptions as e:
                     last_exception = e
-
-                    if attempt == max_attempts:
-                        # Log failure after all retries
-                        _log_recovery(
-                            operation=func.__name__,
-                            attempt=attempt,
-                            status="failed",
-                            error=str(e)
-                        )
-                        raise RecoverableError(
-                            f"Failed after {max_attempts} attempts: {str(e)}",
-                            context={
-                                'function': func.__name__,
-                                'attempts': max_attempts,
-                                'error': str(e)
-                            }
-                        ) from e
-
-                    # Calculate delay with exponential backoff
-                    delay = base_delay * (backoff_factor ** (attempt - 1))
-
-                    # Log retry attempt
-                    _log_recovery(
-                        operation=func.__name__,
-                        attempt=attempt,
-                        status="retrying",
-                        delay=delay,
-                        error=str(e)
-                    )
-
+                    delay = next_delay(attempt, e, delay)
                     time.sleep(delay)
 
             # Should never reach here, but just in case
@@ -138,12 +398,36 @@ def retry_with_backoff(max_attempts: int = 3, base_delay: float = 1.0,
     return decorator
 
 
-def try_alternatives(*approaches: Tuple[str, Callable]) -> Tuple[str, Any]:
+def try_alternatives(*approaches: Tuple[str, Callable], hedge_delay: Optional[float] = None,
+                     hedge_percentile: Optional[float] = None) -> Tuple[str, Any]:
     """
     Try multiple approaches in order until one succeeds
 
+    With hedge_delay or hedge_percentile set, approaches are hedged instead:
+    each runs in a background thread and, if it has not succeeded within
+    the hedge delay (or has failed), the next one is started alongside it.
+    The first success is returned; approaches still running are abandoned
+    (threads cannot be cancelled, so their results are discarded) and log
+    how much later they finished as latency_saved_seconds. The hedge delay
+    counts from when an approach starts running, not when it is queued.
+
+    An approach started while nothing else is running (the first, or the
+    next after every running one failed) gets a thread of its own, standing
+    in for the blocked caller. Hedges run in a shared pool of
+    HEDGE_MAX_WORKERS threads, which abandoned hedges keep busy until they
+    return; when no worker is free the hedge is skipped (logged with status
+    "hedge_skipped") and tried again after another hedge delay.
+
+    hedge_percentile picks the delay from the recent successful latencies
+    of the approach being waited on (tracked per approach name), e.g. 95
+    hedges once it is slower than 95% of its recent calls; until
+    HEDGE_MIN_SAMPLES latencies are known, hedge_delay (or no hedging) is
+    used instead.
+
     Args:
         approaches: Variable number of (name, function) tuples
+        hedge_delay: Seconds to wait for an approach before starting the next
+        hedge_percentile: Latency percentile (0-100) to use as the hedge delay
 
     Returns:
         (approach_name, result) tuple
@@ -157,12 +441,24 @@ def try_alternatives(*approaches: Tuple[str, Callable]) -> Tuple[str, Any]:
             ("Cache", lambda: fetch_from_cache()),
             ("Database", lambda: fetch_from_db())
         )
+
+        # Start the cache too if the API is slower than its usual p95
+        name, data = try_alternatives(
+            ("API", lambda: fetch_from_api()),
+            ("Cache", lambda: fetch_from_cache()),
+            hedge_delay=0.5, hedge_percentile=95
+        )
     """
+    if hedge_delay is not None or hedge_percentile is not None:
+        return _hedged_alternatives(approaches, hedge_delay, hedge_percentile)
+
     errors = []
 
     for name, approach_func in approaches:
         try:
+            started = time.perf_counter()
             result = approach_func()
+            _record_latency(name, time.perf_counter() - started)
 
             # Log successful alternative
             _log_alternative(
@@ -197,6 +493,286 @@ def try_alternatives(*approaches: Tuple[str, Callable]) -> Tuple[str, Any]:
     )
 
 
+def _hedged_alternatives(approaches: Tuple[Tuple[str, Callable], ...], hedge_delay: Optional[float],
+                         hedge_percentile: Optional[float]) -> Tuple[str, Any]:
+    errors = []
+    running: Dict[Future, int] = {}   # future -> index in approaches
+    approach_started: List[Optional[float]] = [None] * len(approaches)   # Set once a thread picks it up
+    launched = 0
+    skipped_at: Optional[float] = None   # Last time a hedge found no free worker
+    started = time.perf_counter()
+
+    def run(index: int, pooled: bool):
+        # Returns the latency with the result, so losers can report it too
+        try:
+            approach_started[index] = time.perf_counter()
+            result = approaches[index][1]()
+            return result, time.perf_counter() - approach_started[index]
+        finally:
+            if pooled:
+                _hedge_slots.release()
+
+    def launch():
+        """Start the next approach (a hedge only if a pool worker is free)"""
+        nonlocal launched, skipped_at
+        if not running:
+            future = _run_in_thread(run, launched, False)
+        elif _hedge_slots.acquire(blocking=False):
+            future = _hedge_executor().submit(run, launched, True)
+        else:
+            if skipped_at is None:
+                _log_alternative(
+                    approach=approaches[launched][0],
+                    attempted_count=launched,
+                    total_approaches=len(approaches),
+                    status="hedge_skipped",
+                    error=f"all {HEDGE_MAX_WORKERS} hedge workers busy"
+                )
+            skipped_at = time.perf_counter()
+            return
+        running[future] = launched
+        launched += 1
+
+    def abandoned(future: Future, name: str, won_at: float):
+        error = future.exception()
+        if error is None:
+            _record_latency(name, future.result()[1])
+        _log_alternative(
+            approach=name,
+            attempted_count=launched,
+            total_approaches=len(approaches),
+            status="abandoned",
+            error=str(error) if error is not None else None,
+            latency_saved=time.perf_counter() - won_at
+        )
+
+    while running or launched < len(approaches):
+        if not running:
+            launch()
+            continue
+
+        timeout = None
+        if launched < len(approaches):
+            # Hedge on the most recently launched approach, timed from when it started running
+            # (or from the last hedge skipped for want of a worker)
+            index = list(running.values())[-1]
+            delay = _hedge_delay(approaches[index][0], hedge_delay, hedge_percentile)
+            if delay is not None:
+                now = time.perf_counter()
+                since = max(approach_started[index] or now, skipped_at or 0)
+                timeout = max(delay - (now - since), 0)
+
+        done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            if approach_started[list(running.values())[-1]] is not None:
+                launch()
+            continue
+
+        # Futures finishing together resolve in the order the approaches were given
+        for future in sorted(done, key=list(running).index):
+            name = approaches[running.pop(future)][0]
+            error = future.exception()
+            if error is None:
+                result, latency = future.result()
+                _record_latency(name, latency)
+                won_at = time.perf_counter()
+                _log_alternative(
+                    approach=name,
+                    attempted_count=launched,
+                    total_approaches=len(approaches),
+                    status="success",
+                    latency=won_at - started
+                )
+                for loser, index in running.items():
+                    loser.add_done_callback(functools.partial(abandoned, name=approaches[index][0], won_at=won_at))
+                return (name, result)
+
+            errors.append({
+                'approach': name,
+                'error': str(error),
+                'traceback': ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+            })
+
+            # Log failed attempt
+            _log_alternative(
+                approach=name,
+                attempted_count=len(errors),
+                total_approaches=len(approaches),
+                status="failed",
+                error=str(error)
+            )
+
+            # A failure is the strongest reason to hedge
+            if launched < len(approaches):
+                launch()
+
+    # All approaches failed
+    raise RecoverableError(
+        f"All {len(approaches)} approaches failed",
+        context={'errors': errors}
+    )
+
+
+_latencies: Dict[str, deque] = {}
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+_hedge_pool_lock = threading.Lock()
+_hedge_slots = threading.BoundedSemaphore(HEDGE_MAX_WORKERS)   # Pool threads not running an approach
+
+
+def _run_in_thread(func: Callable, *args) -> Future:
+    """Run func(*args) in a new daemon thread; returns its Future"""
+    future = Future()
+
+    def target():
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=target, name='hedge-primary', daemon=True).start()
+    return future
+
+
+def _record_latency(name: str, seconds: float):
+    window = _latencies.get(name)
+    if window is None:
+        window = _latencies.setdefault(name, deque(maxlen=HEDGE_LATENCY_WINDOW))
+    window.append(seconds)
+
+
+def _hedge_delay(name: str, hedge_delay: Optional[float], hedge_percentile: Optional[float]) -> Optional[float]:
+    """Seconds to wait on an approach before hedging (None: wait for it to finish)"""
+    if hedge_percentile is not None:
+        window = sorted(_latencies.get(name, ()))
+        if len(window) >= HEDGE_MIN_SAMPLES:
+            return window[min(int(len(window) * hedge_percentile / 100), len(window) - 1)]
+    return hedge_delay
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_pool
+    if _hedge_pool is None:
+        with _hedge_pool_lock:
+            if _hedge_pool is None:
+                _hedge_pool = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix='hedge')
+    return _hedge_pool
+
+
+def _reset_hedge_pool_after_fork():
+    global _hedge_pool, _hedge_pool_lock, _hedge_slots
+    _hedge_pool = None
+    _hedge_pool_lock = threading.Lock()
+    _hedge_slots = threading.BoundedSemaphore(HEDGE_MAX_WORKERS)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_hedge_pool_after_fork)
+
+
+async def async_try_alternatives(*approaches: Tuple[str, Callable], race: bool = False) -> Tuple[str, Any]:
+    """
+    try_alternatives() for coroutines
+
+    Each approach is a callable returning an awaitable (an async function or
+    a lambda calling one); plain callables that return a value also work but
+    run inline on the event loop. By default approaches are awaited in order
+    until one succeeds. With race=True they all start at once: the first to
+    succeed wins and the rest are cancelled.
+
+    Args:
+        approaches: Variable number of (name, function) tuples
+        race: Run every approach concurrently instead of in order
+
+    Returns:
+        (approach_name, result) tuple
+
+    Raises:
+        RecoverableError if all approaches fail
+
+    Example:
+        name, data = await async_try_alternatives(
+            ("API", lambda: fetch_from_api()),
+            ("Mirror", lambda: fetch_from_mirror()),
+            race=True
+        )
+    """
+    errors = []
+
+    def failed(name: str, e: BaseException):
+        errors.append({
+            'approach': name,
+            'error': str(e),
+            'traceback': ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+        })
+
+        # Log failed attempt
+        _log_alternative(
+            approach=name,
+            attempted_count=len(errors),
+            total_approaches=len(approaches),
+            status="failed",
+            error=str(e)
+        )
+
+    def succeeded(name: str):
+        # Log successful alternative
+        _log_alternative(
+            approach=name,
+            attempted_count=len(errors) + 1,
+            total_approaches=len(approaches),
+            status="success"
+        )
+
+    if not race:
+        for name, approach_func in approaches:
+            try:
+                result = await _call_maybe_async(approach_func)
+            except Exception as e:
+                failed(name, e)
+            else:
+                succeeded(name)
+                return (name, result)
+    else:
+        names = {}
+        for name, approach_func in approaches:
+            names[asyncio.ensure_future(_call_maybe_async(approach_func))] = name
+        pending = set(names)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Tasks finishing together resolve in the order the approaches were given
+                for task in sorted(done, key=list(names).index):
+                    # An approach cancelling itself is a failure; only our own
+                    # cancellation (raised by asyncio.wait) ends the race
+                    if task.cancelled():
+                        failed(names[task], asyncio.CancelledError("approach was cancelled"))
+                    elif task.exception() is None:
+                        succeeded(names[task])
+                        return (names[task], task.result())
+                    else:
+                        failed(names[task], task.exception())
+        finally:
+            # Cancel the losers (or everything, if we were cancelled ourselves)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    # All approaches failed
+    raise RecoverableError(
+        f"All {len(approaches)} approaches failed",
+        context={'errors': errors}
+    )
+
+
+async def _call_maybe_async(func: Callable) -> Any:
+    result = func()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
 def with_graceful_degradation(critical_operations: List[str]):
     """
     Decorator for operations with graceful degradation
@@ -214,43 +790,56 @@ def with_graceful_degradation(critical_operations: List[str]):
             return result
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        def finished(result):
             degraded_mode = False
             missing_features = []
 
-            # Execute function with degradation tracking
-            try:
-                result = func(*args, **kwargs)
-
-                # Add degradation metadata if result is a dict
-                if isinstance(result, dict):
-                    result['_degraded_mode'] = degraded_mode
-                    result['_missing_features'] = missing_features
-
-                return result
+            # Add degradation metadata if result is a dict
+            if isinstance(result, dict):
+                result['_degraded_mode'] = degraded_mode
+                result['_missing_features'] = missing_features
 
-            except Exception as e:
-                operation_name = getattr(e, '__operation__', 'unknown')
-
-                if operation_name in critical_operations:
-                    # Critical operation failed - cannot degrade
-                    raise CriticalError(
-                        f"Critical operation failed: {operation_name}",
-                        context={
-                            'operation': operation_name,
-                            'error': str(e)
-                        }
-                    ) from e
-                else:
-                    # Optional operation failed - continue in degraded mode
-                    degraded_mode = True
-                    missing_features.append(operation_name)
-                    _log_degradation(operation_name, str(e))
+            return result
 
+        def handle_failure(e: Exception):
+            operation_name = getattr(e, '__operation__', 'unknown')
+
+            if operation_name in critical_operations:
+                # Critical operation failed - cannot degrade
+                raise CriticalError(
+                    f"Critical operation failed: {operation_name}",
+                    context={
+                        'operation': operation_name,
+                        'error': str(e)
+                    }
+                ) from e
+
+            # Optional operation failed - continue in degraded mode
+            _log_degradation(operation_name, str(e))
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                # Execute function with degradation tracking
+                try:
+                    return finished(await func(*args, **kwargs))
+                except Exception as e:
+                    handle_failure(e)
                     # Re-raise if not a dict result
                     raise
 
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Execute function with degradation tracking
+            try:
+                return finished(func(*args, **kwargs))
+            except Exception as e:
+                handle_failure(e)
+                # Re-raise if not a dict result
+                raise
+
         return wrapper
     return decorator
 
@@ -327,8 +916,7 @@ def with_checkpoint_recovery(task_id: str, checkpoint_interval: int = 100):
                 process_item(item)
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        def restore(kwargs: Dict) -> CheckpointManager:
             checkpoint_mgr = CheckpointManager(task_id)
 
             # Try to restore from checkpoint
@@ -336,7 +924,36 @@ def with_checkpoint_recovery(task_id: str, checkpoint_interval: int = 100):
             if state:
                 print(f"Resuming from checkpoint: {state}")
                 kwargs['_checkpoint_state'] = state
+            return checkpoint_mgr
+
+        def save(checkpoint_mgr: CheckpointManager, kwargs: Dict, e: Exception):
+            # Save checkpoint before failing
+            if '_checkpoint_state' in kwargs:
+                checkpoint_mgr.save_checkpoint(
+                    state=kwargs['_checkpoint_state'],
+                    description=f"Failed: {str(e)}"
+                )
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                checkpoint_mgr = restore(kwargs)
+                try:
+                    result = await func(*args, **kwargs)
+
+                    # Success - clear checkpoint
+                    checkpoint_mgr.clear_checkpoint()
+                    return result
+
+                except Exception as e:
+                    save(checkpoint_mgr, kwargs, e)
+                    raise
+
+            return async_wrapper
 
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            checkpoint_mgr = restore(kwargs)
             try:
                 result = func(*args, **kwargs)
 
@@ -345,12 +962,7 @@ def with_checkpoint_recovery(task_id: str, checkpoint_interval: int = 100):
                 return result
 
             except Exception as e:
-                # Save checkpoint before failing
-                if '_checkpoint_state' in kwargs:
-                    checkpoint_mgr.save_checkpoint(
-                        state=kwargs['_checkpoint_state'],
-                        description=f"Failed: {str(e)}"
-                    )
+                save(checkpoint_mgr, kwargs, e)
                 raise
 
         return wrapper
@@ -459,8 +1071,9 @@ def _log_recovery(operation: str, attempt: int, status: str,
 
 
 def _log_alternative(approach: str, attempted_count: int, total_approaches: int,
-                     status: str, error: Optional[str] = None) -> None:
-    """Log alternative approach attempts"""
+                     status: str, error: Optional[str] = None, latency: Optional[float] = None,
+                     latency_saved: Optional[float] = None) -> None:
+    """Log alternative approach attempts (hedged calls add latency / latency saved)"""
     log_entry = {
         'timestamp': datetime.now().isoformat(),
         'type': 'alternative_approach',
@@ -472,6 +1085,10 @@ def _log_alternative(approach: str, attempted_count: int, total_approaches: int,
 
     if error:
         log_entry['error'] = error
+    if latency is not None:
+        log_entry['latency_seconds'] = round(latency, 6)
+    if latency_saved is not None:
+        log_entry['latency_saved_seconds'] = round(latency_saved, 6)
 
     _write_log(log_entry)
 
@@ -504,13 +1121,426 @@ def _log_checkpoint(action: str, task_id: str, description: str = None) -> None:
     _write_log(log_entry)
 
 
-def _write_log(log_entry: Dict) -> None:
-    """Write log entry to error handling log file"""
-    log_file = Path("workspaces/.logs/error_handling.log")
-    log_file.parent.mkdir(parents=True, exist_ok=True)
+class LogSink:
+    """
+    Buffered, process-safe writer for error-handling log events
+
+    Events are queued in memory and written as JSON lines by a background
+    flusher thread once flush_events are pending or flush_interval seconds
+    have passed. Each batch is a single O_APPEND write made under an
+    exclusive flock, so processes sharing the log file never interleave
+    lines. If max_pending events pile up, emit() writes the batch itself
+    instead of dropping events. Pending events are flushed at exit, and
+    events emitted after close() are written immediately.
+
+    Before an event would push the log past max_bytes (a batch is split
+    across segments there), or once its first event is max_age seconds
+    old, the log is renamed to a timestamped archive
+    (<log>.<rotation time>-<pid>), gzipped and the oldest archives beyond
+    backups deleted. An event larger than max_bytes gets a segment to itself. Rotation happens under the same flock, and a
+    process whose open file was rotated away reopens the new log.
+    Pass max_bytes/max_age/backups of 0 or None to disable each limit.
+    """
+
+    def __init__(self, log_file: str = LOG_FILE, flush_events: int = LOG_FLUSH_EVENTS,
+                 flush_interval: float = LOG_FLUSH_INTERVAL, max_pending: int = LOG_MAX_PENDING,
+                 max_bytes: Optional[int] = LOG_MAX_BYTES, max_age: Optional[float] = LOG_MAX_AGE,
+                 backups: Optional[int] = LOG_BACKUPS, compress: bool = True):
+        self.log_file = Path(log_file).absolute()
+        self.flush_events = flush_events
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = backups
+        self.compress = compress
+        self._fd = None
+        self._reset()
+        _sinks.add(self)
+
+    def _reset(self):
+        """Fresh locks, buffer and flusher (also run in a forked child)"""
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()   # Keeps batches in emit order
+        self._pending: List[Dict] = []
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+        self._segment_start: Optional[float] = None
+        if self._fd is not None:
+            # A child must not share the parent's open file (flock is per open file)
+            os.close(self._fd)
+            self._fd = None
+
+    def emit(self, log_entry: Dict) -> None:
+        """Queue one event"""
+        with self._condition:
+            self._pending.append(log_entry)
+            pending = len(self._pending)
+            if self._closed:
+                pending = self.max_pending
+            elif self._flusher is None:
+                self._flusher = threading.Thread(target=self._run, name='error-log-flusher', daemon=True)
+                self._flusher.start()
+                _close_at_process_exit(self)
+            elif pending == self.flush_events:
+                self._condition.notify()
+
+        if pending >= self.max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every pending event now"""
+        with self._write_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._write(batch)
+
+    def rotate(self) -> Optional[Path]:
+        """
+        Flush, then archive the current log now (unless it is empty)
+
+        Returns:
+            Path of the new archive, or None when nothing was rotated
+        """
+        with self._write_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+            archive = self._write(batch)
+            return self._write([], force_rotate=True) or archive
+
+    def close(self) -> None:
+        """Flush, stop the flusher thread and close the log file"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush()
+        with self._write_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self.flush_events:
+                    self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+            self.flush()
+
+    def _write(self, batch: List[Dict], force_rotate: bool = False) -> Optional[Path]:
+        """Append one batch, rotating when due and wherever max_bytes is reached; returns the newest archive"""
+        lines = [(json.dumps(log_entry) + '\n').encode('utf-8') for log_entry in batch]
+
+        archives = []
+        self._lock_log()
+        try:
+            start = 0
+            check_due = True   # Forced and age-based rotation happen before the batch only
+            while True:
+                # The events that still fit in the current segment
+                size = os.fstat(self._fd).st_size
+                end, fill = start, size
+                while end < len(lines) and (not self.max_bytes or not fill
+                                            or fill + len(lines[end]) <= self.max_bytes):
+                    fill += len(lines[end])
+                    end += 1
+
+                full = start == end < len(lines)
+                if size and (full or (check_due and self._rotation_due(force_rotate))):
+                    archives.append(self._rotate_locked())
+                    check_due = False
+                    continue
+                check_due = False
+
+                data = b''.join(lines[start:end])
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(self._fd, view):]
+                if data and self._segment_start is None and os.fstat(self._fd).st_size == len(data):
+                    self._segment_start = time.time()
+
+                start = end
+                if start == len(lines):
+                    break
+        finally:
+            _flock(self._fd, False)
+
+        if not archives:
+            return None
+        if self.compress:
+            archives = [self._compress(archive) for archive in archives]
+        self._prune()
+        return archives[-1]
+
+    def _rotate_locked(self) -> Path:
+        """Rename the (locked) current log to an archive and lock a fresh log; returns the archive"""
+        archive = self.log_file.with_name(
+            f"{self.log_file.name}.{datetime.now().strftime(LOG_ARCHIVE_STAMP)}-{os.getpid()}")
+        os.rename(self.log_file, archive)
+        rotated_fd = self._fd
+        self._fd = None
+        self._lock_log()
+        _flock(rotated_fd, False)
+        os.close(rotated_fd)
+        return archive
+
+    def _lock_log(self):
+        """Open (if needed) and flock the current log, following rotations by other processes"""
+        while True:
+            if self._fd is None:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._segment_start = None
+            _flock(self._fd, True)
+            try:
+                if os.path.samestat(os.stat(self.log_file), os.fstat(self._fd)):
+                    return
+            except FileNotFoundError:
+                pass
+            # Rotated (or removed) since we opened it
+            _flock(self._fd, False)
+            os.close(self._fd)
+            self._fd = None
+
+    def _rotation_due(self, force: bool) -> bool:
+        """Whether a non-empty log is rotated before the next batch (max_bytes is checked per event)"""
+        if force:
+            return True
+        if self.max_age:
+            if self._segment_start is None:
+                self._segment_start = self._first_event_time()
+            return time.time() - self._segment_start >= self.max_age
+        return False
+
+    def _first_event_time(self) -> float:
+        """When the current log's first event was logged (now if unreadable)"""
+        try:
+            with open(self.log_file, 'rb') as f:
+                return datetime.fromisoformat(json.loads(f.readline())['timestamp']).timestamp()
+        except (OSError, ValueError, KeyError, TypeError):
+            return time.time()
+
+    def _compress(self, archive: Path) -> Path:
+        """gzip an archive in place (atomically); returns the compressed path"""
+        target = archive.with_name(archive.name + '.gz')
+        tmp = archive.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            with open(archive, 'rb') as src, gzip.open(tmp, 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(tmp, target)
+            os.unlink(archive)
+        except OSError:
+            # Pruned by another process meanwhile
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            return archive
+        return target
+
+    def _prune(self):
+        if not self.backups:
+            return
+        archives = [segment for segment in log_segments(self.log_file) if segment != self.log_file]
+        for archive in archives[:max(len(archives) - self.backups, 0)]:
+            try:
+                archive.unlink()
+            except FileNotFoundError:
+                pass
 
-    with open(log_file, 'a') as f:
-        f.write(json.dumps(log_entry) + '\n')
+
+def _flock(fd: int, exclusive: bool):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_UN)
+
+
+def log_segments(log_file: Union[str, Path] = LOG_FILE) -> List[Path]:
+    """
+    Rotated archives of a log, oldest first, followed by the current log (if it exists)
+
+    Args:
+        log_file: Current log file (archives sit next to it)
+
+    Returns:
+        Segment paths in time order
+    """
+    log_file = Path(log_file)
+    pattern = re.compile(rf'^{re.escape(log_file.name)}\.(\d{{8}}T\d{{6}}\.\d{{6}})-(\d+)(\.gz)?$')
+    archives = {}
+    if log_file.parent.is_dir():
+        for path in log_file.parent.iterdir():
+            match = pattern.match(path.name)
+            if match:
+                key = (match.group(1), int(match.group(2)))
+                # Mid-compression both exist: the .gz is complete
+                if match.group(3) or key not in archives:
+                    archives[key] = path
+
+    segments = [archives[key] for key in sorted(archives)]
+    if log_file.exists():
+        segments.append(log_file)
+    return segments
+
+
+def iter_log_events(log_file: Union[str, Path] = LOG_FILE, since: Union[datetime, str, None] = None,
+                    until: Union[datetime, str, None] = None, event_types: Optional[Iterable[str]] = None,
+                    ordered: bool = True) -> Iterator[Dict]:
+    """
+    Stream logged events from the rotated archives and the current log, oldest first
+
+    Segments are read in turn (archives are decompressed on the fly), and
+    archives rotated before `since` are skipped without being opened.
+    Batches from different processes can land slightly out of timestamp
+    order, so with ordered=True each segment is sorted and merged with the
+    tail of the previous one; at most two segments are held in memory,
+    which the rotation size bounds. (An event buffered for longer than it
+    takes to fill a whole segment can still come out late.) Lines that are
+    not valid JSON (such as a half-written last line) are skipped.
+
+    Args:
+        log_file: Current log file (archives sit next to it)
+        since: Only events at or after this time (datetime or ISO string)
+        until: Only events before this time
+        event_types: Only events with one of these 'type' values
+        ordered: Sort each segment by timestamp (False streams in file order)
+
+    Yields:
+        Event dicts
+    """
+    log_file = Path(log_file)
+    if isinstance(since, datetime):
+        since = since.isoformat()
+    if isinstance(until, datetime):
+        until = until.isoformat()
+    event_types = set(event_types) if event_types is not None else None
+    stamp_offset = len(log_file.name) + 1
+
+    def timestamp(event: Dict) -> str:
+        return event.get('timestamp', '')
+
+    held: List[Dict] = []   # Sorted events of the previous segment not yet yielded
+    for segment in log_segments(log_file):
+        if since and segment != log_file:
+            rotated = datetime.strptime(segment.name[stamp_offset:].split('-', 1)[0], LOG_ARCHIVE_STAMP)
+            if rotated.isoformat() < since:
+                continue
+
+        events = _read_segment(segment, since, until, event_types)
+        if not ordered:
+            yield from events
+            continue
+
+        events = sorted(events, key=timestamp)
+        if not events:
+            continue
+        # Held events older than this segment's first one can no longer be overtaken
+        cutoff = timestamp(events[0])
+        split = 0
+        while split < len(held) and timestamp(held[split]) <= cutoff:
+            split += 1
+        yield from held[:split]
+        held = list(heapq.merge(held[split:], events, key=timestamp))
+
+    yield from held
+
+
+def _read_segment(segment: Path, since: Optional[str], until: Optional[str],
+                  event_types: Optional[set]) -> Iterator[Dict]:
+    try:
+        f = gzip.open(segment, 'rt', encoding='utf-8') if segment.suffix == '.gz' \
+            else open(segment, encoding='utf-8')
+    except FileNotFoundError:
+        # Compressed (or pruned) after it was listed
+        compressed = segment.with_name(segment.name + '.gz')
+        if segment.suffix == '.gz' or not compressed.exists():
+            return
+        f = gzip.open(compressed, 'rt', encoding='utf-8')
+
+    with f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            timestamp = event.get('timestamp', '')
+            if since and timestamp < since:
+                continue
+            if until and timestamp >= until:
+                continue
+            if event_types is not None and event.get('type') not in event_types:
+                continue
+            yield event
+
+
+_sinks: 'weakref.WeakSet[LogSink]' = weakref.WeakSet()
+_default_sink: Optional[LogSink] = None
+_default_sink_lock = threading.Lock()
+
+
+def get_log_sink() -> LogSink:
+    """The process-wide sink behind the _log_* helpers (created on first use)"""
+    global _default_sink
+    if _default_sink is None:
+        with _default_sink_lock:
+            if _default_sink is None:
+                _default_sink = LogSink()
+    return _default_sink
+
+
+def set_log_sink(sink: Optional[LogSink]) -> Optional[LogSink]:
+    """
+    Replace the process-wide sink
+
+    Args:
+        sink: New sink, or None to create a default one on next use
+
+    Returns:
+        The previous sink (flushed)
+    """
+    global _default_sink
+    with _default_sink_lock:
+        previous, _default_sink = _default_sink, sink
+    if previous is not None:
+        previous.flush()
+    return previous
+
+
+def flush_logs() -> None:
+    """Write every buffered log event to disk"""
+    for sink in list(_sinks):
+        sink.flush()
+
+
+def _close_sinks():
+    for sink in list(_sinks):
+        sink.close()
+
+
+def _close_at_process_exit(sink: LogSink):
+    """multiprocessing workers leave through os._exit(), which skips atexit"""
+    if 'multiprocessing' in sys.modules:
+        from multiprocessing import util
+        util.Finalize(sink, sink.close, exitpriority=0)
+
+
+def _reset_sinks_after_fork():
+    for sink in list(_sinks):
+        sink._reset()
+
+
+atexit.register(_close_sinks)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_sinks_after_fork)
+
+
+def _write_log(log_entry: Dict) -> None:
+    """Queue log entry for the error handling log file"""
+    get_log_sink().emit(log_entry)
 
 
 # Example usage and tests
@@ -603,5 +1633,38 @@ if __name__ == '__main__':
 
     print(report)
 
+    # Example 5: Async retry and racing alternatives
+    print("\n5. Async Retry and Racing Alternatives:")
+
+    @retry_with_backoff(max_attempts=3, base_delay=0.1)
+    async def unstable_async_call(i):
+        import random
+        await asyncio.sleep(0.01)
+        if random.random() < 0.5:
+            raise ConnectionError("API temporarily unavailable")
+        return i
+
+    async def slow_source():
+        await asyncio.sleep(1)
+        return "primary"
+
+    async def fast_mirror():
+        await asyncio.sleep(0.05)
+        return "mirror"
+
+    async def async_examples():
+        results = await asyncio.gather(*(unstable_async_call(i) for i in range(20)), return_exceptions=True)
+        succeeded = sum(not isinstance(result, Exception) for result in results)
+        print(f"   {succeeded}/20 concurrent calls succeeded (retries shared one event loop)")
+
+        source, data = await async_try_alternatives(
+            ("Primary API", slow_source),
+            ("Mirror", fast_mirror),
+            race=True
+        )
+        print(f"   Raced alternatives, {source} won: {data}")
+
+    asyncio.run(async_examples())
+
     print("\n" + "=" * 60)
     print("Examples complete. Check workspaces/.logs/error_handling.log for logs")
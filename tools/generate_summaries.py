@@ -5,9 +5,14 @@ Creates lightweight .summary.yaml files for token efficiency
 """
 
 import re
-import yaml
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+from agent_inference import get_inferrer
+from summary_pack import write_pack
+from definition_bundle import BUNDLE_FILENAME, write_bundle
+from yaml_utils import YAMLError, load_cached, safe_dump
 
 
 def generate_summary(agent_file: Path) -> Optional[Dict]:
@@ -25,8 +30,8 @@ def generate_summary(agent_file: Path) -> Optional[Dict]:
         return None
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_match.group(1))
-    except yaml.YAMLError as e:
+        frontmatter = load_cached(frontmatter_match.group(1))
+    except YAMLError as e:
         print(f"YAML error in {agent_file}: {e}")
         return None
 
@@ -101,46 +106,28 @@ def generate_summary(agent_file: Path) -> Optional[Dict]:
 
 def _infer_specializations(content: str) -> list:
     """Infer specializations from content"""
-    specializations = []
-
-    patterns = {
-        'api_design': r'\b(REST|GraphQL|gRPC|API design|API development)\b',
-        'database': r'\b(database|SQL|NoSQL|PostgreSQL|MongoDB|Redis)\b',
-        'frontend': r'\b(React|Vue|Angular|frontend|UI|user interface)\b',
-        'backend': r'\b(backend|server|Node\.js|Python|microservices)\b',
-        'security': r'\b(security|authentication|authorization|encryption|OWASP)\b',
-        'performance': r'\b(performance|optimization|caching|scalability)\b',
-        'testing': r'\b(testing|QA|quality assurance|test automation)\b',
-        'devops': r'\b(DevOps|CI/CD|deployment|infrastructure|Docker|Kubernetes)\b',
-        'ml_ai': r'\b(machine learning|ML|AI|neural networks|NLP)\b',
-        'data_engineering': r'\b(data pipeline|ETL|data processing)\b',
-    }
-
-    for spec, pattern in patterns.items():
-        if re.search(pattern, content, re.IGNORECASE):
-            specializations.append(spec)
-
-    return specializations
+    return get_inferrer('summary').infer_specializations(content)
 
 
 def _infer_technologies(content: str) -> list:
     """Infer technologies from content"""
-    technologies = []
+    return get_inferrer('summary').infer_technologies(content)
 
-    tech_keywords = [
-        'JavaScript', 'TypeScript', 'Python', 'Java', 'Go', 'Rust',
-        'Node.js', 'React', 'Vue', 'Angular', 'Django', 'Flask',
-        'PostgreSQL', 'MySQL', 'MongoDB', 'Redis',
-        'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
-        'REST', 'GraphQL', 'gRPC',
-        'Git', 'GitHub'
-    ]
 
-    for tech in tech_keywords:
-        if re.search(rf'\b{re.escape(tech)}\b', content, re.IGNORECASE):
-            technologies.append(tech)
+def generate_summaries(agent_files: List[Path], jobs: int = 1) -> List[Optional[Dict]]:
+    """
+    Generate summaries for many agent files, optionally in a process pool
 
-    return technologies
+    Results are returned in the same order as agent_files; failures are
+    reported per file by generate_summary() and yield None.
+    """
+    if jobs <= 1 or len(agent_files) < 2:
+        return [generate_summary(agent_file) for agent_file in agent_files]
+
+    # A few chunks per worker balances load while amortizing pickling
+    chunk_size = max(1, -(-len(agent_files) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(generate_summary, agent_files, chunksize=chunk_size))
 
 
 def main():
@@ -151,6 +138,11 @@ def main():
     parser.add_argument('--output-dir', default='agents/summaries', help='Output directory')
     parser.add_argument('--force', action='store_true', help='Overwrite existing summaries')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', type=int, default=1, help='Parse agent files with N worker processes')
+    parser.add_argument('--no-pack', action='store_true',
+                        help='Do not write the single-file summary pack used by the lazy loader')
+    parser.add_argument('--no-bundle', action='store_true',
+                        help='Do not write the memory-mapped definition bundle used by the lazy loader')
 
     args = parser.parse_args()
 
@@ -172,10 +164,9 @@ def main():
     skipped = 0
     errors = 0
 
-    for agent_file in agent_files:
-        # Generate summary
-        summary = generate_summary(agent_file)
+    summaries = generate_summaries(agent_files, jobs=args.jobs)
 
+    for agent_file, summary in zip(agent_files, summaries):
         if not summary:
             errors += 1
             continue
@@ -193,7 +184,7 @@ def main():
         # Write summary
         try:
             with open(output_file, 'w') as f:
-                yaml.dump(summary, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                safe_dump(summary, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
             generated += 1
             if args.verbose or generated % 10 == 0:
@@ -212,6 +203,25 @@ def main():
     print(f"\n💾 Output directory: {output_dir}")
     print(f"📦 Total summaries: {len(list(output_dir.glob('*.summary.yaml')))}")
 
+    if not args.no_pack:
+        try:
+            pack_file = write_pack(output_dir)
+            print(f"🗜️  Summary pack: {pack_file}")
+        except Exception as e:
+            print(f"Error writing summary pack: {e}")
+            errors += 1
+
+    if not args.no_bundle:
+        try:
+            bundle_file = write_bundle(
+                ((summary['name'], summary['full_definition']) for summary in summaries if summary),
+                output_dir / BUNDLE_FILENAME
+            )
+            print(f"🗺️  Definition bundle: {bundle_file}")
+        except Exception as e:
+            print(f"Error writing definition bundle: {e}")
+            errors += 1
+
     return 0 if errors == 0 else 1
 
 
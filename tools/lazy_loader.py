@@ -4,10 +4,18 @@ Lazy loading system for agents
 Loads agent definitions on-demand to minimize token usage
 """
 
-import yaml
 from pathlib import Path
-from typing import Dict, Optional, Set, List
+from typing import Dict, Optional, Set, List, Tuple
 from dataclasses import dataclass, field
+from collections import OrderedDict
+
+from summary_pack import PACK_FILENAME, read_pack
+from definition_bundle import BUNDLE_FILENAME, open_bundle
+from agent_sections import AgentSection, index_sections
+from yaml_utils import safe_load
+
+
+EVICTION_POLICIES = ('lru', 'lfu')
 
 
 @dataclass
@@ -15,28 +23,74 @@ class AgentCache:
     """Cache for loaded agents"""
     summaries: Dict[str, Dict] = field(default_factory=dict)
     full_definitions: Dict[str, str] = field(default_factory=dict)
+    sections: Dict[str, Dict[str, str]] = field(default_factory=dict)  # agent -> section name -> text
     active_agents: Set[str] = field(default_factory=set)
 
+    # Eviction bookkeeping: ('summary'|'definition'|'sections', name) keys, least recent first
+    recency: OrderedDict = field(default_factory=OrderedDict)
+    access_counts: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    entry_tokens: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    cached_tokens: int = 0
+    evictions: Dict[str, int] = field(default_factory=lambda: {'summary': 0, 'definition': 0, 'sections': 0})
+    evicted_tokens: int = 0
+
 
 class LazyAgentLoader:
     """Lazy loading system for agents"""
 
-    def __init__(self, summaries_dir: str = "agents/summaries", agents_dir: str = "agents"):
+    def __init__(self, summaries_dir: str = "agents/summaries", agents_dir: str = "agents",
+                 token_budget: Optional[int] = None, eviction_policy: str = 'lru',
+                 use_bundle: bool = True):
+        """
+        Args:
+            summaries_dir: Directory holding *.summary.yaml files
+            agents_dir: Directory holding full agent definitions
+            token_budget: Evict inactive summaries/definitions once the cached
+                          ones exceed this many tokens (None = unbounded); the
+                          always-loaded directory is not counted
+            eviction_policy: 'lru' (least recently used) or 'lfu' (least frequently used)
+            use_bundle: Serve full definitions from the memory-mapped
+                        definitions.bundle in summaries_dir when it exists
+        """
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy '{eviction_policy}' "
+                             f"(choose from: {', '.join(EVICTION_POLICIES)})")
+
         self.summaries_dir = Path(summaries_dir)
         self.agents_dir = Path(agents_dir)
+        self.token_budget = token_budget
+        self.eviction_policy = eviction_policy
         self.cache = AgentCache()
         self.directory = {}
+        self._directory_tokens = 0
+        self._packed_summaries: Dict[str, Dict] = {}
+        self._section_index: Dict[str, List[AgentSection]] = {}
         self._load_directory()
+        self.bundle = open_bundle(self.summaries_dir / BUNDLE_FILENAME) if use_bundle else None
 
     def _load_directory(self):
         """Load agent directory (Tier 1) - always loaded"""
         self.directory = {}
+        self._packed_summaries = {}
 
         if not self.summaries_dir.exists():
             print(f"⚠️  Warning: Summaries directory not found: {self.summaries_dir}")
             print("   Run: python3 tools/generate_summaries.py")
             return
 
+        # Fast path: one read of the pack written by generate_summaries.py
+        pack = read_pack(self.summaries_dir)
+        if pack and pack['directory']:
+            for name, info in pack['directory'].items():
+                self.directory[name] = dict(info, summary_file=str(self.summaries_dir / info['summary_file']))
+            self._packed_summaries = pack['summaries']
+            self._directory_tokens = len(str(self.directory)) // 4
+            print(f"📚 Loaded directory with {len(self.directory)} agents (summary pack)")
+            return
+        if (self.summaries_dir / PACK_FILENAME).exists():
+            print("⚠️  Summary pack is out of date; reading per-agent YAML files")
+            print("   Run: python3 tools/generate_summaries.py")
+
         summary_files = list(self.summaries_dir.glob('*.summary.yaml'))
         if not summary_files:
             print(f"⚠️  Warning: No summary files found in {self.summaries_dir}")
@@ -46,7 +100,7 @@ class LazyAgentLoader:
         for summary_file in summary_files:
             try:
                 with open(summary_file, 'r') as f:
-                    summary = yaml.safe_load(f)
+                    summary = safe_load(f)
                     name = summary.get('name')
                     if name:
                         self.directory[name] = {
@@ -57,6 +111,8 @@ class LazyAgentLoader:
             except Exception as e:
                 print(f"Warning: Could not load {summary_file}: {e}")
 
+        self._directory_tokens = len(str(self.directory)) // 4
+
         if self.directory:
             print(f"📚 Loaded directory with {len(self.directory)} agents")
 
@@ -82,6 +138,7 @@ class LazyAgentLoader:
         """Load agent summary (Tier 2)"""
         # Check cache
         if agent_name in self.cache.summaries:
+            self._touch('summary', agent_name)
             return self.cache.summaries[agent_name]
 
         # Load from file
@@ -92,11 +149,16 @@ class LazyAgentLoader:
         summary_file = self.directory[agent_name]['summary_file']
 
         try:
-            with open(summary_file, 'r') as f:
-                summary = yaml.safe_load(f)
+            if agent_name in self._packed_summaries:
+                summary = self._packed_summaries[agent_name]
+            else:
+                with open(summary_file, 'r') as f:
+                    summary = safe_load(f)
 
             # Cache it
             self.cache.summaries[agent_name] = summary
+            self._track('summary', agent_name, summary)
+            self._enforce_budget()
             return summary
 
         except Exception as e:
@@ -107,8 +169,19 @@ class LazyAgentLoader:
         """Load full agent definition (Tier 3)"""
         # Check cache
         if agent_name in self.cache.full_definitions:
+            self._touch('definition', agent_name)
             return self.cache.full_definitions[agent_name]
 
+        # Pin the agent while loading, so making room for it cannot evict its own summary
+        pinned = agent_name not in self.cache.active_agents
+        self.cache.active_agents.add(agent_name)
+        full_definition = self._load_full_definition(agent_name)
+        if full_definition is None and pinned:
+            self.cache.active_agents.discard(agent_name)
+        return full_definition
+
+    def _load_full_definition(self, agent_name: str) -> Optional[str]:
+        """Read, cache and activate a definition that is not cached yet"""
         # Get summary first
         summary = self.load_summary(agent_name)
         if not summary:
@@ -122,12 +195,17 @@ class LazyAgentLoader:
             return None
 
         try:
-            with open(full_def_path, 'r') as f:
-                full_definition = f.read()
+            if self.bundle and self.bundle.is_fresh(agent_name, summary['full_definition']):
+                full_definition = self.bundle.read(agent_name)
+            else:
+                with open(full_def_path, 'r') as f:
+                    full_definition = f.read()
 
             # Cache it
             self.cache.full_definitions[agent_name] = full_definition
             self.cache.active_agents.add(agent_name)
+            self._track('definition', agent_name, full_definition)
+            self._enforce_budget()
 
             return full_definition
 
@@ -135,6 +213,134 @@ class LazyAgentLoader:
             print(f"Error loading full definition for {agent_name}: {e}")
             return None
 
+    def load_definition_view(self, agent_name: str, section: str = 'all') -> Optional[memoryview]:
+        """
+        Zero-copy view of a bundled definition (not cached or activated)
+
+        Args:
+            agent_name: Agent to look up
+            section: 'all', 'frontmatter' or 'body'
+
+        Returns:
+            memoryview over the UTF-8 definition in the mapped bundle, or None
+            when there is no bundle or the bundled copy is out of date
+        """
+        if not self.bundle or agent_name not in self.directory:
+            return None
+
+        summary = self.load_summary(agent_name)
+        if not summary or not self.bundle.is_fresh(agent_name, summary['full_definition']):
+            return None
+
+        return self.bundle.view(agent_name, section)
+
+    def list_sections(self, agent_name: str) -> Optional[List[Dict]]:
+        """
+        List the sections of an agent definition with per-section token estimates
+
+        Returns:
+            [{'name', 'level', 'tokens'}] in document order (a heading's tokens
+            include its subsections), or None if the definition is unavailable
+        """
+        index = self._get_section_index(agent_name)
+        if index is None:
+            return None
+        return [section.to_dict() for section in index]
+
+    def load_sections(self, agent_name: str, section_names: List[str]) -> Optional[str]:
+        """
+        Load only the named sections of an agent definition (between Tier 2 and Tier 3)
+
+        Args:
+            agent_name: Agent to load from
+            section_names: Heading titles (case-insensitive), 'frontmatter' or 'preamble'
+
+        Returns:
+            The requested sections in document order, or None if none were found
+        """
+        index = self._get_section_index(agent_name)
+        if index is None:
+            return None
+
+        wanted = {name.strip().casefold() for name in section_names}
+        selected = [section for section in index if section.name.casefold() in wanted]
+
+        missing = wanted - {section.name.casefold() for section in selected}
+        for name in sorted(missing):
+            print(f"⚠️  Section not found in {agent_name}: {name}")
+        if not selected:
+            return None
+
+        # A requested heading already includes any requested subsections
+        ranges = []
+        for section in selected:
+            if ranges and section.end <= ranges[-1].end:
+                continue
+            ranges.append(section)
+
+        # Sections are cached only once all of them were read (loading them does not activate the agent)
+        cached = self.cache.sections.get(agent_name, {})
+        new_sections = {}
+        parts = []
+        for section in ranges:
+            cache_key = f"{section.start}:{section.name}"
+            text = cached.get(cache_key)
+            if text is None:
+                text = self._read_definition_range(agent_name, section.start, section.end)
+                if text is None:
+                    return None
+                new_sections[cache_key] = text
+            parts.append(text)
+
+        key = ('sections', agent_name)
+        new_tokens = sum(len(text) // 4 for text in new_sections.values())
+        self.cache.sections.setdefault(agent_name, {}).update(new_sections)
+        self.cache.entry_tokens[key] = self.cache.entry_tokens.get(key, 0) + new_tokens
+        self.cache.cached_tokens += new_tokens
+        self._touch('sections', agent_name)
+        self._enforce_budget()
+
+        return ''.join(parts)
+
+    def _get_section_index(self, agent_name: str) -> Optional[List[AgentSection]]:
+        """Section index for an agent, built once from its definition"""
+        if agent_name in self._section_index:
+            return self._section_index[agent_name]
+
+        view = self.load_definition_view(agent_name)
+        if view is not None:
+            with view:
+                index = index_sections(view)
+        else:
+            summary = self.load_summary(agent_name)
+            if not summary:
+                return None
+            try:
+                with open(summary['full_definition'], 'rb') as f:
+                    index = index_sections(f.read())
+            except OSError as e:
+                print(f"⚠️  Warning: Could not read definition for {agent_name}: {e}")
+                return None
+
+        self._section_index[agent_name] = index
+        return index
+
+    def _read_definition_range(self, agent_name: str, start: int, end: int) -> Optional[str]:
+        """Decode bytes [start, end) of a definition from the bundle or its file"""
+        view = self.load_definition_view(agent_name)
+        if view is not None:
+            with view, view[start:end] as section:
+                return str(section, 'utf-8')
+
+        summary = self.load_summary(agent_name)
+        try:
+            with open(summary['full_definition'], 'rb') as f:
+                f.seek(start)
+                return f.read(end - start).decode('utf-8')
+        except (OSError, TypeError) as e:
+            print(f"Error loading sections for {agent_name}: {e}")
+            return None
+
     def activate_agent(self, agent_name: str) -> bool:
         """Activate an agent (load full definition)"""
         definition = self.load_full_definition(agent_name)
@@ -150,7 +356,8 @@ class LazyAgentLoader:
         if agent_name in self.cache.active_agents:
             self.cache.active_agents.discard(agent_name)
             print(f"⏸️  Deactivated: {agent_name}")
-            # Keep in cache for quick reactivation
+            # Keep in cache for quick reactivation, unless over the token budget
+            self._enforce_budget()
         else:
             print(f"⚠️  Agent not active: {agent_name}")
 
@@ -163,12 +370,62 @@ class LazyAgentLoader:
         self.cache = AgentCache()
         print("🧹 Cache cleared")
 
+    def _touch(self, kind: str, agent_name: str):
+        """Record an access for LRU/LFU eviction"""
+        key = (kind, agent_name)
+        self.cache.recency[key] = None
+        self.cache.recency.move_to_end(key)
+        self.cache.access_counts[key] = self.cache.access_counts.get(key, 0) + 1
+
+    def _track(self, kind: str, agent_name: str, value):
+        """Record a newly cached entry and its token estimate (same estimate as get_token_estimate)"""
+        tokens = len(str(value)) // 4 if kind == 'summary' else len(value) // 4
+        self.cache.entry_tokens[(kind, agent_name)] = tokens
+        self.cache.cached_tokens += tokens
+        self._touch(kind, agent_name)
+
+    def _enforce_budget(self):
+        """Evict inactive summaries and definitions until within the token budget"""
+        if self.token_budget is None:
+            return
+
+        if self.cache.cached_tokens <= self.token_budget:
+            return
+
+        # Active agents are pinned: neither their definition nor summary is evicted
+        candidates = [
+            key for key in self.cache.recency
+            if key[1] not in self.cache.active_agents
+        ]
+        if self.eviction_policy == 'lfu':
+            # Least frequently used first; recency breaks ties (sort is stable)
+            candidates.sort(key=lambda key: self.cache.access_counts.get(key, 0))
+
+        for key in candidates:
+            if self.cache.cached_tokens <= self.token_budget:
+                break
+
+            kind, agent_name = key
+            store = {
+                'summary': self.cache.summaries,
+                'definition': self.cache.full_definitions,
+                'sections': self.cache.sections
+            }[kind]
+            del store[agent_name]
+            del self.cache.recency[key]
+            self.cache.access_counts.pop(key, None)
+            tokens = self.cache.entry_tokens.pop(key)
+
+            self.cache.evictions[kind] += 1
+            self.cache.evicted_tokens += tokens
+            self.cache.cached_tokens -= tokens
+
     def get_token_estimate(self) -> Dict:
         """Estimate current token usage"""
         # Rough estimates: 1 char ≈ 0.25 tokens (4 chars per token average)
 
         # Directory size (all agents listed with minimal info)
-        directory_tokens = len(str(self.directory)) // 4
+        directory_tokens = self._directory_tokens
 
         # Summaries size (loaded summaries)
         summaries_tokens = sum(
@@ -182,16 +439,30 @@ class LazyAgentLoader:
             for definition in self.cache.full_definitions.values()
         )
 
-        total_tokens = directory_tokens + summaries_tokens + full_def_tokens
+        # Individually loaded sections
+        sections_tokens = sum(
+            len(text) // 4
+            for sections in self.cache.sections.values()
+            for text in sections.values()
+        )
+
+        total_tokens = directory_tokens + summaries_tokens + full_def_tokens + sections_tokens
 
         return {
             'directory_tokens': directory_tokens,
             'summaries_tokens': summaries_tokens,
             'full_definitions_tokens': full_def_tokens,
+            'sections_tokens': sections_tokens,
             'total_tokens': total_tokens,
             'active_agents_count': len(self.cache.active_agents),
             'cached_summaries_count': len(self.cache.summaries),
-            'cached_definitions_count': len(self.cache.full_definitions)
+            'cached_definitions_count': len(self.cache.full_definitions),
+            'cached_sections_count': sum(len(sections) for sections in self.cache.sections.values()),
+            'token_budget': self.token_budget,
+            'evicted_summaries': self.cache.evictions['summary'],
+            'evicted_definitions': self.cache.evictions['definition'],
+            'evicted_sections': self.cache.evictions['sections'],
+            'evicted_tokens': self.cache.evicted_tokens
         }
 
     def print_status(self):
@@ -204,8 +475,22 @@ class LazyAgentLoader:
         print(f"📂 Directory: {len(self.directory)} agents ({estimates['directory_tokens']} tokens)")
         print(f"📄 Cached Summaries: {estimates['cached_summaries_count']} ({estimates['summaries_tokens']} tokens)")
         print(f"📚 Cached Definitions: {estimates['cached_definitions_count']} ({estimates['full_definitions_tokens']} tokens)")
+        if estimates['cached_sections_count']:
+            print(f"🧩 Cached Sections: {estimates['cached_sections_count']} ({estimates['sections_tokens']} tokens)")
         print(f"▶️  Active Agents: {len(self.cache.active_agents)}")
         print(f"💾 Total Token Usage: ~{estimates['total_tokens']} tokens")
+        if self.bundle:
+            print(f"🗺️  Definition Bundle: {self.bundle.bundle_file} ({len(self.bundle.names())} agents, memory-mapped)")
+        if self.token_budget is not None:
+            cached_tokens = (estimates['summaries_tokens'] + estimates['full_definitions_tokens']
+                             + estimates['sections_tokens'])
+            print(f"🎯 Cache Budget: {cached_tokens}/{self.token_budget} tokens ({self.eviction_policy.upper()} eviction)")
+            print(f"♻️  Evictions: {estimates['evicted_summaries']} summaries, "
+                  f"{estimates['evicted_definitions']} definitions, "
+                  f"{estimates['evicted_sections']} section sets "
+                  f"(~{estimates['evicted_tokens']} tokens freed)")
+            if cached_tokens > self.token_budget:
+                print("⚠️  Over budget: remaining cache is pinned by active agents")
         print("=" * 60)
 
         if self.cache.active_agents:
@@ -274,19 +559,30 @@ def main():
     parser.add_argument('--categories', action='store_true', help='List all categories')
     parser.add_argument('--category', type=str, help='List agents in category')
     parser.add_argument('--summary', type=str, help='Load summary for agent')
+    parser.add_argument('--sections', type=str, help='List sections of an agent definition with token estimates')
+    parser.add_argument('--load-sections', type=str, nargs='+', metavar=('AGENT', 'SECTION'),
+                        help='Load only the named sections of an agent definition')
     parser.add_argument('--activate', type=str, nargs='+', help='Activate agents')
     parser.add_argument('--deactivate', type=str, nargs='+', help='Deactivate agents')
     parser.add_argument('--find', type=str, help='Find agents matching query')
     parser.add_argument('--status', action='store_true', help='Show loader status')
     parser.add_argument('--summaries-dir', default='agents/summaries', help='Summaries directory')
     parser.add_argument('--agents-dir', default='agents', help='Agents directory')
+    parser.add_argument('--token-budget', type=int, help='Evict inactive cached agents above this many tokens')
+    parser.add_argument('--eviction', choices=EVICTION_POLICIES, default='lru',
+                        help='Eviction policy used with --token-budget (default: lru)')
+    parser.add_argument('--no-bundle', action='store_true',
+                        help='Read full definitions from .mdc files instead of the definition bundle')
 
     args = parser.parse_args()
 
     # Initialize loader
     loader = LazyAgentLoader(
         summaries_dir=args.summaries_dir,
-        agents_dir=args.agents_dir
+        agents_dir=args.agents_dir,
+        token_budget=args.token_budget,
+        eviction_policy=args.eviction,
+        use_bundle=not args.no_bundle
     )
 
     if not loader.directory:
@@ -349,6 +645,25 @@ def main():
             print(f"  Consultation available: {summary.get('consultation_available', True)}")
             print(f"  Avg duration: {summary.get('avg_task_duration_hours', 2.0)}h")
 
+    # List sections
+    if args.sections:
+        sections = loader.list_sections(args.sections)
+        if sections:
+            print(f"\n🧩 Sections of {args.sections}:\n")
+            for section in sections:
+                indent = '  ' * max(section['level'] - 1, 0)
+                print(f"  {indent}{section['name']} (~{section['tokens']} tokens)")
+
+    # Load sections
+    if args.load_sections:
+        agent, *section_names = args.load_sections
+        if not section_names:
+            print("❌ --load-sections needs an agent and at least one section name")
+            return 1
+        text = loader.load_sections(agent, section_names)
+        if text:
+            print(text)
+
     # Activate agents
     if args.activate:
         print(f"\n▶️  Activating {len(args.activate)} agent(s)...\n")
@@ -368,7 +683,7 @@ def main():
 
         if results:
             for agent_name, score in results:
-                summary = loader.cache.summaries[agent_name]
+                summary = loader.load_summary(agent_name)
                 print(f"  {score:.1f} - {agent_name}")
                 print(f"       {summary.get('description', 'No description')[:80]}")
                 if summary.get('specializations'):
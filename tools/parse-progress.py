@@ -4,67 +4,588 @@ Parser for structured agent progress outputs
 Supports all three formats: Markdown, YAML, and Hybrid
 """
 
+import os
 import re
-import yaml
+import copy
+import json
+import mmap
+import time
 import sys
+import heapq
+import bisect
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
+from progress_columnar import ColumnarWriter
+from progress_store import COVERAGE_KEYS, ProgressStore
+from yaml_utils import YAMLError, load_cached
+
+
+MARKDOWN_HEADER_PATTERN = re.compile(r'^## \d{4}-\d{2}-\d{2}')
+HYBRID_PATTERN = re.compile(r'---\n\n## \d{4}-\d{2}-\d{2}')
+YAML_BLOCK_PATTERN = re.compile(r'^---\n(.*?)\n---', re.DOTALL | re.MULTILINE)
+
+# Markdown entry header: ## 2025-11-30 14:30 - @agent-name: Task Title
+ENTRY_HEADER_PATTERN = re.compile(r'^## (\d{4}-\d{2}-\d{2})(?: (\d{2}:\d{2}))? - @([\w-]+): (.+)$', re.MULTILINE)
+HYBRID_HEADER_PATTERN = re.compile(r'^## [\d-]+ [\d:]+ - @[\w-]+: (.+)$')
+HYBRID_BODY_PATTERN = re.compile(r'---\n\n(.+)', re.DOTALL)
+CONTEXT_PATTERN = re.compile(r'### Context\n(.+?)(?=\n###|\Z)', re.DOTALL)
+
+# `**Field**:` blocks of a markdown entry (each starts with a literal, which the regex engine scans for quickly)
+FIELD_PATTERNS = {
+    'Status': re.compile(r'\*\*Status\*\*:\s*([^\n|]+)'),
+    'Task ID': re.compile(r'\*\*Task ID\*\*:\s*(\S+)'),
+    'Duration': re.compile(r'\*\*Duration\*\*:\s*(?:(\d+)h\s*)?(?:(\d+)m)?'),
+    'Progress': re.compile(r'\*\*Progress\*\*:\s*(\d+)%'),
+    'Deliverables': re.compile(r'\*\*Deliverables\*\*:\n((?:^[ \t]*-.*\n?)+)', re.MULTILINE),
+    'Metrics': re.compile(r'\*\*Metrics\*\*[^:]*?:\n((?:^[ \t]*-.*\n?)+)', re.MULTILINE),
+}
+
+# One deliverable per list line: - `path` (type: X) - description
+# ([^\S\n] is \s without newlines, so matches never leave their line)
+DELIVERABLE_LINE_PATTERN = re.compile(
+    r'^[ \t]*-[^\n]*?`([^`\n]+)`(?:[^\S\n]*\(type:[^\S\n]*(\w+)\))?[^\S\n]*-?[^\S\n]*(.*)',
+    re.MULTILINE
+)
+
+# One metric per list line: - key: value
+METRIC_LINE_PATTERN = re.compile(r'^([^\n:]*):(.*)', re.MULTILINE)
+
+# Values int()/float() accept without trying them; pure words float() accepts
+SIMPLE_NUMBER_PATTERN = re.compile(r'-?[0-9]+(\.[0-9]+)?\Z')
+FLOAT_WORDS = {'inf', 'infinity', 'nan'}
+
+# Status text -> status, first match wins
+STATUS_MARKERS = (
+    ('✅', 'Complete', 'complete'),
+    ('🔄', 'Progress', 'in_progress'),
+    ('⚠️', 'Blocked', 'blocked'),
+    ('❌', 'Failed', 'failed'),
+    ('🚧', 'Paused', 'paused'),
+    ('📋', 'Planned', 'planned'),
+)
+
+# Lines that may start an entry (confirmed against EntrySplitter's rules when sharding)
+BOUNDARY_CANDIDATE_PATTERN = re.compile(rb'^(?:## \d{4}-\d{2}-\d{2}|[^\n]*---)[^\n]*', re.MULTILINE)
+ENTRY_CANDIDATE_PATTERN = re.compile(BOUNDARY_CANDIDATE_PATTERN.pattern.decode('ascii'), re.MULTILINE)
+
+# Validation (--validate): lines and field values checked in each entry
+HEADER_LINE_PATTERN = re.compile(r'^## \d{4}-\d{2}-\d{2}[^\n]*', re.MULTILINE)
+HEADER_DATE_PATTERN = re.compile(r'^## (\d{4})-(\d{2})-(\d{2})(?: (\d{2}):(\d{2})\b)?')
+AGENT_ID_PATTERN = re.compile(r'@[a-z][a-z0-9-]+')
+TITLE_PATTERN = re.compile(r':\s+\S')
+PROJECT_HEADER_PATTERN = re.compile(r'^# Project:', re.MULTILINE)
+DURATION_FIELD_PATTERN = re.compile(r'\*\*Duration\*\*:[^\S\n]*([^\n]*)')
+DURATION_VALUE_PATTERN = re.compile(r'(?:\d+h[^\S\n]*\d+m|\d+h|\d+m)\b')
+PROGRESS_FIELD_PATTERN = re.compile(r'\*\*Progress\*\*:[^\S\n]*([^\n]*)')
+PROGRESS_VALUE_PATTERN = re.compile(r'(\d+)%')
+VALID_STATUSES = tuple(status for _, _, status in STATUS_MARKERS)
+
+# Entries listed under Recent Activity by --analyze
+ANALYSIS_RECENT_LIMIT = 10
+CONSULT_LINE_PATTERN = re.compile(r'^[^\n]*\[CONSULT\]', re.MULTILINE)
+LINE_END_CR_PATTERN = re.compile(r'\r+(?=\n|\Z)')
+
+# Files smaller than this are parsed serially even with jobs > 1 (pool startup would dominate)
+PARALLEL_MIN_BYTES = 1 << 20
+
+# Date (and optional hour) at the start of a timestamp, for rollup buckets
+TIMESTAMP_BUCKET_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[ T](\d{2}))?')
+ROLLUP_GRANULARITIES = ('hour', 'day', 'week')
+
+STATUS_EMOJI = {'complete': '✅', 'in_progress': '🔄', 'blocked': '⚠️', 'failed': '❌', 'paused': '🚧', 'planned': '📋'}
+
+
+class EntrySplitter:
+    """
+    Line-by-line entry boundary detection
+
+    Feed lines (without their newline) in order; feed() returns the text of
+    an entry once the line that starts the next one is seen, and flush()
+    returns the final entry. Entries start at a `## YYYY-MM-DD` header or an
+    opening `---` YAML fence.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.in_yaml = False
+
+    def feed(self, line: str) -> Optional[str]:
+        """Add a line; returns the completed previous entry, if this line ended it"""
+        completed = None
+        is_fence = line.strip() == '---'
+
+        # Start of YAML frontmatter
+        if is_fence and not self.in_yaml:
+            if self.lines:
+                completed = '\n'.join(self.lines)
+                self.lines = []
+            self.in_yaml = True
+        # End of YAML frontmatter
+        elif is_fence:
+            self.in_yaml = False
+        # Start of markdown entry
+        elif MARKDOWN_HEADER_PATTERN.match(line):
+            if self.lines and not self.in_yaml:
+                completed = '\n'.join(self.lines)
+                self.lines = []
+
+        self.lines.append(line)
+        return completed
+
+    def flush(self) -> Optional[str]:
+        """Return the last (unterminated) entry and reset"""
+        completed = '\n'.join(self.lines) if self.lines else None
+        self.lines = []
+        self.in_yaml = False
+        return completed
+
+
+class ProgressMetrics:
+    """
+    Running aggregates over a stream of entries
+
+    Produces the same figures as AgentProgressParser.get_metrics_summary()
+    while holding only counters and the few most recent entries.
+    """
+
+    RECENT_LIMIT = 5
+    COVERAGE_KEYS = COVERAGE_KEYS
+
+    def __init__(self):
+        self.total_entries = 0
+        self.by_status: Dict[str, int] = {}
+        self.by_agent: Dict[str, int] = {}
+        self.total_duration_minutes = 0
+        self.total_deliverables = 0
+        self.coverage_sum = 0
+        self.coverage_count = 0
+        # Min-heap of (timestamp, -sequence, entry): the newest entries, earliest seen first on ties
+        self._recent: List[Tuple] = []
+
+    def add(self, entry: Dict):
+        """Fold one entry into the aggregates"""
+        self.total_entries += 1
+
+        # Count by status
+        status = entry.get('status', 'unknown')
+        self.by_status[status] = self.by_status.get(status, 0) + 1
+
+        # Count by agent
+        agent = entry.get('agent', 'unknown')
+        self.by_agent[agent] = self.by_agent.get(agent, 0) + 1
+
+        # Sum duration
+        duration = entry.get('duration_minutes', 0)
+        if isinstance(duration, (int, float)):
+            self.total_duration_minutes += duration
+
+        # Count deliverables
+        self.total_deliverables += len(entry.get('deliverables', []))
+
+        # Average test coverage
+        metrics = entry.get('metrics', {})
+        coverage = None
+        for key in self.COVERAGE_KEYS:
+            if key in metrics:
+                coverage = metrics[key]
+                break
+
+        if coverage is not None and isinstance(coverage, (int, float)):
+            self.coverage_sum += coverage
+            self.coverage_count += 1
+
+        # Keep the most recent entries for the activity report
+        item = (entry.get('timestamp', ''), -self.total_entries, entry)
+        if len(self._recent) < self.RECENT_LIMIT:
+            heapq.heappush(self._recent, item)
+        elif item[:2] > self._recent[0][:2]:
+            heapq.heapreplace(self._recent, item)
+
+    def update(self, entries: Iterable[Dict]) -> 'ProgressMetrics':
+        """Fold every entry of a stream into the aggregates"""
+        for entry in entries:
+            self.add(entry)
+        return self
+
+    def recent(self) -> List[Dict]:
+        """Most recent entries, newest first (same order as a stable descending sort)"""
+        return [item[2] for item in sorted(self._recent, key=lambda item: item[:2], reverse=True)]
+
+    def to_dict(self) -> Dict:
+        """Serializable state (for the follow-mode cursor)"""
+        state = {key: value for key, value in vars(self).items() if key != '_recent'}
+        state['recent'] = [list(item) for item in self._recent]
+        return state
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'ProgressMetrics':
+        """Restore state saved by to_dict()"""
+        metrics = cls()
+        for key, value in state.items():
+            if key != 'recent':
+                setattr(metrics, key, value)
+        metrics._recent = [tuple(item) for item in state.get('recent', [])]
+        heapq.heapify(metrics._recent)
+        return metrics
+
+    def summary(self) -> Dict:
+        """Summary dict in the get_metrics_summary() format"""
+        return {
+            'total_entries': self.total_entries,
+            'by_status': dict(self.by_status),
+            'by_agent': dict(self.by_agent),
+            'total_duration_minutes': self.total_duration_minutes,
+            'total_deliverables': self.total_deliverables,
+            'avg_test_coverage': round(self.coverage_sum / self.coverage_count, 1) if self.coverage_count else 0
+        }
+
+
+class ProgressRollup:
+    """
+    Time-bucketed aggregates over a stream of entries
+
+    Entries are grouped by (bucket, agent, status), where the bucket is the
+    hour ('2025-03-19 10:00'), day ('2025-03-19') or ISO week ('2025-W12')
+    of the entry's timestamp, and 'unknown' when it has none. Each group
+    keeps a fixed-size accumulator, so memory grows with the number of
+    groups, not entries.
+    """
+
+    # Accumulator slots
+    ENTRIES, COMPLETED, DURATION, DELIVERABLES, COVERAGE_SUM, COVERAGE_COUNT = range(6)
+    GROUP_KEYS = ('agent', 'status')
+
+    def __init__(self, granularity: str = 'day'):
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"Unknown granularity '{granularity}' (choose from: {', '.join(ROLLUP_GRANULARITIES)})")
+        self.granularity = granularity
+        self.groups: Dict[Tuple[str, str, str], List] = {}
+        self._weeks: Dict[str, str] = {}  # Date -> ISO week, so each date is parsed once
+
+    def bucket(self, timestamp) -> str:
+        """Bucket label for a timestamp"""
+        match = TIMESTAMP_BUCKET_PATTERN.match(str(timestamp))
+        if not match:
+            return 'unknown'
+        year, month, day, hour = match.groups()
+        date = f"{year}-{month}-{day}"
+
+        if self.granularity == 'hour':
+            return f"{date} {hour or '00'}:00"
+        if self.granularity == 'day':
+            return date
+
+        week = self._weeks.get(date)
+        if week is None:
+            try:
+                iso = datetime(int(year), int(month), int(day)).isocalendar()
+                week = f"{iso[0]}-W{iso[1]:02d}"
+            except ValueError:
+                week = 'unknown'
+            self._weeks[date] = week
+        return week
+
+    def add(self, entry: Dict):
+        """Fold one entry into its group"""
+        key = (
+            self.bucket(entry.get('timestamp', '')),
+            str(entry.get('agent', 'unknown')),
+            str(entry.get('status', 'unknown'))
+        )
+        acc = self.groups.get(key)
+        if acc is None:
+            acc = self.groups[key] = [0, 0, 0, 0, 0, 0]
+
+        acc[self.ENTRIES] += 1
+        if key[2] == 'complete':
+            acc[self.COMPLETED] += 1
+
+        duration = entry.get('duration_minutes', 0)
+        if isinstance(duration, (int, float)):
+            acc[self.DURATION] += duration
+
+        acc[self.DELIVERABLES] += len(entry.get('deliverables', []))
+
+        metrics = entry.get('metrics', {})
+        for coverage_key in COVERAGE_KEYS:
+            if coverage_key in metrics:
+                coverage = metrics[coverage_key]
+                if isinstance(coverage, (int, float)):
+                    acc[self.COVERAGE_SUM] += coverage
+                    acc[self.COVERAGE_COUNT] += 1
+                break
+
+    def update(self, entries: Iterable[Dict]) -> 'ProgressRollup':
+        """Fold every entry of a stream into the rollup"""
+        for entry in entries:
+            self.add(entry)
+        return self
+
+    def rows(self, by: Iterable[str] = GROUP_KEYS) -> List[Dict]:
+        """
+        Rollup rows sorted by bucket, then group
+
+        Args:
+            by: Group keys to keep ('agent', 'status', both, or none for
+                per-bucket totals); the others are summed away
+
+        Returns:
+            Dicts with bucket, the kept group keys, entries, completed,
+            duration_minutes, deliverables and avg_test_coverage
+        """
+        by = tuple(by)
+        unknown = [key for key in by if key not in self.GROUP_KEYS]
+        if unknown:
+            raise ValueError(f"Unknown group key(s): {', '.join(unknown)} (choose from: {', '.join(self.GROUP_KEYS)})")
+        positions = [1 + self.GROUP_KEYS.index(key) for key in by]
+
+        merged: Dict[Tuple, List] = {}
+        for key, acc in self.groups.items():
+            group = (key[0],) + tuple(key[position] for position in positions)
+            total = merged.get(group)
+            if total is None:
+                merged[group] = list(acc)
+            else:
+                for slot, value in enumerate(acc):
+                    total[slot] += value
+
+        rows = []
+        for group in sorted(merged):
+            acc = merged[group]
+            row = {'bucket': group[0]}
+            row.update(zip(by, group[1:]))
+            row.update({
+                'entries': acc[self.ENTRIES],
+                'completed': acc[self.COMPLETED],
+                'duration_minutes': acc[self.DURATION],
+                'deliverables': acc[self.DELIVERABLES],
+                'avg_test_coverage': (round(acc[self.COVERAGE_SUM] / acc[self.COVERAGE_COUNT], 1)
+                                      if acc[self.COVERAGE_COUNT] else 0)
+            })
+            rows.append(row)
+        return rows
+
+
+def _set_status(entry: Dict, match: re.Match):
+    status_text = match.group(1).strip()
+    for emoji, word, status in STATUS_MARKERS:
+        if emoji in status_text or word in status_text:
+            entry['status'] = status
+            break
+
+
+def _set_task_id(entry: Dict, match: re.Match):
+    entry['task_id'] = match.group(1)
+
+
+def _set_duration(entry: Dict, match: re.Match):
+    hours = int(match.group(1) or 0)
+    minutes = int(match.group(2) or 0)
+    entry['duration_minutes'] = hours * 60 + minutes
+
+
+def _set_progress(entry: Dict, match: re.Match):
+    entry['progress_percent'] = int(match.group(1))
+
+
+def _set_deliverables(entry: Dict, match: re.Match):
+    deliverables = [
+        {
+            'path': line.group(1),
+            'type': line.group(2) or 'unknown',
+            'description': line.group(3).strip()
+        }
+        for line in DELIVERABLE_LINE_PATTERN.finditer(match.group(1))
+    ]
+    if deliverables:
+        entry['deliverables'] = deliverables
+
+
+def _metric_value(value: str) -> Union[int, float, str]:
+    """Convert to int, else float, else keep the string (without raising for the common cases)"""
+    number = SIMPLE_NUMBER_PATTERN.match(value)
+    if number:
+        return float(value) if number.group(1) else int(value)
+    if not value or (value.isalpha() and value.lower() not in FLOAT_WORDS):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _set_metrics(entry: Dict, match: re.Match):
+    metrics = {}
+    for line in METRIC_LINE_PATTERN.finditer(match.group(1)):
+        key = line.group(1).strip('- ').strip()
+        metrics[key] = _metric_value(line.group(2).strip().rstrip('%'))
+    if metrics:
+        entry['metrics'] = metrics
+
+
+# Field extraction dispatch table, in the order fields are added to an entry
+FIELD_HANDLERS = (
+    (FIELD_PATTERNS['Status'], _set_status),
+    (FIELD_PATTERNS['Task ID'], _set_task_id),
+    (FIELD_PATTERNS['Duration'], _set_duration),
+    (FIELD_PATTERNS['Progress'], _set_progress),
+    (FIELD_PATTERNS['Deliverables'], _set_deliverables),
+    (FIELD_PATTERNS['Metrics'], _set_metrics),
+)
+
+# The fields --analyze counts (deliverables are only counted, metrics only read for coverage)
+COUNTED_FIELD_HANDLERS = (
+    (FIELD_PATTERNS['Status'], _set_status),
+    (FIELD_PATTERNS['Task ID'], _set_task_id),
+    (FIELD_PATTERNS['Duration'], _set_duration),
+)
+
+
+def _entry_starts(candidates: Iterable[Tuple[int, str]]) -> Iterator[int]:
+    """
+    Offsets where EntrySplitter would start a new entry
+
+    Args:
+        candidates: (offset, line without its line ending) for every date
+            header and line containing ---, in file order (no other line
+            starts an entry)
+    """
+    in_yaml = False
+    for start, line in candidates:
+        if line.strip() == '---':
+            if not in_yaml and start > 0:
+                yield start
+            in_yaml = not in_yaml
+        elif not in_yaml and start > 0 and MARKDOWN_HEADER_PATTERN.match(line):
+            yield start
+
 
 class AgentProgressParser:
     """Parse agent progress entries from SHARED_PROGRESS.md"""
 
-    def __init__(self, progress_file: str = "workspaces/SHARED_PROGRESS.md"):
+    def __init__(self, progress_file: str = "workspaces/SHARED_PROGRESS.md", jobs: int = 1):
         self.progress_file = Path(progress_file)
+        self.jobs = jobs
 
     def parse_all(self) -> List[Dict]:
         """Parse all entries from the progress file"""
-        if not self.progress_file.exists():
-            print(f"Warning: {self.progress_file} not found", file=sys.stderr)
-            return []
-
-        content = self.progress_file.read_text()
-        entries = []
+        return list(self.iter_entries())
+
+    def iter_entries(self) -> Iterator[Dict]:
+        """
+        Stream parsed entries from the progress file
+
+        Reads the file line by line and yields each entry as soon as the next
+        entry's boundary is seen, so memory use is bounded by the largest
+        entry rather than the file size. With jobs > 1, files of at least
+        PARALLEL_MIN_BYTES are split into shards at entry boundaries and
+        parsed in a process pool; shards are yielded in file order, so the
+        entries are identical to a serial parse.
+        """
+        shards = self._shard_ranges() if self.jobs > 1 else []
+        if len(shards) < 2:
+            for _, content in self._iter_raw_entries():
+                entry = self._parse_entry(content)
+                if entry:
+                    yield entry
+            return
 
-        # Split by agent entry headers (look for ## YYYY-MM-DD or YAML sections)
-        # Use a more sophisticated split that preserves structure
-        current_entry = []
-        in_yaml = False
-
-        for line in content.split('\n'):
-            # Start of YAML frontmatter
-            if line.strip() == '---' and not in_yaml:
-                if current_entry:
-                    entry = self._parse_entry('\n'.join(current_entry))
-                    if entry:
-                        entries.append(entry)
-                    current_entry = []
-                in_yaml = True
-                current_entry.append(line)
-            # End of YAML frontmatter
-            elif line.strip() == '---' and in_yaml:
-                in_yaml = False
-                current_entry.append(line)
-            # Start of markdown entry
-            elif re.match(r'^## \d{4}-\d{2}-\d{2}', line):
-                if current_entry and not in_yaml:
-                    entry = self._parse_entry('\n'.join(current_entry))
-                    if entry:
-                        entries.append(entry)
-                    current_entry = []
-                current_entry.append(line)
-            else:
-                current_entry.append(line)
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            for shard_entries in executor.map(self._parse_shard, *zip(*shards)):
+                yield from shard_entries
 
-        # Don't forget the last entry
-        if current_entry:
-            entry = self._parse_entry('\n'.join(current_entry))
+    def _parse_shard(self, start: int, end: int) -> List[Dict]:
+        """Parse the entries in a byte range (process pool worker)"""
+        entries = []
+        for _, content in self._iter_raw_entries(start, end):
+            entry = self._parse_entry(content)
             if entry:
                 entries.append(entry)
-
         return entries
 
+    def _shard_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Split the file into (start, end) byte ranges at entry boundaries
+
+        A few shards per worker balances load when slow YAML entries cluster.
+        Returns a single range when the file is below PARALLEL_MIN_BYTES.
+        """
+        try:
+            size = os.path.getsize(self.progress_file)
+        except OSError:
+            return []
+        if size < PARALLEL_MIN_BYTES:
+            return [(0, size)]
+
+        target = -(-size // (self.jobs * 4))
+        cuts = [0]
+        for offset in self._entry_boundaries():
+            if offset - cuts[-1] >= target:
+                cuts.append(offset)
+        cuts.append(size)
+        return list(zip(cuts, cuts[1:]))
+
+    def _entry_boundaries(self) -> Iterator[int]:
+        """
+        Byte offsets where EntrySplitter would start a new entry
+
+        Only candidate lines (date headers and lines containing ---) are
+        decoded and checked, so this is much cheaper than splitting the file.
+        A fresh EntrySplitter started at any of these offsets is in the same
+        state as one that read the file from the beginning.
+        """
+        with open(self.progress_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield from _entry_starts(
+                    (match.start(), match.group().decode('utf-8').rstrip('\r\n'))
+                    for match in BOUNDARY_CANDIDATE_PATTERN.finditer(data)
+                )
+
+    def _iter_raw_entries(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (byte offset, text) for each raw entry in the file
+
+        Args:
+            start: Byte offset to start reading from (must be a line start)
+            end: Byte offset to stop at (must be an entry boundary; default: end of file)
+        """
+        if not self.progress_file.exists():
+            print(f"Warning: {self.progress_file} not found", file=sys.stderr)
+            return
+
+        splitter = EntrySplitter()
+        entry_start = offset = start
+
+        with open(self.progress_file, 'rb') as f:
+            f.seek(start)
+            for raw_line in f:
+                if end is not None and offset >= end:
+                    break
+                # A last line without a newline may still be being written and end
+                # partway through a character; appended scans re-read it anyway
+                errors = 'strict' if raw_line.endswith(b'\n') else 'replace'
+                line = raw_line.decode('utf-8', errors).rstrip('\r\n')
+                completed = splitter.feed(line)
+                if completed is not None:
+                    yield entry_start, completed
+                    entry_start = offset
+                offset += len(raw_line)
+
+        completed = splitter.flush()
+        if completed is not None:
+            yield entry_start, completed
+
     def _parse_entry(self, content: str) -> Optional[Dict]:
         """Parse a single entry (auto-detects format)"""
         content = content.strip()
@@ -74,12 +595,12 @@ class AgentProgressParser:
         # Check if it's YAML format (starts with ---)
         if content.startswith('---'):
             # Check if it's hybrid (has markdown after YAML)
-            if re.search(r'---\n\n## \d{4}-\d{2}-\d{2}', content):
+            if HYBRID_PATTERN.search(content):
                 return self._parse_hybrid_entry(content)
             else:
                 return self._parse_yaml_entry(content)
         # Check if it's markdown format
-        elif re.match(r'^## \d{4}-\d{2}-\d{2}', content):
+        elif MARKDOWN_HEADER_PATTERN.match(content):
             return self._parse_markdown_entry(content)
 
         return None
@@ -87,26 +608,21 @@ class AgentProgressParser:
     def _parse_yaml_entry(self, content: str) -> Dict:
         """Parse YAML format entry"""
         # Extract YAML between --- markers
-        yaml_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL | re.MULTILINE)
+        yaml_match = YAML_BLOCK_PATTERN.search(content)
         if yaml_match:
             try:
-                return yaml.safe_load(yaml_match.group(1))
-            except yaml.YAMLError as e:
+                return load_cached(yaml_match.group(1))
+            except YAMLError as e:
                 print(f"Warning: YAML parse error: {e}", file=sys.stderr)
                 return {}
         return {}
 
-    def _parse_markdown_entry(self, content: str) -> Dict:
-        """Parse markdown format entry"""
+    def _parse_markdown_entry(self, content: str, handlers: Tuple = FIELD_HANDLERS) -> Dict:
+        """Parse markdown format entry (handlers: the fields to extract, default all)"""
         entry = {}
 
-        # Extract header: ## 2025-11-30 14:30 - @agent-name: Task Title
-        header_match = re.match(
-            r'^## (\d{4}-\d{2}-\d{2})(?: (\d{2}:\d{2}))? - @([\w-]+): (.+)$',
-            content.split('\n')[0],
-            re.MULTILINE
-        )
-
+        newline = content.find('\n')
+        header_match = ENTRY_HEADER_PATTERN.match(content[:newline] if newline != -1 else content)
         if header_match:
             date = header_match.group(1)
             time = header_match.group(2) or "00:00"
@@ -114,86 +630,42 @@ class AgentProgressParser:
             entry['agent'] = header_match.group(3)
             entry['task_title'] = header_match.group(4)
 
-        # Extract status
-        status_match = re.search(r'\*\*Status\*\*:\s*([^\n|]+)', content)
-        if status_match:
-            status_text = status_match.group(1).strip()
-            if '✅' in status_text or 'Complete' in status_text:
-                entry['status'] = 'complete'
-            elif '🔄' in status_text or 'Progress' in status_text:
-                entry['status'] = 'in_progress'
-            elif '⚠️' in status_text or 'Blocked' in status_text:
-                entry['status'] = 'blocked'
-            elif '❌' in status_text or 'Failed' in status_text:
-                entry['status'] = 'failed'
-            elif '🚧' in status_text or 'Paused' in status_text:
-                entry['status'] = 'paused'
-            elif '📋' in status_text or 'Planned' in status_text:
-                entry['status'] = 'planned'
-
-        # Extract task ID
-        task_id_match = re.search(r'\*\*Task ID\*\*:\s*(\S+)', content)
-        if task_id_match:
-            entry['task_id'] = task_id_match.group(1)
-
-        # Extract duration
-        duration_match = re.search(r'\*\*Duration\*\*:\s*(?:(\d+)h\s*)?(?:(\d+)m)?', content)
-        if duration_match:
-            hours = int(duration_match.group(1) or 0)
-            minutes = int(duration_match.group(2) or 0)
-            entry['duration_minutes'] = hours * 60 + minutes
-
-        # Extract progress percentage
-        progress_match = re.search(r'\*\*Progress\*\*:\s*(\d+)%', content)
-        if progress_match:
-            entry['progress_percent'] = int(progress_match.group(1))
-
-        # Extract deliverables
-        deliverables = []
-        deliverables_section = re.search(
-            r'\*\*Deliverables\*\*:\n((?:^[ \t]*-.*\n?)+)',
-            content,
-            re.MULTILINE
-        )
-        if deliverables_section:
-            for line in deliverables_section.group(1).split('\n'):
-                if line.strip().startswith('-'):
-                    # Parse: - `path` (type: X) - description
-                    deliv_match = re.search(r'`([^`]+)`(?:\s*\(type:\s*(\w+)\))?\s*-?\s*(.*)', line)
-                    if deliv_match:
-                        deliverables.append({
-                            'path': deliv_match.group(1),
-                            'type': deliv_match.group(2) or 'unknown',
-                            'description': deliv_match.group(3).strip()
-                        })
+        for pattern, handler in handlers:
+            field_match = pattern.search(content)
+            if field_match:
+                handler(entry, field_match)
+
+        return entry
+
+    def _count_markdown_entry(self, content: str) -> Dict:
+        """
+        The parts of a markdown entry that ProgressMetrics and analyze() count
+
+        Header fields, status, task ID and duration as _parse_markdown_entry()
+        sets them; 'deliverables' holds the unparsed deliverable lines (only
+        their number is used) and 'metrics' only the test coverage values.
+        """
+        entry = self._parse_markdown_entry(content, COUNTED_FIELD_HANDLERS)
+
+        deliverables = FIELD_PATTERNS['Deliverables'].search(content)
         if deliverables:
-            entry['deliverables'] = deliverables
-
-        # Extract metrics
-        metrics = {}
-        metrics_section = re.search(
-            r'\*\*Metrics\*\*[^:]*?:\n((?:^[ \t]*-.*\n?)+)',
-            content,
-            re.MULTILINE
-        )
-        if metrics_section:
-            for line in metrics_section.group(1).split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip('- ').strip()
-                    value = value.strip().rstrip('%')
-                    # Try to convert to number
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        try:
-                            value = float(value)
-                        except ValueError:
-                            pass
-                    metrics[key] = value
-        if metrics:
-            entry['metrics'] = metrics
+            lines = DELIVERABLE_LINE_PATTERN.findall(deliverables.group(1))
+            if lines:
+                entry['deliverables'] = lines
 
+        metrics = FIELD_PATTERNS['Metrics'].search(content)
+        if metrics:
+            coverage = {}
+            for line in METRIC_LINE_PATTERN.finditer(metrics.group(1)):
+                key = line.group(1).strip('- ').strip()
+                if key in COVERAGE_KEYS:
+                    coverage[key] = _metric_value(line.group(2).strip().rstrip('%'))
+            if coverage:
+                entry['metrics'] = coverage
+
+        # The skipped fields alone still make an entry count
+        if not entry:
+            entry = self._parse_markdown_entry(content)
         return entry
 
     def _parse_hybrid_entry(self, content: str) -> Dict:
@@ -202,21 +674,18 @@ class AgentProgressParser:
         entry = self._parse_yaml_entry(content)
 
         # Parse markdown body for additional context
-        markdown_section = re.search(r'---\n\n(.+)', content, re.DOTALL)
+        markdown_section = HYBRID_BODY_PATTERN.search(content)
         if markdown_section:
             markdown_content = markdown_section.group(1)
 
             # If YAML didn't have task_title, extract from markdown header
             if 'task_title' not in entry:
-                header_match = re.match(
-                    r'^## [\d-]+ [\d:]+ - @[\w-]+: (.+)$',
-                    markdown_content.split('\n')[0]
-                )
+                header_match = HYBRID_HEADER_PATTERN.match(markdown_content.split('\n')[0])
                 if header_match:
                     entry['task_title'] = header_match.group(1)
 
             # Extract context section if not in YAML
-            context_match = re.search(r'### Context\n(.+?)(?=\n###|\Z)', markdown_content, re.DOTALL)
+            context_match = CONTEXT_PATTERN.search(markdown_content)
             if context_match and 'context' not in entry:
                 entry['context'] = context_match.group(1).strip()
 
@@ -228,124 +697,291 @@ class AgentProgressParser:
 
         return entry
 
-    def filter_by_agent(self, entries: List[Dict], agent_name: str) -> List[Dict]:
+    def filter_entries(self, entries: Iterable[Dict], agent: Optional[str] = None,
+                       status: Optional[str] = None, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Lazily filter a stream of entries
+
+        Args:
+            entries: Entries (list or iter_entries() stream)
+            agent: Keep only this agent's entries
+            status: Keep only entries with this status
+            start_date, end_date: Keep entries dated within this range (YYYY-MM-DD);
+                                  applied only when both are given
+        """
+        for entry in entries:
+            if agent is not None and entry.get('agent') != agent:
+                continue
+            if status is not None and entry.get('status') != status:
+                continue
+            if start_date is not None and end_date is not None:
+                timestamp = entry.get('timestamp', '')
+                if not timestamp:
+                    continue
+                entry_date = timestamp.split()[0]  # Get just the date part
+                if not start_date <= entry_date <= end_date:
+                    continue
+            yield entry
+
+    def filter_by_agent(self, entries: Iterable[Dict], agent_name: str) -> List[Dict]:
         """Filter entries by agent name"""
-        return [e for e in entries if e.get('agent') == agent_name]
+        return list(self.filter_entries(entries, agent=agent_name))
 
-    def filter_by_status(self, entries: List[Dict], status: str) -> List[Dict]:
+    def filter_by_status(self, entries: Iterable[Dict], status: str) -> List[Dict]:
         """Filter entries by status"""
-        return [e for e in entries if e.get('status') == status]
+        return list(self.filter_entries(entries, status=status))
 
-    def filter_by_date_range(self, entries: List[Dict], start_date: str, end_date: str) -> List[Dict]:
+    def filter_by_date_range(self, entries: Iterable[Dict], start_date: str, end_date: str) -> List[Dict]:
         """Filter entries by date range (YYYY-MM-DD format)"""
-        filtered = []
+        return list(self.filter_entries(entries, start_date=start_date, end_date=end_date))
+
+    def get_metrics_summary(self, entries: Iterable[Dict]) -> Dict:
+        """Generate summary metrics from entries (accepts a stream)"""
+        return ProgressMetrics().update(entries).summary()
+
+    def ingest(self, store: ProgressStore) -> int:
+        """
+        Incrementally load the progress file into a SQLite store
+
+        Only bytes appended since the previous ingestion are parsed; the last
+        entry (which may still be growing) is replaced on every run, so
+        re-running is idempotent. A truncated or replaced file is re-ingested
+        from the start.
+
+        Returns:
+            Number of entries written
+        """
+        try:
+            stat = os.stat(self.progress_file)
+        except OSError:
+            print(f"Warning: {self.progress_file} not found", file=sys.stderr)
+            return 0
+
+        written = 0
+        source_id = store.source_id(self.progress_file)
+        scanner = AppendScanner(self, store.get_scan_state(source_id))
+
+        with store.transaction():
+            change = scanner.check(stat)
+            if change == 'unchanged':
+                return 0
+            if change == 'reset':
+                store.clear_source(source_id)
+            store.clear_pending(source_id)
+
+            def add(start: int, content: str, final: bool = True):
+                nonlocal written
+                entry = self._parse_entry(content)
+                if entry:
+                    store.add_entry(source_id, start, entry, final)
+                    written += 1
+
+            for start, content in scanner.scan(stat, add):
+                add(start, content, final=False)
+            store.save_scan_state(source_id, scanner.state())
+
+        return written
+
+    def export_to_json(self, entries: Iterable[Dict], output_file: str):
+        """Export entries to JSON file (streamed; same output as json.dump with indent=2)"""
+        writer = JsonArrayWriter(output_file)
         for entry in entries:
-            timestamp = entry.get('timestamp', '')
-            if timestamp:
-                entry_date = timestamp.split()[0]  # Get just the date part
-                if start_date <= entry_date <= end_date:
-                    filtered.append(entry)
-        return filtered
-
-    def get_metrics_summary(self, entries: List[Dict]) -> Dict:
-        """Generate summary metrics from entries"""
-        summary = {
-            'total_entries': len(entries),
-            'by_status': {},
-            'by_agent': {},
-            'total_duration_minutes': 0,
-            'total_deliverables': 0,
-            'avg_test_coverage': 0
-        }
+            writer.write(entry)
+        writer.close()
 
-        coverage_count = 0
-        coverage_sum = 0
+    def export_to_ndjson(self, entries: Iterable[Dict], output_file: str):
+        """Export entries to newline-delimited JSON (one compact entry per line)"""
+        writer = NdjsonWriter(output_file)
+        for entry in entries:
+            writer.write(entry)
+        writer.close()
 
+    def export_to_csv(self, entries: Iterable[Dict], output_file: str):
+        """Export entries to CSV file (columns are the union of every entry's fields and metrics)"""
+        writer = CsvRowWriter(output_file)
         for entry in entries:
-            # Count by status
-            status = entry.get('status', 'unknown')
-            summary['by_status'][status] = summary['by_status'].get(status, 0) + 1
+            writer.write(self._flatten_entry(entry))
+        writer.close()
 
-            # Count by agent
-            agent = entry.get('agent', 'unknown')
-            summary['by_agent'][agent] = summary['by_agent'].get(agent, 0) + 1
-
-            # Sum duration
-            duration = entry.get('duration_minutes', 0)
-            if isinstance(duration, (int, float)):
-                summary['total_duration_minutes'] += duration
-
-            # Count deliverables
-            deliverables = entry.get('deliverables', [])
-            summary['total_deliverables'] += len(deliverables)
-
-            # Average test coverage
-            metrics = entry.get('metrics', {})
-            coverage = None
-            for key in ['test_coverage', 'Test Coverage', 'test_coverage_percent']:
-                if key in metrics:
-                    coverage = metrics[key]
-                    break
+    def export_to_columnar(self, entries: Iterable[Dict], output_file: str):
+        """Export flattened entries to the binary columnar format (see progress_columnar.py)"""
+        writer = ColumnarWriter(output_file)
+        for entry in entries:
+            writer.write(self._flatten_entry(entry, missing=None))
+        writer.close()
+
+    def _flatten_entry(self, entry: Dict, missing='') -> Dict:
+        """
+        Flatten nested structures for CSV and columnar exports
+
+        Args:
+            entry: Parsed entry
+            missing: Value for absent fields ('' for CSV, None for columnar nulls)
+        """
+        flat = {
+            'timestamp': entry.get('timestamp', missing),
+            'agent': entry.get('agent', missing),
+            'task_id': entry.get('task_id', missing),
+            'task_title': entry.get('task_title', missing),
+            'status': entry.get('status', missing),
+            'duration_minutes': entry.get('duration_minutes', missing),
+            'progress_percent': entry.get('progress_percent', missing),
+            'num_deliverables': len(entry.get('deliverables', [])),
+        }
 
-            if coverage is not None and isinstance(coverage, (int, float)):
-                coverage_sum += coverage
-                coverage_count += 1
+        # Add metrics as separate columns
+        metrics = entry.get('metrics', {})
+        for key, value in metrics.items():
+            flat[f'metric_{key}'] = value
 
-        if coverage_count > 0:
-            summary['avg_test_coverage'] = round(coverage_sum / coverage_count, 1)
+        return flat
 
-        return summary
+    def get_rollup(self, entries: Iterable[Dict], granularity: str = 'day') -> ProgressRollup:
+        """Time-bucketed metrics per agent and status (accepts a stream)"""
+        return ProgressRollup(granularity).update(entries)
 
-    def export_to_json(self, entries: List[Dict], output_file: str):
-        """Export entries to JSON file"""
-        import json
-        with open(output_file, 'w') as f:
-            json.dump(entries, f, indent=2, default=str)
+    def print_rollup_report(self, rollup: ProgressRollup):
+        """Print per-bucket totals, each followed by its agent/status breakdown"""
+        breakdown: Dict[str, List[Dict]] = {}
+        for row in rollup.rows():
+            breakdown.setdefault(row['bucket'], []).append(row)
 
-    def export_to_csv(self, entries: List[Dict], output_file: str):
-        """Export entries to CSV file"""
-        import csv
+        def describe(row: Dict) -> str:
+            text = (f"{row['entries']} entries, {row['completed']} complete, "
+                    f"{row['duration_minutes']} min, {row['deliverables']} deliverables")
+            if row['avg_test_coverage'] > 0:
+                text += f", {row['avg_test_coverage']}% coverage"
+            return text
 
-        if not entries:
-            return
+        print("=" * 60)
+        print(f"AGENT PROGRESS ROLLUP (by {rollup.granularity})")
+        print("=" * 60)
+        for total in rollup.rows(by=()):
+            print()
+            print(f"📅 {total['bucket']}: {describe(total)}")
+            for row in breakdown[total['bucket']]:
+                emoji = STATUS_EMOJI.get(row['status'], '📍')
+                print(f"  {emoji} @{row['agent']} ({row['status']}): {describe(row)}")
+        print()
+        print("=" * 60)
 
-        # Flatten nested structures for CSV
-        flattened = []
-        for entry in entries:
-            flat = {
-                'timestamp': entry.get('timestamp', ''),
-                'agent': entry.get('agent', ''),
-                'task_id': entry.get('task_id', ''),
-                'task_title': entry.get('task_title', ''),
-                'status': entry.get('status', ''),
-                'duration_minutes': entry.get('duration_minutes', ''),
-                'progress_percent': entry.get('progress_percent', ''),
-                'num_deliverables': len(entry.get('deliverables', [])),
-            }
-
-            # Add metrics as separate columns
-            metrics = entry.get('metrics', {})
-            for key, value in metrics.items():
-                flat[f'metric_{key}'] = value
-
-            flattened.append(flat)
-
-        # Write CSV
-        if flattened:
-            keys = flattened[0].keys()
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(flattened)
-
-    def print_summary_report(self, entries: List[Dict]):
+    def analyze(self) -> Dict:
+        """
+        Statistics for the analyze-progress.sh report, from one read of the file
+
+        Counts come from the parsed entries (every format), so they agree
+        with the summary report; [CONSULT] lines are counted in the raw text.
+        The file is read whole and split with one regex scan, and markdown
+        entries are only parsed for the counted fields (see _count_markdown_entry);
+        the recent entries are parsed in full.
+
+        Returns:
+            Dict with the get_metrics_summary() figures plus the last
+            ANALYSIS_RECENT_LIMIT timestamped entries in file order and the number of
+            entries with task IDs and durations, and of consultation lines
+        """
+        metrics = ProgressMetrics()
+        recent = deque(maxlen=ANALYSIS_RECENT_LIMIT)   # (entry, content if only counted)
+        task_ids = durations = 0
+
+        try:
+            text = self.progress_file.read_bytes().decode('utf-8')
+        except FileNotFoundError:
+            print(f"Warning: {self.progress_file} not found", file=sys.stderr)
+            text = ''
+        if '\r' in text:
+            # Line endings as EntrySplitter strips them
+            text = LINE_END_CR_PATTERN.sub('', text)
+
+        consultations = len(CONSULT_LINE_PATTERN.findall(text))
+        starts = [0, *_entry_starts((match.start(), match.group())
+                                    for match in ENTRY_CANDIDATE_PATTERN.finditer(text)), len(text)]
+
+        for start, end in zip(starts, starts[1:]):
+            content = text[start:end].strip()
+            counted = MARKDOWN_HEADER_PATTERN.match(content) is not None
+            entry = self._count_markdown_entry(content) if counted else self._parse_entry(content)
+            if not entry:
+                continue
+            metrics.add(entry)
+            if 'timestamp' in entry and 'agent' in entry:
+                recent.append((entry, content if counted else None))
+            task_ids += 'task_id' in entry
+            durations += 'duration_minutes' in entry
+
+        return {
+            **metrics.summary(),
+            'recent': [self._parse_markdown_entry(content) if content is not None else entry
+                       for entry, content in recent],
+            'entries_with_task_id': task_ids,
+            'entries_with_duration': durations,
+            'consultations': consultations
+        }
+
+    def print_analysis(self, analysis: Dict):
+        """Print an analyze() dict in the analyze-progress.sh format"""
+        print("=== Agent Progress Analysis ===")
+        print(f"File: {self.progress_file}")
+        print()
+
+        print("📊 Total Entries:")
+        print(f"  {analysis['total_entries']}")
+        print()
+
+        by_status = analysis['by_status']
+        print("📈 By Status:")
+        print(f"  ✅ Complete: {by_status.get('complete', 0)}")
+        print(f"  🔄 In Progress: {by_status.get('in_progress', 0)}")
+        print(f"  ⚠️  Blocked: {by_status.get('blocked', 0)}")
+        print(f"  ❌ Failed: {by_status.get('failed', 0)}")
+        print(f"  🚧 Paused: {by_status.get('paused', 0)}")
+        print(f"  📋 Planned: {by_status.get('planned', 0)}")
+        print()
+
+        print("🤖 Most Active Agents (Top 10):")
+        top_agents = sorted(analysis['by_agent'].items(), key=lambda item: (-item[1], str(item[0])))[:10]
+        for agent, count in top_agents:
+            print(f"  {str(agent):<40} {count:>3} tasks")
+        print()
+
+        print(f"🕐 Recent Activity (Last {ANALYSIS_RECENT_LIMIT} entries):")
+        for entry in analysis['recent']:
+            agent = f"{entry.get('agent', 'unknown')}:"
+            print(f"  {entry.get('timestamp', 'N/A')} - @{agent:<30} {entry.get('task_title', 'Untitled')}")
+        print()
+
+        sections = [
+            ('📋 Task Tracking:', analysis['entries_with_task_id'], 'entries with Task IDs'),
+            ('⏱️  Duration Tracking:', analysis['entries_with_duration'], 'entries with duration info'),
+            ('📦 Deliverables:', analysis['total_deliverables'], 'files documented'),
+            ('💬 Consultations:', analysis['consultations'], 'consultation requests'),
+        ]
+        for title, count, label in sections:
+            if count > 0:
+                print(title)
+                print(f"  {count} {label}")
+                print()
+
+        print("===================================")
+        print()
+        print("💡 Tip: Use 'python3 tools/parse-progress.py' for detailed analysis")
+        print("        or 'tools/validate-progress.sh' to validate format")
+
+    def print_summary_report(self, entries: Iterable[Dict]):
         """Print a human-readable summary report"""
-        if not entries:
+        self.print_metrics_report(ProgressMetrics().update(entries))
+
+    def print_metrics_report(self, metrics: ProgressMetrics):
+        """Print a human-readable summary report from accumulated metrics"""
+        self._print_report(metrics.summary(), metrics.recent())
+
+    def _print_report(self, summary: Dict, recent: List[Dict]):
+        """Print the report for a get_metrics_summary() dict and the newest entries"""
+        if not summary['total_entries']:
             print("No entries found.")
             return
 
-        summary = self.get_metrics_summary(entries)
-
         print("=" * 60)
         print("AGENT PROGRESS SUMMARY REPORT")
         print("=" * 60)
@@ -360,7 +996,7 @@ class AgentProgressParser:
 
         print("📈 By Status:")
         for status, count in sorted(summary['by_status'].items()):
-            emoji = {'complete': '✅', 'in_progress': '🔄', 'blocked': '⚠️', 'failed': '❌', 'paused': '🚧', 'planned': '📋'}.get(status, '📍')
+            emoji = STATUS_EMOJI.get(status, '📍')
             print(f"  {emoji} {status.replace('_', ' ').title()}: {count}")
         print()
 
@@ -372,18 +1008,745 @@ class AgentProgressParser:
 
         # Recent activity
         print("🕐 Recent Activity (Last 5 entries):")
-        recent = sorted(entries, key=lambda x: x.get('timestamp', ''), reverse=True)[:5]
         for entry in recent:
             timestamp = entry.get('timestamp', 'N/A')
             agent = entry.get('agent', 'unknown')
             task = entry.get('task_title', 'Untitled')
             status = entry.get('status', 'unknown')
-            emoji = {'complete': '✅', 'in_progress': '🔄', 'blocked': '⚠️', 'failed': '❌', 'paused': '🚧', 'planned': '📋'}.get(status, '📍')
+            emoji = STATUS_EMOJI.get(status, '📍')
             print(f"  {emoji} {timestamp} - @{agent}: {task}")
         print()
         print("=" * 60)
 
 
+class AppendScanner:
+    """
+    Finds the entries appended to a progress file since the last scan
+
+    Everything before `offset` has already been consumed; the entry that
+    starts at `offset` is the last one seen and may still be growing, so it
+    is re-read on every scan. Truncation or replacement (new inode, size below
+    the offset, or changed leading bytes) restarts from zero.
+    """
+
+    HEAD_BYTES = 4096
+    STATE_FIELDS = ('inode', 'offset', 'size', 'mtime_ns', 'head_hash')
+
+    def __init__(self, progress_parser: 'AgentProgressParser', state: Optional[Dict] = None):
+        self.parser = progress_parser
+        self.reset()
+        if state:
+            for key in self.STATE_FIELDS:
+                setattr(self, key, state[key])
+            self.inode = tuple(self.inode) if self.inode else None
+
+    def reset(self, stat: Optional[os.stat_result] = None):
+        """Forget everything consumed so far"""
+        self.inode = (stat.st_dev, stat.st_ino) if stat else None
+        self.offset = 0
+        self.size = 0
+        self.mtime_ns = 0
+        self.head_hash = ''
+
+    def state(self) -> Dict:
+        """Serializable scan position"""
+        state = {key: getattr(self, key) for key in self.STATE_FIELDS}
+        state['inode'] = list(self.inode) if self.inode else None
+        return state
+
+    def check(self, stat: os.stat_result) -> str:
+        """
+        Compare the file with the scan position
+
+        Returns:
+            'reset' (truncated/replaced; position cleared), 'unchanged' or 'changed'
+        """
+        if ((stat.st_dev, stat.st_ino) != self.inode or stat.st_size < self.offset
+                or (self.offset and self._head_hash(self.offset) != self.head_hash)):
+            self.reset(stat)
+            return 'reset'
+        if (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns):
+            return 'unchanged'
+        return 'changed'
+
+    def scan(self, stat: os.stat_result, on_final: Callable[[int, str], None]) -> List[Tuple[int, str]]:
+        """
+        Read from the scan position to the end of the file
+
+        Args:
+            stat: Result of os.stat() passed to check()
+            on_final: Called with (byte offset, text) for each entry that is now complete
+
+        Returns:
+            [(byte offset, text)] of the trailing entries that may still grow
+        """
+        # An entry is final once the (complete) line starting the next one has been seen
+        complete_end = self._complete_lines_end(stat.st_size)
+        held: List[Tuple[int, str]] = []
+        for start, content in self.parser._iter_raw_entries(self.offset):
+            if held and start < complete_end:
+                for final_start, final_content in held:
+                    on_final(final_start, final_content)
+                held = []
+            held.append((start, content))
+
+        if held:
+            self.offset = held[0][0]
+        self.size, self.mtime_ns = stat.st_size, stat.st_mtime_ns
+        self.head_hash = self._head_hash(self.offset) if self.offset else ''
+        return held
+
+    def _head_hash(self, length: int) -> str:
+        """Hash of the first `length` bytes (at most HEAD_BYTES) of the file"""
+        with open(self.parser.progress_file, 'rb') as f:
+            return hashlib.sha256(f.read(min(length, self.HEAD_BYTES))).hexdigest()
+
+    def _complete_lines_end(self, size: int) -> int:
+        """Byte offset just past the last newline at or after `offset` (a half-written line starts there)"""
+        block = 65536
+        with open(self.parser.progress_file, 'rb') as f:
+            end = size
+            while end > self.offset:
+                start = max(self.offset, end - block)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b'\n')
+                if newline != -1:
+                    return start + newline + 1
+                end = start
+        return self.offset
+
+
+class ProgressFollower:
+    """
+    Incremental metrics for a growing progress file, persisted in a cursor file
+
+    The cursor holds the AppendScanner position and the ProgressMetrics of
+    every entry before it; the still-open last entry is only counted in the
+    view returned by poll().
+    """
+
+    CURSOR_VERSION = 1
+
+    def __init__(self, progress_parser: 'AgentProgressParser', cursor_file: Optional[str] = None,
+                 filters: Optional[Dict] = None):
+        """
+        Args:
+            progress_parser: Parser for the progress file
+            cursor_file: Where to persist the cursor between runs (None = in memory only)
+            filters: filter_entries() keyword arguments applied to every entry
+        """
+        self.parser = progress_parser
+        self.cursor_file = Path(cursor_file) if cursor_file else None
+        self.filters = filters or {}
+        self.scanner = AppendScanner(progress_parser)
+        self.metrics = ProgressMetrics()
+        self._view: Optional[ProgressMetrics] = None
+        self._load_cursor()
+
+    def _load_cursor(self):
+        if not self.cursor_file or not self.cursor_file.exists():
+            return
+        try:
+            with open(self.cursor_file, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable cursor {self.cursor_file}: {e}", file=sys.stderr)
+            return
+
+        # A cursor for another file or filter set says nothing about this run
+        if (state.get('version') != self.CURSOR_VERSION or state.get('mode', 'follow') != 'follow'
+                or state.get('file') != str(self.parser.progress_file.resolve())
+                or state.get('filters') != self.filters):
+            return
+
+        self.scanner = AppendScanner(self.parser, state['scan'])
+        self.metrics = ProgressMetrics.from_dict(state['metrics'])
+
+    def _save_cursor(self):
+        if not self.cursor_file:
+            return
+        state = {
+            'version': self.CURSOR_VERSION,
+            'mode': 'follow',
+            'file': str(self.parser.progress_file.resolve()),
+            'filters': self.filters,
+            'scan': self.scanner.state(),
+            'metrics': self.metrics.to_dict()
+        }
+        tmp_file = self.cursor_file.with_name(f"{self.cursor_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(state, f, default=str)
+        os.replace(tmp_file, self.cursor_file)
+
+    def _fold(self, metrics: ProgressMetrics, content: str):
+        entry = self.parser._parse_entry(content)
+        if entry:
+            metrics.update(self.parser.filter_entries([entry], **self.filters))
+
+    def poll(self) -> Tuple[ProgressMetrics, bool]:
+        """
+        Parse whatever was appended since the last poll
+
+        Returns:
+            (metrics including the still-open last entry, whether the file changed)
+        """
+        try:
+            stat = os.stat(self.parser.progress_file)
+        except OSError:
+            print(f"Warning: {self.parser.progress_file} not found", file=sys.stderr)
+            return self._view or ProgressMetrics(), False
+
+        had_progress = self.scanner.offset > 0
+        change = self.scanner.check(stat)
+        if change == 'reset':
+            if had_progress:
+                print(f"↺ {self.parser.progress_file} was truncated or replaced; re-reading from the start",
+                      file=sys.stderr)
+            self.metrics = ProgressMetrics()
+        elif change == 'unchanged' and self._view is not None:
+            return self._view, False
+
+        held = self.scanner.scan(stat, lambda _, content: self._fold(self.metrics, content))
+        self._save_cursor()
+
+        self._view = copy.deepcopy(self.metrics)
+        for _, content in held:
+            self._fold(self._view, content)
+        return self._view, True
+
+
+@dataclass
+class ValidationIssue:
+    """A problem found in the progress file"""
+    severity: str   # 'error' or 'warning'
+    check: str      # Which check found it (agent, title, date, status, duration, progress, task_id, ...)
+    line: Optional[int]
+    message: str
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class ProgressValidator:
+    """
+    Single-pass validation of a progress file
+
+    Checks every entry's header (agent identifier, title, date and time),
+    status markers and values, duration and progress formats, task ID
+    uniqueness, deliverable files under workspaces/ and YAML frontmatter,
+    reporting issues with line numbers. With a cursor file only bytes
+    appended since the last run are checked; the task IDs, counts and line
+    position of everything before them are kept in the cursor.
+    """
+
+    CURSOR_VERSION = 1
+    COUNT_KEYS = ('entries', 'markdown_entries', 'yaml_entries', 'status_markers', 'task_ids', 'deliverables')
+
+    def __init__(self, progress_parser: 'AgentProgressParser', cursor_file: Optional[str] = None,
+                 workspaces_dir: str = "workspaces"):
+        """
+        Args:
+            progress_parser: Parser for the progress file
+            cursor_file: Where to persist the validation position (None = validate the whole file)
+            workspaces_dir: Directory that deliverable paths and the PROGRESS.md protocol check refer to
+        """
+        self.parser = progress_parser
+        self.cursor_file = Path(cursor_file) if cursor_file else None
+        self.workspaces_dir = Path(workspaces_dir)
+        self.scanner = AppendScanner(progress_parser)
+        self.state = self._initial_state()
+        self._load_cursor()
+
+    @classmethod
+    def _initial_state(cls) -> Dict:
+        return {
+            'line': 1,                # Line number of the scan position
+            'project_header': False,
+            'task_ids': {},           # Task ID -> line it was first used on
+            'counts': dict.fromkeys(cls.COUNT_KEYS, 0)
+        }
+
+    def _load_cursor(self):
+        if not self.cursor_file or not self.cursor_file.exists():
+            return
+        try:
+            with open(self.cursor_file, 'r') as f:
+                cursor = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable cursor {self.cursor_file}: {e}", file=sys.stderr)
+            return
+
+        if (cursor.get('version') != self.CURSOR_VERSION or cursor.get('mode') != 'validate'
+                or cursor.get('file') != str(self.parser.progress_file.resolve())):
+            return
+
+        self.scanner = AppendScanner(self.parser, cursor['scan'])
+        self.state = cursor['validator']
+
+    def _save_cursor(self):
+        if not self.cursor_file:
+            return
+        cursor = {
+            'version': self.CURSOR_VERSION,
+            'mode': 'validate',
+            'file': str(self.parser.progress_file.resolve()),
+            'scan': self.scanner.state(),
+            'validator': self.state
+        }
+        tmp_file = self.cursor_file.with_name(f"{self.cursor_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(cursor, f)
+        os.replace(tmp_file, self.cursor_file)
+
+    def validate(self) -> Dict:
+        """
+        Validate the file (or what was appended since the cursor)
+
+        Returns:
+            Report dict: file, incremental, valid, errors, warnings, counts
+            and issues (ValidationIssue dicts sorted by line)
+        """
+        issues: List[ValidationIssue] = []
+        incremental = self.scanner.offset > 0
+
+        try:
+            stat = os.stat(self.parser.progress_file)
+        except OSError:
+            issues.append(ValidationIssue('error', 'file', None, f"{self.parser.progress_file} not found"))
+            return self._report(issues, self.state, incremental=False)
+
+        if self.scanner.check(stat) == 'reset':
+            self.state = self._initial_state()
+            incremental = False
+
+        def check_final(_, content: str):
+            self._check_entry(self.state, content, issues)
+
+        # Entries that may still grow are checked against a copy, so they are re-checked next run
+        held = self.scanner.scan(stat, check_final)
+        self._save_cursor()
+
+        # A half-written last line is left for the next run
+        if held and not self._ends_with_newline(stat.st_size):
+            start, content = held[-1]
+            held[-1] = (start, content.rsplit('\n', 1)[0] if '\n' in content else '')
+
+        view = copy.deepcopy(self.state)
+        for _, content in held:
+            if content:
+                self._check_entry(view, content, issues)
+
+        self._check_file(view, issues)
+        return self._report(issues, view, incremental)
+
+    def _ends_with_newline(self, size: int) -> bool:
+        if not size:
+            return True
+        with open(self.parser.progress_file, 'rb') as f:
+            f.seek(size - 1)
+            return f.read(1) == b'\n'
+
+    def _check_entry(self, state: Dict, content: str, issues: List[ValidationIssue]):
+        """Check one raw entry starting at state['line'], then advance the line position"""
+        first_line = state['line']
+        state['line'] += content.count('\n') + 1
+        counts = state['counts']
+
+        line_starts = [0] + [match.end() for match in re.finditer('\n', content)]
+
+        def line_of(position: int) -> int:
+            return first_line + bisect.bisect_right(line_starts, position) - 1
+
+        def add_issue(severity: str, check: str, position: int, message: str):
+            issues.append(ValidationIssue(severity, check, line_of(position), message))
+
+        if not state['project_header'] and PROJECT_HEADER_PATTERN.search(content):
+            state['project_header'] = True
+
+        stripped = content.lstrip()
+        if stripped.startswith('---'):
+            counts['entries'] += 1
+            counts['yaml_entries'] += 1
+            self._check_yaml(content, len(content) - len(stripped), add_issue)
+        elif MARKDOWN_HEADER_PATTERN.match(stripped):
+            counts['entries'] += 1
+            counts['markdown_entries'] += 1
+
+        for header in HEADER_LINE_PATTERN.finditer(content):
+            self._check_header(header.group(), header.start(), add_issue)
+
+        for status in FIELD_PATTERNS['Status'].finditer(content):
+            counts['status_markers'] += 1
+            text = status.group(1).strip()
+            if not any(emoji in text or word in text for emoji, word, _ in STATUS_MARKERS):
+                add_issue('warning', 'status', status.start(), f"Non-standard status marker: {text[:40]}")
+
+        for duration in DURATION_FIELD_PATTERN.finditer(content):
+            if not DURATION_VALUE_PATTERN.match(duration.group(1)):
+                add_issue('warning', 'duration', duration.start(),
+                          f"Duration should look like '2h 30m', '2h' or '45m': {duration.group(1)[:40]}")
+
+        for progress in PROGRESS_FIELD_PATTERN.finditer(content):
+            value = PROGRESS_VALUE_PATTERN.match(progress.group(1))
+            if not value or int(value.group(1)) > 100:
+                add_issue('warning', 'progress', progress.start(),
+                          f"Progress should be a percentage from 0% to 100%: {progress.group(1)[:40]}")
+
+        for task_id in FIELD_PATTERNS['Task ID'].finditer(content):
+            counts['task_ids'] += 1
+            first_use = state['task_ids'].get(task_id.group(1))
+            if first_use is None:
+                state['task_ids'][task_id.group(1)] = line_of(task_id.start())
+            else:
+                add_issue('error', 'task_id', task_id.start(),
+                          f"Duplicate task ID {task_id.group(1)} (first used on line {first_use})")
+
+        for deliverable in DELIVERABLE_LINE_PATTERN.finditer(content):
+            counts['deliverables'] += 1
+            path = deliverable.group(1)
+            if path.startswith(f"{self.workspaces_dir.as_posix()}/") and not Path(path).is_file():
+                add_issue('warning', 'deliverable', deliverable.start(), f"Missing deliverable: {path}")
+
+    def _check_header(self, header: str, position: int, add_issue: Callable):
+        """Agent identifier, title, date and time of a `## YYYY-MM-DD` header line"""
+        shown = header[:80]
+        problems = 0
+        if not AGENT_ID_PATTERN.search(header):
+            add_issue('error', 'agent', position, f"Entry missing agent identifier: {shown}")
+            problems += 1
+        if not TITLE_PATTERN.search(header):
+            add_issue('warning', 'title', position, f"Entry missing task title: {shown}")
+            problems += 1
+
+        year, month, day, hour, minute = HEADER_DATE_PATTERN.match(header).groups()
+        try:
+            datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0))
+        except ValueError:
+            add_issue('error', 'date', position, f"Invalid date or time: {shown}")
+            problems += 1
+
+        if not problems and not ENTRY_HEADER_PATTERN.match(header):
+            add_issue('warning', 'header', position,
+                      f"Header does not match '## YYYY-MM-DD HH:MM - @agent-name: Task Title': {shown}")
+
+    def _check_yaml(self, content: str, position: int, add_issue: Callable):
+        """Syntax, agent, status and timestamp of a YAML frontmatter entry"""
+        block = YAML_BLOCK_PATTERN.search(content, position)
+        if not block:
+            add_issue('error', 'yaml', position, "Unterminated YAML frontmatter (missing closing ---)")
+            return
+
+        try:
+            data = load_cached(block.group(1))
+        except YAMLError as e:
+            mark = getattr(e, 'problem_mark', None)
+            add_issue('error', 'yaml', block.start(1) + (mark.index if mark else 0),
+                      f"YAML syntax error: {getattr(e, 'problem', None) or e}")
+            return
+
+        if not isinstance(data, dict):
+            add_issue('error', 'yaml', block.start(), "YAML frontmatter is not a mapping")
+            return
+
+        if not data.get('agent'):
+            add_issue('error', 'agent', block.start(), "YAML entry missing agent")
+
+        status = data.get('status')
+        if status is not None and status not in VALID_STATUSES:
+            add_issue('warning', 'status', block.start(),
+                      f"Non-standard status '{status}' (expected one of: {', '.join(VALID_STATUSES)})")
+
+        timestamp = data.get('timestamp')
+        if isinstance(timestamp, str):
+            match = TIMESTAMP_BUCKET_PATTERN.match(timestamp)
+            try:
+                if not match:
+                    raise ValueError
+                datetime(*(int(part) for part in match.groups()[:3]), int(match.group(4) or 0))
+            except ValueError:
+                add_issue('error', 'date', block.start(), f"Invalid timestamp: {timestamp[:40]}")
+
+    def _check_file(self, state: Dict, issues: List[ValidationIssue]):
+        """Checks that look at the whole file rather than one entry"""
+        if not state['project_header']:
+            issues.append(ValidationIssue('warning', 'project_header', None,
+                                          "Missing '# Project:' header (recommended)"))
+        if state['counts']['entries'] and not state['counts']['status_markers'] \
+                and not state['counts']['yaml_entries']:
+            issues.append(ValidationIssue('warning', 'status', None, "No status markers found (recommended to add)"))
+
+        if self.workspaces_dir.is_dir():
+            for progress_file in sorted(self.workspaces_dir.rglob("PROGRESS.md")):
+                issues.append(ValidationIssue(
+                    'error', 'workspace', None,
+                    f"Separate progress file {progress_file} (use SHARED_PROGRESS.md only)"
+                ))
+
+    def _report(self, issues: List[ValidationIssue], state: Dict, incremental: bool) -> Dict:
+        issues.sort(key=lambda issue: (issue.line is not None, issue.line or 0))
+        errors = sum(issue.severity == 'error' for issue in issues)
+        return {
+            'file': str(self.parser.progress_file),
+            'incremental': incremental,
+            'valid': errors == 0,
+            'errors': errors,
+            'warnings': len(issues) - errors,
+            'counts': dict(state['counts']),
+            'issues': [issue.to_dict() for issue in issues]
+        }
+
+
+def print_validation_report(report: Dict):
+    """Print a ProgressValidator report in the validate-progress.sh style"""
+    scope = " (appended entries only)" if report['incremental'] else ""
+    print(f"🔍 Validating {report['file']}{scope}...")
+    print()
+
+    for issue in report['issues']:
+        emoji = '❌' if issue['severity'] == 'error' else '⚠️ '
+        where = f"line {issue['line']}" if issue['line'] is not None else "file"
+        print(f"  {emoji} {where} [{issue['check']}]: {issue['message']}")
+    if report['issues']:
+        print()
+
+    counts = report['counts']
+    print(f"  Checked {counts['entries']} entries ({counts['markdown_entries']} markdown, "
+          f"{counts['yaml_entries']} YAML), {counts['status_markers']} status markers, "
+          f"{counts['task_ids']} task IDs, {counts['deliverables']} deliverables")
+
+    print()
+    print("===================================")
+    print("VALIDATION SUMMARY")
+    print("===================================")
+    print()
+
+    if report['errors'] == 0 and report['warnings'] == 0:
+        print("✅ Validation passed with no issues!")
+        print()
+        print("Your SHARED_PROGRESS.md follows all protocols correctly.")
+    elif report['errors'] == 0:
+        print("✅ Validation passed")
+        print(f"⚠️  Found {report['warnings']} warnings (non-critical)")
+        print()
+        print("Your file is valid but could be enhanced by addressing the warnings above.")
+    else:
+        print("❌ Validation failed")
+        print(f"   Errors: {report['errors']}")
+        print(f"   Warnings: {report['warnings']}")
+        print()
+        print("Please fix the errors above before proceeding.")
+
+
+class JsonArrayWriter:
+    """
+    Write a JSON array one element at a time
+
+    Output is identical to json.dump(items, f, indent=2, default=str). The
+    file is created on the first write, so an abandoned writer leaves nothing
+    behind; close() writes an empty array if nothing was written.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self._file = None
+        self.count = 0
+
+    def write(self, item):
+        if self._file is None:
+            self._file = open(self.output_file, 'w')
+            self._file.write('[\n')
+        else:
+            self._file.write(',\n')
+        text = json.dumps(item, indent=2, default=str)
+        self._file.write('  ' + text.replace('\n', '\n  '))
+        self.count += 1
+
+    def close(self):
+        if self._file is None:
+            with open(self.output_file, 'w') as f:
+                f.write('[]')
+            return
+        self._file.write('\n]')
+        self._file.close()
+        self._file = None
+
+
+class NdjsonWriter:
+    """
+    Write one compact JSON document per line
+
+    The file is created on the first write; close() creates an empty file if
+    nothing was written.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self._file = None
+        self.count = 0
+
+    def write(self, item):
+        if self._file is None:
+            self._file = open(self.output_file, 'w')
+        self._file.write(json.dumps(item, separators=(',', ':'), default=str))
+        self._file.write('\n')
+        self.count += 1
+
+    def close(self):
+        if self._file is None:
+            open(self.output_file, 'w').close()
+            return
+        self._file.close()
+        self._file = None
+
+
+class CsvRowWriter:
+    """
+    Write flattened rows to CSV as they arrive
+
+    Rows are streamed to a temporary file next to the output while the
+    columns (the union of every row's keys, in first-seen order) are
+    collected; close() writes the header and moves the rows into place,
+    padding rows written before a column first appeared. The temporary
+    file is created on the first write, so no rows means no file.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = Path(output_file)
+        self._tmp_file = self.output_file.with_name(f"{self.output_file.name}.{os.getpid()}.tmp")
+        self._file = None
+        self._writer = None
+        self._columns: Dict[str, int] = {}
+        self._first_width = 0
+        self.count = 0
+
+    def write(self, row: Dict):
+        import csv
+        if self._file is None:
+            self._file = open(self._tmp_file, 'w', newline='')
+            self._writer = csv.writer(self._file)
+            self._columns = dict.fromkeys(row)
+            self._first_width = len(self._columns)
+        elif row.keys() != self._columns.keys():
+            for key in row:
+                self._columns.setdefault(key)
+        self._writer.writerow([row.get(key, '') for key in self._columns])
+        self.count += 1
+
+    def close(self):
+        import csv
+        import shutil
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+
+        with open(self.output_file, 'w', newline='') as out, open(self._tmp_file, 'r', newline='') as rows:
+            csv.writer(out).writerow(self._columns)
+            if len(self._columns) == self._first_width:
+                shutil.copyfileobj(rows, out)
+            else:
+                writer = csv.writer(out)
+                width = len(self._columns)
+                for values in csv.reader(rows):
+                    writer.writerow(values + [''] * (width - len(values)))
+        os.remove(self._tmp_file)
+
+
+def _counted(entries: Iterable[Dict], counts: Dict[str, int], stage: str) -> Iterator[Dict]:
+    """Pass entries through, counting how many reach this stage"""
+    counts[stage] = 0
+    for entry in entries:
+        counts[stage] += 1
+        yield entry
+
+
+def follow_progress(args):
+    """Incremental summary from a cursor, once or continuously (--follow)"""
+    filters = {}
+    if args.agent:
+        filters['agent'] = args.agent
+    if args.status:
+        filters['status'] = args.status
+    if args.start_date and args.end_date:
+        filters.update(start_date=args.start_date, end_date=args.end_date)
+
+    progress_parser = AgentProgressParser(args.file)
+    follower = ProgressFollower(progress_parser, args.cursor, filters)
+
+    if not args.follow:
+        metrics, _ = follower.poll()
+        if not metrics.total_entries:
+            print(f"No entries found in {args.file}", file=sys.stderr)
+            sys.exit(1)
+        if not args.quiet:
+            progress_parser.print_metrics_report(metrics)
+        return
+
+    print(f"👀 Following {args.file} (Ctrl+C to stop)")
+    try:
+        while True:
+            metrics, changed = follower.poll()
+            if changed and not args.quiet:
+                print(f"\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                progress_parser.print_metrics_report(metrics)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopped following")
+
+
+def query_store(args):
+    """Ingest appended entries into the SQLite store, then filter/export/summarize with SQL"""
+    progress_parser = AgentProgressParser(args.file)
+
+    with ProgressStore(args.db) as store:
+        added = progress_parser.ingest(store)
+        if not args.quiet:
+            print(f"🗄️  Ingested {added} new entries into {args.db}", file=sys.stderr)
+
+        source_id = store.source_id(args.file)
+        filters = {}
+
+        # Report the first filter that leaves nothing, as the streaming path does
+        stages = [(None, None, f"No entries found in {args.file}")]
+        if args.agent:
+            stages.append(('agent', args.agent, f"No entries found for agent: {args.agent}"))
+        if args.status:
+            stages.append(('status', args.status, f"No entries found with status: {args.status}"))
+        if args.start_date and args.end_date:
+            stages.append(('dates', None, f"No entries found between {args.start_date} and {args.end_date}"))
+
+        for key, value, message in stages:
+            if key == 'dates':
+                filters.update(start_date=args.start_date, end_date=args.end_date)
+            elif key:
+                filters[key] = value
+            if not store.count(source_id, **filters):
+                print(message, file=sys.stderr)
+                sys.exit(1)
+
+        exports = [
+            (args.json, progress_parser.export_to_json),
+            (args.ndjson, progress_parser.export_to_ndjson),
+            (args.csv, progress_parser.export_to_csv),
+            (args.columnar, progress_parser.export_to_columnar),
+        ]
+        for output_file, export in exports:
+            if output_file:
+                export(store.query_entries(source_id, **filters), output_file)
+                if not args.quiet:
+                    print(f"Exported {store.count(source_id, **filters)} entries to {output_file}")
+
+        if not args.quiet:
+            progress_parser._print_report(
+                store.metrics_summary(source_id, **filters),
+                store.recent_entries(source_id, **filters)
+            )
+            if args.rollup:
+                progress_parser.print_rollup_report(
+                    progress_parser.get_rollup(store.query_entries(source_id, **filters), args.rollup)
+                )
+
+
 def main():
     """Main CLI interface"""
     import argparse
@@ -396,52 +1759,126 @@ def main():
     parser.add_argument('--start-date', help='Filter by start date (YYYY-MM-DD)')
     parser.add_argument('--end-date', help='Filter by end date (YYYY-MM-DD)')
     parser.add_argument('--json', help='Export to JSON file')
+    parser.add_argument('--ndjson', help='Export to newline-delimited JSON file (one entry per line)')
     parser.add_argument('--csv', help='Export to CSV file')
+    parser.add_argument('--columnar', help='Export flattened entries to a binary columnar file (see progress_columnar.py)')
+    parser.add_argument('--rollup', choices=ROLLUP_GRANULARITIES,
+                        help='Also report metrics per hour/day/week, broken down by agent and status')
+    parser.add_argument('--analyze', action='store_true',
+                        help='Print the analyze-progress.sh report (computed in one pass over the file)')
+    parser.add_argument('--validate', nargs='?', const='text', choices=('text', 'json'),
+                        help='Validate the file format (json: machine-readable report for CI); '
+                             'with --cursor only appended entries are checked')
     parser.add_argument('--quiet', action='store_true', help='Suppress summary output (for exports only)')
+    parser.add_argument('--cursor', help='Checkpoint file: parse only bytes appended since the last run')
+    parser.add_argument('--follow', action='store_true', help='Keep watching the file and reprint the summary as it grows')
+    parser.add_argument('--interval', type=float, default=2.0, help='Seconds between checks with --follow (default: 2)')
+    parser.add_argument('--db', help='Ingest new entries into this SQLite database and answer filters/summary from it')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Parse large files with N worker processes (0 = one per CPU; default: 1)')
 
     args = parser.parse_args()
 
-    # Parse entries
-    progress_parser = AgentProgressParser(args.file)
-    entries = progress_parser.parse_all()
+    if args.validate:
+        others = [args.agent, args.status, args.start_date, args.end_date, args.json, args.ndjson, args.csv,
+                  args.columnar, args.follow, args.db, args.rollup, args.analyze, args.jobs != 1]
+        if any(others):
+            parser.error("--validate can only be combined with --cursor")
+        report = ProgressValidator(AgentProgressParser(args.file), args.cursor).validate()
+        if args.validate == 'json':
+            print(json.dumps(report, indent=2))
+        else:
+            print_validation_report(report)
+        sys.exit(0 if report['valid'] else 1)
+
+    if args.analyze:
+        others = [args.agent, args.status, args.start_date, args.end_date, args.json, args.ndjson, args.csv,
+                  args.columnar, args.cursor, args.follow, args.db, args.rollup, args.jobs != 1]
+        if any(others):
+            parser.error("--analyze reports on the whole file; it cannot be combined with filters, exports or other modes")
+        progress_parser = AgentProgressParser(args.file)
+        progress_parser.print_analysis(progress_parser.analyze())
+        return
+
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+    if args.jobs != 1 and (args.db or args.cursor or args.follow):
+        parser.error("--jobs applies to full parses only; it cannot be combined with --db/--cursor/--follow")
+
+    if args.db and (args.cursor or args.follow):
+        parser.error("--db cannot be combined with --cursor/--follow")
+
+    if args.db:
+        return query_store(args)
+
+    if (args.cursor or args.follow) and args.rollup:
+        parser.error("--rollup cannot be combined with --cursor/--follow")
+
+    if (args.cursor or args.follow) and (args.json or args.ndjson or args.csv or args.columnar):
+        parser.error("--cursor/--follow keep running aggregates only; they cannot be combined with exports")
+
+    if args.cursor or args.follow:
+        return follow_progress(args)
+
+    # Stream entries through the filters, exports and metrics in a single pass
+    progress_parser = AgentProgressParser(args.file, jobs=args.jobs or os.cpu_count() or 1)
+    counts: Dict[str, int] = {}
+    entries = _counted(progress_parser.iter_entries(), counts, 'parsed')
 
-    if not entries:
-        print(f"No entries found in {args.file}", file=sys.stderr)
-        sys.exit(1)
-
-    # Apply filters
     if args.agent:
-        entries = progress_parser.filter_by_agent(entries, args.agent)
-        if not entries:
-            print(f"No entries found for agent: {args.agent}", file=sys.stderr)
-            sys.exit(1)
-
+        entries = _counted(progress_parser.filter_entries(entries, agent=args.agent), counts, 'agent')
     if args.status:
-        entries = progress_parser.filter_by_status(entries, args.status)
-        if not entries:
-            print(f"No entries found with status: {args.status}", file=sys.stderr)
-            sys.exit(1)
-
+        entries = _counted(progress_parser.filter_entries(entries, status=args.status), counts, 'status')
     if args.start_date and args.end_date:
-        entries = progress_parser.filter_by_date_range(entries, args.start_date, args.end_date)
-        if not entries:
-            print(f"No entries found between {args.start_date} and {args.end_date}", file=sys.stderr)
-            sys.exit(1)
+        entries = _counted(
+            progress_parser.filter_entries(entries, start_date=args.start_date, end_date=args.end_date),
+            counts, 'date'
+        )
 
-    # Export if requested
-    if args.json:
-        progress_parser.export_to_json(entries, args.json)
-        if not args.quiet:
-            print(f"Exported {len(entries)} entries to {args.json}")
+    # (output file, writer, row for an entry)
+    exports = [
+        (output_file, writer_class(output_file), to_row)
+        for output_file, writer_class, to_row in [
+            (args.json, JsonArrayWriter, None),
+            (args.ndjson, NdjsonWriter, None),
+            (args.csv, CsvRowWriter, progress_parser._flatten_entry),
+            (args.columnar, ColumnarWriter, lambda entry: progress_parser._flatten_entry(entry, missing=None)),
+        ]
+        if output_file
+    ]
+    metrics = ProgressMetrics()
+    rollup = ProgressRollup(args.rollup) if args.rollup else None
+
+    for entry in entries:
+        metrics.add(entry)
+        if rollup:
+            rollup.add(entry)
+        for _, writer, to_row in exports:
+            writer.write(to_row(entry) if to_row else entry)
+
+    # Report the first stage that left nothing (no export files are created in that case)
+    empty_messages = [
+        ('parsed', f"No entries found in {args.file}"),
+        ('agent', f"No entries found for agent: {args.agent}"),
+        ('status', f"No entries found with status: {args.status}"),
+        ('date', f"No entries found between {args.start_date} and {args.end_date}"),
+    ]
+    for stage, message in empty_messages:
+        if counts.get(stage) == 0:
+            print(message, file=sys.stderr)
+            sys.exit(1)
 
-    if args.csv:
-        progress_parser.export_to_csv(entries, args.csv)
+    # Finish exports
+    for output_file, writer, _ in exports:
+        writer.close()
         if not args.quiet:
-            print(f"Exported {len(entries)} entries to {args.csv}")
+            print(f"Exported {metrics.total_entries} entries to {output_file}")
 
     # Print summary unless quiet mode
     if not args.quiet:
-        progress_parser.print_summary_report(entries)
+        progress_parser.print_metrics_report(metrics)
+        if rollup:
+            progress_parser.print_rollup_report(rollup)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Compact binary columnar format for flattened progress entries
+Rows are buffered into row groups and written column by column, with the
+schema (the union of every column seen) in a JSON footer, so readers can
+load just the columns they need without parsing the rest of the file
+
+Layout:
+    magic | row group column chunks ... | footer JSON | footer length (u64) | magic
+
+Each column chunk holds an optional validity bitmap (bit i set when row i
+is not null, least significant bit first), then the values: little-endian
+int64/float64 arrays, one byte per bool, or int64 offsets followed by UTF-8
+data for strings. These are Arrow's buffer layouts (string columns match
+large_string), so chunks can be handed to Arrow without conversion.
+"""
+
+import sys
+import json
+import mmap
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+MAGIC = b'PGCOL01\n'
+FORMAT_VERSION = 1
+FOOTER_LENGTH = 8
+ROW_GROUP_SIZE = 65536
+COMPRESSIONS = ('zlib', 'none')
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _column_type(values: list) -> str:
+    """Narrowest type that holds every non-null value"""
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            kinds.add('bool')
+        elif isinstance(value, int):
+            kinds.add('int64' if INT64_MIN <= value <= INT64_MAX else 'string')
+        elif isinstance(value, float):
+            kinds.add('float64')
+        else:
+            kinds.add('string')
+    return _merge_types(kinds)
+
+
+def _merge_types(kinds: set) -> str:
+    """One type for a column whose values (or row group chunks) have these types"""
+    kinds = set(kinds) - {'null'}
+    if not kinds:
+        return 'null'
+    if len(kinds) == 1:
+        return kinds.pop()
+    return 'float64' if kinds == {'int64', 'float64'} else 'string'
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _encode_chunk(values: list, kind: str) -> tuple:
+    """(validity bytes, offsets bytes, data bytes, null count) for one column chunk"""
+    null_count = sum(value is None for value in values)
+    validity = b''
+    if 0 < null_count < len(values):
+        bitmap = bytearray((len(values) + 7) // 8)
+        for i, value in enumerate(values):
+            if value is not None:
+                bitmap[i >> 3] |= 1 << (i & 7)
+        validity = bytes(bitmap)
+
+    offsets = b''
+    if kind == 'int64':
+        data = _little_endian(array('q', (0 if value is None else value for value in values)))
+    elif kind == 'float64':
+        data = _little_endian(array('d', (0.0 if value is None else value for value in values)))
+    elif kind == 'bool':
+        data = bytes(1 if value else 0 for value in values)
+    elif kind == 'string':
+        encoded = [b'' if value is None else (value if isinstance(value, str) else str(value)).encode('utf-8')
+                   for value in values]
+        positions = array('q', [0])
+        total = 0
+        for item in encoded:
+            total += len(item)
+            positions.append(total)
+        offsets = _little_endian(positions)
+        data = b''.join(encoded)
+    else:  # all null
+        data = b''
+
+    return validity, offsets, data, null_count
+
+
+def _cast(values: list, chunk_type: str, table_type: str) -> list:
+    """Convert chunk values to the table-level column type"""
+    if chunk_type == table_type or chunk_type == 'null':
+        return values
+    if table_type == 'float64':
+        return [None if value is None else float(value) for value in values]
+    return [None if value is None else str(value) for value in values]
+
+
+class ColumnarWriter:
+    """
+    Stream rows into a columnar file
+
+    Rows are dicts of scalar values (None for missing); columns may appear
+    at any row and are null in earlier rows. The file is created on the
+    first row group (or at close() when nothing was written).
+    """
+
+    def __init__(self, output_file: str, row_group_size: int = ROW_GROUP_SIZE, compression: str = 'zlib'):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}' (choose from: {', '.join(COMPRESSIONS)})")
+        self.output_file = Path(output_file)
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.count = 0
+        self._file = None
+        self._columns: Dict[str, List] = {}   # Column values of the pending row group, in first-seen order
+        self._types: Dict[str, set] = {}      # Chunk types seen per column
+        self._pending = 0
+        self._row_groups: List[Dict] = []
+
+    def write(self, row: Dict):
+        pending = self._pending
+        for name, value in row.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = [None] * pending
+                self._types.setdefault(name, set())
+            column.append(value)
+        self._pending = pending + 1
+        for column in self._columns.values():
+            if len(column) < self._pending:
+                column.append(None)
+
+        self.count += 1
+        if self._pending >= self.row_group_size:
+            self._flush_row_group()
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.output_file, 'wb')
+            self._file.write(MAGIC)
+
+    def _flush_row_group(self):
+        if not self._pending:
+            return
+        self._open()
+
+        chunks = {}
+        for name, values in self._columns.items():
+            kind = _column_type(values)
+            self._types[name].add(kind)
+            validity, offsets, data, null_count = _encode_chunk(values, kind)
+            payload = validity + offsets + data
+            if self.compression == 'zlib':
+                payload = zlib.compress(payload, 1)
+            chunks[name] = {
+                'type': kind,
+                'offset': self._file.tell(),
+                'length': len(payload),
+                'validity_length': len(validity),
+                'offsets_length': len(offsets),
+                'null_count': null_count,
+            }
+            self._file.write(payload)
+
+        self._row_groups.append({'rows': self._pending, 'columns': chunks})
+        self._columns = {name: [] for name in self._columns}
+        self._pending = 0
+
+    def close(self):
+        """Write the last row group and the footer"""
+        self._flush_row_group()
+        self._open()
+
+        footer = {
+            'version': FORMAT_VERSION,
+            'rows': self.count,
+            'compression': self.compression,
+            'columns': [{'name': name, 'type': _merge_types(kinds)} for name, kinds in self._types.items()],
+            'row_groups': self._row_groups,
+        }
+        footer_bytes = json.dumps(footer, separators=(',', ':')).encode('utf-8')
+        self._file.write(footer_bytes)
+        self._file.write(len(footer_bytes).to_bytes(FOOTER_LENGTH, 'little'))
+        self._file.write(MAGIC)
+        self._file.close()
+        self._file = None
+
+
+class ColumnarReader:
+    """Read whole columns (or rows of selected columns) from a columnar file"""
+
+    def __init__(self, input_file: str):
+        self.input_file = Path(input_file)
+        self._file = open(self.input_file, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            trailer = len(MAGIC) + FOOTER_LENGTH
+            if (len(self._mmap) < len(MAGIC) + trailer or self._mmap[:len(MAGIC)] != MAGIC
+                    or self._mmap[-len(MAGIC):] != MAGIC):
+                raise ValueError(f"Not a progress columnar file: {self.input_file}")
+            footer_length = int.from_bytes(self._mmap[-trailer:-len(MAGIC)], 'little')
+            self.footer = json.loads(self._mmap[-trailer - footer_length:-trailer])
+            if self.footer.get('version') != FORMAT_VERSION:
+                raise ValueError(f"{self.input_file} has format version {self.footer.get('version')}, "
+                                 f"expected {FORMAT_VERSION}")
+        except ValueError:
+            self.close()
+            raise
+
+        self.types = {column['name']: column['type'] for column in self.footer['columns']}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def num_rows(self) -> int:
+        return self.footer['rows']
+
+    @property
+    def schema(self) -> List[Dict]:
+        """[{'name': ..., 'type': ...}] in column order"""
+        return self.footer['columns']
+
+    def column(self, name: str) -> list:
+        """Every value of one column, in row order (None for nulls)"""
+        if name not in self.types:
+            raise KeyError(f"No column '{name}' in {self.input_file}")
+
+        values = []
+        for group in self.footer['row_groups']:
+            chunk = group['columns'].get(name)
+            if chunk is None:
+                values.extend([None] * group['rows'])
+            else:
+                values.extend(_cast(self._decode(chunk, group['rows']), chunk['type'], self.types[name]))
+        return values
+
+    def read(self, columns: Optional[List[str]] = None) -> Dict[str, list]:
+        """{column: values} for the selected columns (default: all)"""
+        return {name: self.column(name) for name in (columns or list(self.types))}
+
+    def rows(self, columns: Optional[List[str]] = None) -> Iterator[Dict]:
+        """Rows as dicts of the selected columns"""
+        data = self.read(columns)
+        names = list(data)
+        for values in zip(*data.values()):
+            yield dict(zip(names, values))
+
+    def _decode(self, chunk: Dict, rows: int) -> list:
+        payload = self._mmap[chunk['offset']:chunk['offset'] + chunk['length']]
+        if self.footer['compression'] == 'zlib':
+            payload = zlib.decompress(payload)
+
+        validity_end = chunk['validity_length']
+        offsets_end = validity_end + chunk['offsets_length']
+        kind = chunk['type']
+
+        if kind == 'int64':
+            values = _from_little_endian('q', payload[offsets_end:]).tolist()
+        elif kind == 'float64':
+            values = _from_little_endian('d', payload[offsets_end:]).tolist()
+        elif kind == 'bool':
+            values = [byte == 1 for byte in payload[offsets_end:]]
+        elif kind == 'string':
+            positions = _from_little_endian('q', payload[validity_end:offsets_end])
+            data = payload[offsets_end:]
+            values = [data[positions[i]:positions[i + 1]].decode('utf-8') for i in range(rows)]
+        else:
+            return [None] * rows
+
+        if chunk['null_count']:
+            bitmap = payload[:validity_end]
+            values = [value if bitmap[i >> 3] >> (i & 7) & 1 else None for i, value in enumerate(values)]
+        return values
+
+    def close(self):
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
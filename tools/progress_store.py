@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+SQLite store for parsed agent progress entries
+Keeps entries, deliverables and metrics in indexed tables so filters and
+summaries are answered by SQL instead of re-parsing SHARED_PROGRESS.md
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+SCHEMA_VERSION = 1
+
+# Metric names treated as test coverage, in priority order
+COVERAGE_KEYS = ('test_coverage', 'Test Coverage', 'test_coverage_percent')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    scan_state TEXT
+);
+
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    byte_offset INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    entry_date TEXT,
+    agent TEXT,
+    status TEXT,
+    task_id TEXT,
+    task_title TEXT,
+    duration_minutes,  -- untyped: keeps ints as ints so SUM matches Python's sum
+    num_deliverables INTEGER NOT NULL,
+    coverage,
+    data TEXT NOT NULL,
+    UNIQUE (source_id, byte_offset)
+);
+
+CREATE TABLE IF NOT EXISTS deliverables (
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    path TEXT,
+    type TEXT,
+    description TEXT
+);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT,
+    numeric_value REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_entries_agent ON entries (source_id, agent);
+CREATE INDEX IF NOT EXISTS idx_entries_status ON entries (source_id, status);
+CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries (source_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_date ON entries (source_id, entry_date);
+CREATE INDEX IF NOT EXISTS idx_entries_task_id ON entries (task_id);
+CREATE INDEX IF NOT EXISTS idx_deliverables_entry ON deliverables (entry_id);
+CREATE INDEX IF NOT EXISTS idx_metrics_entry ON metrics (entry_id);
+CREATE INDEX IF NOT EXISTS idx_metrics_name ON metrics (name);
+"""
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _text(value) -> Optional[str]:
+    return value if isinstance(value, str) else None
+
+
+class ProgressStore:
+    """Indexed SQLite storage for progress entries, one source per progress file"""
+
+    def __init__(self, db_file: str):
+        self.db_file = Path(db_file)
+        self.conn = sqlite3.connect(str(self.db_file))
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise ValueError(f"{self.db_file} has schema version {version}, expected {SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def transaction(self):
+        """Commit on success, roll back on error"""
+        with self.conn:
+            yield
+
+    # Ingestion
+
+    def source_id(self, path: str) -> int:
+        """Id of a progress file's source row, creating it if needed"""
+        path = str(Path(path).resolve())
+        row = self.conn.execute('SELECT id FROM sources WHERE path = ?', (path,)).fetchone()
+        if row:
+            return row[0]
+        return self.conn.execute('INSERT INTO sources (path) VALUES (?)', (path,)).lastrowid
+
+    def get_scan_state(self, source_id: int) -> Optional[Dict]:
+        """Scan position saved by the last ingestion"""
+        row = self.conn.execute('SELECT scan_state FROM sources WHERE id = ?', (source_id,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def save_scan_state(self, source_id: int, state: Dict):
+        self.conn.execute('UPDATE sources SET scan_state = ? WHERE id = ?', (json.dumps(state), source_id))
+
+    def clear_source(self, source_id: int):
+        """Remove every entry of a source (the file was truncated or replaced)"""
+        self.conn.execute('DELETE FROM entries WHERE source_id = ?', (source_id,))
+
+    def clear_pending(self, source_id: int):
+        """Remove entries that may still have been growing when last ingested"""
+        self.conn.execute('DELETE FROM entries WHERE source_id = ? AND final = 0', (source_id,))
+
+    def add_entry(self, source_id: int, byte_offset: int, entry: Dict, final: bool = True):
+        """Insert (or replace) the entry that starts at byte_offset"""
+        timestamp = entry.get('timestamp', '')
+        timestamp = timestamp if isinstance(timestamp, str) else str(timestamp)
+        duration = entry.get('duration_minutes', 0)
+        deliverables = entry.get('deliverables', [])
+        metrics = entry.get('metrics', {})
+
+        coverage = None
+        if isinstance(metrics, dict):
+            for key in COVERAGE_KEYS:
+                if key in metrics:
+                    coverage = metrics[key]
+                    break
+
+        self.conn.execute('DELETE FROM entries WHERE source_id = ? AND byte_offset = ?', (source_id, byte_offset))
+        entry_id = self.conn.execute(
+            '''INSERT INTO entries (source_id, byte_offset, final, timestamp, entry_date, agent, status,
+                                    task_id, task_title, duration_minutes, num_deliverables, coverage, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+            (
+                source_id, byte_offset, int(final), timestamp,
+                timestamp.split()[0] if timestamp.strip() else None,
+                _text(entry.get('agent')), _text(entry.get('status')),
+                _text(entry.get('task_id')), _text(entry.get('task_title')),
+                duration if _is_number(duration) else None,
+                len(deliverables),
+                coverage if _is_number(coverage) else None,
+                json.dumps(entry, default=str)
+            )
+        ).lastrowid
+
+        if isinstance(deliverables, list):
+            self.conn.executemany(
+                'INSERT INTO deliverables (entry_id, position, path, type, description) VALUES (?, ?, ?, ?, ?)',
+                [
+                    (entry_id, position, item.get('path'), item.get('type'), item.get('description'))
+                    for position, item in enumerate(deliverables) if isinstance(item, dict)
+                ]
+            )
+
+        if isinstance(metrics, dict):
+            self.conn.executemany(
+                'INSERT INTO metrics (entry_id, name, value, numeric_value) VALUES (?, ?, ?, ?)',
+                [
+                    (entry_id, str(name), str(value), value if _is_number(value) else None)
+                    for name, value in metrics.items()
+                ]
+            )
+
+    # Queries
+
+    def _where(self, source_id: int, agent: Optional[str] = None, status: Optional[str] = None,
+               start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[str, List]:
+        clauses = ['source_id = ?']
+        params: List = [source_id]
+        if agent is not None:
+            clauses.append('agent = ?')
+            params.append(agent)
+        if status is not None:
+            clauses.append('status = ?')
+            params.append(status)
+        if start_date is not None and end_date is not None:
+            clauses.append('entry_date BETWEEN ? AND ?')
+            params.extend([start_date, end_date])
+        return ' AND '.join(clauses), params
+
+    def count(self, source_id: int, **filters) -> int:
+        """Number of entries matching the filters"""
+        where, params = self._where(source_id, **filters)
+        return self.conn.execute(f'SELECT COUNT(*) FROM entries WHERE {where}', params).fetchone()[0]
+
+    def query_entries(self, source_id: int, **filters) -> Iterator[Dict]:
+        """
+        Stream matching entries in file order
+
+        Args:
+            source_id: Source to query
+            **filters: agent, status, start_date/end_date (same as filter_entries)
+        """
+        where, params = self._where(source_id, **filters)
+        cursor = self.conn.execute(f'SELECT data FROM entries WHERE {where} ORDER BY byte_offset', params)
+        for (data,) in cursor:
+            yield json.loads(data)
+
+    def metrics_summary(self, source_id: int, **filters) -> Dict:
+        """Summary in the get_metrics_summary() format, computed in SQL"""
+        where, params = self._where(source_id, **filters)
+
+        total, duration, deliverables, coverage_avg = self.conn.execute(
+            f'''SELECT COUNT(*), COALESCE(SUM(duration_minutes), 0), COALESCE(SUM(num_deliverables), 0),
+                       AVG(coverage)
+                FROM entries WHERE {where}''',
+            params
+        ).fetchone()
+
+        by_status = dict(self.conn.execute(
+            f"SELECT COALESCE(status, 'unknown'), COUNT(*) FROM entries WHERE {where} GROUP BY 1 ORDER BY MIN(byte_offset)",
+            params
+        ).fetchall())
+        by_agent = dict(self.conn.execute(
+            f"SELECT COALESCE(agent, 'unknown'), COUNT(*) FROM entries WHERE {where} GROUP BY 1 ORDER BY MIN(byte_offset)",
+            params
+        ).fetchall())
+
+        return {
+            'total_entries': total,
+            'by_status': by_status,
+            'by_agent': by_agent,
+            'total_duration_minutes': duration,
+            'total_deliverables': deliverables,
+            'avg_test_coverage': round(coverage_avg, 1) if coverage_avg is not None else 0
+        }
+
+    def recent_entries(self, source_id: int, limit: int = 5, **filters) -> List[Dict]:
+        """Newest entries by timestamp (file order breaks ties)"""
+        where, params = self._where(source_id, **filters)
+        rows = self.conn.execute(
+            f'SELECT data FROM entries WHERE {where} ORDER BY timestamp DESC, byte_offset LIMIT ?',
+            params + [limit]
+        ).fetchall()
+        return [json.loads(data) for (data,) in rows]
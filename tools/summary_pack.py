@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Single-file pack of agent summaries
+Bundles the directory tier and every *.summary.yaml into one compact JSON
+file so the lazy loader can start with a single read instead of parsing
+one YAML file per agent
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from yaml_utils import safe_load
+
+
+PACK_FILENAME = "summaries.pack.json"
+PACK_VERSION = 1
+SUMMARY_SUFFIX = ".summary.yaml"
+
+
+def _source_stats(summaries_dir: Path) -> Dict[str, list]:
+    """{filename: [mtime_ns, size]} for every summary file, in directory order"""
+    stats = {}
+    with os.scandir(summaries_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(SUMMARY_SUFFIX) and entry.is_file():
+                stat = entry.stat()
+                stats[entry.name] = [stat.st_mtime_ns, stat.st_size]
+    return stats
+
+
+def build_pack(summaries_dir: Path) -> Dict:
+    """
+    Build the pack from the summary files currently in summaries_dir
+
+    Returns:
+        Pack dict with the source fingerprints, directory tier and summaries
+    """
+    summaries_dir = Path(summaries_dir)
+    sources = _source_stats(summaries_dir)
+    directory = {}
+    summaries = {}
+
+    for filename in sources:
+        with open(summaries_dir / filename, 'r') as f:
+            summary = safe_load(f)
+
+        name = summary.get('name') if isinstance(summary, dict) else None
+        if not name:
+            continue
+
+        directory[name] = {
+            'category': summary.get('category', 'unknown'),
+            'description': summary.get('description', '')[:100],  # First 100 chars
+            'summary_file': filename
+        }
+        summaries[name] = summary
+
+    return {
+        'version': PACK_VERSION,
+        'sources': sources,
+        'directory': directory,
+        'summaries': summaries
+    }
+
+
+def write_pack(summaries_dir: Path, pack_file: Optional[Path] = None) -> Path:
+    """Build and atomically write the pack; returns its path"""
+    summaries_dir = Path(summaries_dir)
+    pack_file = Path(pack_file) if pack_file else summaries_dir / PACK_FILENAME
+    pack = build_pack(summaries_dir)
+
+    tmp_file = pack_file.with_name(f"{pack_file.name}.{os.getpid()}.tmp")
+    with open(tmp_file, 'w') as f:
+        json.dump(pack, f, separators=(',', ':'), ensure_ascii=False, default=str)
+    os.replace(tmp_file, pack_file)
+
+    return pack_file
+
+
+def read_pack(summaries_dir: Path, pack_file: Optional[Path] = None) -> Optional[Dict]:
+    """
+    Read the pack if it exists and still matches the summary files
+
+    Returns:
+        Pack dict, or None when the pack is missing, unreadable, from another
+        version, or stale (summary files added, removed or modified since)
+    """
+    summaries_dir = Path(summaries_dir)
+    pack_file = Path(pack_file) if pack_file else summaries_dir / PACK_FILENAME
+
+    try:
+        with open(pack_file, 'r') as f:
+            pack = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(pack, dict) or pack.get('version') != PACK_VERSION:
+        return None
+
+    try:
+        if _source_stats(summaries_dir) != pack.get('sources'):
+            return None
+    except OSError:
+        return None
+
+    return pack
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Shared YAML loading and dumping for the agent tools
+Uses PyYAML's libyaml-backed CSafeLoader/CSafeDumper when PyYAML was built
+with libyaml and falls back to the pure-Python SafeLoader/SafeDumper
+otherwise; documents loaded from text can be cached by content hash
+"""
+
+import pickle
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML = False
+
+YAMLError = yaml.YAMLError
+
+# Most recently used parsed documents kept by load_cached()
+CACHE_SIZE = 4096
+
+_cache: 'OrderedDict[bytes, bytes]' = OrderedDict()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def safe_load(stream) -> Any:
+    """yaml.safe_load() using the fastest available safe loader"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream=None, **kwargs) -> Optional[str]:
+    """yaml.safe_dump() using the fastest available safe dumper (same keyword arguments)"""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def load_cached(text: str) -> Any:
+    """
+    safe_load() a YAML document, reusing the result for identical text
+
+    Parsed documents are stored pickled and keyed by a hash of the text, so
+    every call returns a fresh object that the caller may modify. Parse
+    errors are raised every time and never cached.
+
+    Args:
+        text: YAML document
+
+    Returns:
+        Parsed document
+    """
+    key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    packed = _cache.get(key)
+    if packed is not None:
+        _cache.move_to_end(key)
+        _stats['hits'] += 1
+        return pickle.loads(packed)
+
+    _stats['misses'] += 1
+    document = safe_load(text)
+    _cache[key] = pickle.dumps(document, pickle.HIGHEST_PROTOCOL)
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return document
+
+
+def cache_info() -> Dict[str, int]:
+    """Hit/miss counts and current size of the load_cached() cache"""
+    return {**_stats, 'size': len(_cache)}
+
+
+def clear_cache():
+    """Empty the load_cached() cache and reset its counters"""
+    _cache.clear()
+    _stats['hits'] = _stats['misses'] = 0